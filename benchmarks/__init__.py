@@ -0,0 +1,6 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Benchmarks package."""
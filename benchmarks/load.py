@@ -0,0 +1,260 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Drive the hot endpoints and report throughput and latency percentiles.
+
+Seed the database first with benchmarks.seed. The client target runs the
+app in-process through the Flask test client; the gunicorn target starts
+gunicorn with gunicorn.conf.py on a local port and drives it over HTTP.
+
+Usage:
+    uv run python -m benchmarks.load --database bench.db
+    uv run python -m benchmarks.load --database bench.db --target gunicorn --processes 8 --duration 20
+"""
+
+import argparse
+import http.cookiejar
+import json
+import os
+import random
+import re
+import sqlite3
+import subprocess
+import sys
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from benchmarks.seed import SEED_PASSWORD, zipf_weights
+
+ENDPOINTS = ("survey_get", "survey_post", "dashboard", "results", "login")
+TARGETS = ("client", "gunicorn")
+# Flask-WTF's csrf_token, or the signed form_token on the public survey page.
+TOKEN_PATTERN = re.compile(r'name="(csrf_token|form_token)" value="([^"]+)"')
+ROOT = Path(__file__).resolve().parent.parent
+
+
+class ClientSession:
+    """Requests through an in-process Flask test client."""
+
+    def __init__(self, database: str) -> None:
+        os.environ["DATABASE_PATH"] = database
+        os.environ.setdefault("RATE_LIMIT_ENABLED", "false")
+        from src import create_app
+        self.client = create_app().test_client()
+
+    def request(self, method: str, path: str, data: dict | None = None) -> tuple[int, str]:
+        response = self.client.open(path, method=method, data=data)
+        return response.status_code, response.get_data(as_text=True)
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class HttpSession:
+    """Requests over HTTP with a cookie jar and without following redirects."""
+
+    def __init__(self, base_url: str) -> None:
+        self.base_url = base_url
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()), _NoRedirect
+        )
+
+    def request(self, method: str, path: str, data: dict | None = None) -> tuple[int, str]:
+        body = urllib.parse.urlencode(data).encode() if data is not None else None
+        request = urllib.request.Request(self.base_url + path, data=body, method=method)
+        try:
+            with self.opener.open(request, timeout=30) as response:
+                return response.status, response.read().decode()
+        except urllib.error.HTTPError as exc:
+            return exc.code, exc.read().decode()
+
+
+def _form_token(session, path: str) -> dict[str, str]:
+    """The form's protection field as {name: value}."""
+    _, body = session.request("GET", path)
+    match = TOKEN_PATTERN.search(body)
+    return {match.group(1): match.group(2)} if match else {}
+
+
+def load_fixtures(database: str) -> dict:
+    """Read seeded survey ids, options and owners straight from SQLite."""
+    with sqlite3.connect(database) as connection:
+        surveys = connection.execute(
+            "SELECT s.survey_id, u.email FROM surveys s JOIN users u ON u.user_id = s.user_id "
+            "WHERE u.email LIKE 'bench-%' ORDER BY s.survey_id"
+        ).fetchall()
+        options: dict[int, list[int]] = {}
+        for survey_id, option_id in connection.execute(
+            "SELECT survey_id, option_id FROM survey_options ORDER BY survey_id, option_order"
+        ):
+            options.setdefault(survey_id, []).append(option_id)
+    if not surveys:
+        raise SystemExit(f"{database} has no seeded surveys; run benchmarks.seed first")
+    owned: dict[str, list[int]] = {}
+    for survey_id, email in surveys:
+        owned.setdefault(email, []).append(survey_id)
+    return {
+        "survey_ids": [survey_id for survey_id, _ in surveys],
+        "options": {survey_id: options.get(survey_id, []) for survey_id, _ in surveys},
+        "owned": owned,
+    }
+
+
+def run_worker(target: str, location: str, database: str, endpoint: str,
+               duration: float, worker: int, skew: float) -> dict:
+    """Hit one endpoint for duration seconds; returns latencies and errors."""
+    fixtures = load_fixtures(database)
+    rng = random.Random(worker)
+    session = ClientSession(database) if target == "client" else HttpSession(location)
+    survey_ids = fixtures["survey_ids"]
+    weights = zipf_weights(len(survey_ids), skew)
+    emails = sorted(fixtures["owned"])
+    email = emails[worker % len(emails)]
+    owned = fixtures["owned"][email]
+
+    if endpoint in ("dashboard", "results"):
+        token = _form_token(session, "/login")
+        session.request("POST", "/login", {"email": email, "password": SEED_PASSWORD, **token})
+    tokens: dict[int, dict[str, str]] = {}
+    token = _form_token(session, "/login") if endpoint == "login" else {}
+
+    def one_request() -> int:
+        if endpoint == "survey_get":
+            return session.request("GET", f"/s/{rng.choices(survey_ids, weights)[0]}")[0]
+        if endpoint == "survey_post":
+            survey_id = rng.choices(survey_ids, weights)[0]
+            option_id = rng.choice(fixtures["options"][survey_id])
+            if survey_id not in tokens:
+                # Signed tokens are per survey; fetch each one on first use.
+                tokens[survey_id] = _form_token(session, f"/s/{survey_id}")
+            return session.request("POST", f"/s/{survey_id}", {"option_id": option_id, **tokens[survey_id]})[0]
+        if endpoint == "dashboard":
+            return session.request("GET", "/dashboard")[0]
+        if endpoint == "results":
+            return session.request("GET", f"/survey/{rng.choice(owned)}/results")[0]
+        return session.request("POST", "/login", {"email": email, "password": SEED_PASSWORD, **token})[0]
+
+    expected = 302 if endpoint == "login" else 200
+    latencies: list[float] = []
+    errors = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            status = one_request()
+        except OSError:
+            status = 0
+        latencies.append(time.perf_counter() - started)
+        if status != expected:
+            errors += 1
+    return {"latencies": latencies, "errors": errors}
+
+
+def percentile(sorted_values: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not sorted_values:
+        return 0.0
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def summarize(endpoint: str, results: list[dict], duration: float) -> dict:
+    """Combine per-worker results into throughput and latency percentiles."""
+    latencies = sorted(latency for result in results for latency in result["latencies"])
+    return {
+        "endpoint": endpoint,
+        "requests": len(latencies),
+        "errors": sum(result["errors"] for result in results),
+        "requests_per_second": round(len(latencies) / duration, 2),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+    }
+
+
+def run_endpoint(target: str, location: str, database: str, endpoint: str,
+                 processes: int, duration: float, skew: float) -> dict:
+    """Drive one endpoint from several processes at once."""
+    args = [(target, location, database, endpoint, duration, worker, skew) for worker in range(processes)]
+    if processes == 1:
+        results = [run_worker(*args[0])]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            results = list(pool.map(run_worker, *zip(*args)))
+    return summarize(endpoint, results, duration)
+
+
+def start_gunicorn(database: str, port: int, timeout: float = 30.0) -> subprocess.Popen:
+    """Start gunicorn with the project config and wait until it answers."""
+    env = dict(os.environ, DATABASE_PATH=str(Path(database).absolute()))
+    env.setdefault("SECRET_KEY", "benchmark-secret-key")
+    # Every simulated voter shares one address; measure the app, not the limiter.
+    env.setdefault("RATE_LIMIT_ENABLED", "false")
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", "gunicorn.conf.py", "--bind", f"127.0.0.1:{port}", "run:app"],
+        cwd=ROOT, env=env
+    )
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if server.poll() is not None:
+            raise SystemExit("gunicorn exited during startup")
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/login", timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.terminate()
+    raise SystemExit("gunicorn did not start in time")
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=ROOT, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", required=True, help="SQLite file seeded by benchmarks.seed")
+    parser.add_argument("--target", choices=TARGETS, default="client")
+    parser.add_argument("--endpoint", action="append", choices=ENDPOINTS, help="endpoint to run (repeatable)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per endpoint")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent for picking surveys")
+    parser.add_argument("--port", type=int, default=8765, help="local port for the gunicorn target")
+    args = parser.parse_args()
+
+    database = str(Path(args.database).absolute())
+    location = f"http://127.0.0.1:{args.port}"
+    server = start_gunicorn(database, args.port) if args.target == "gunicorn" else None
+    try:
+        results = [
+            run_endpoint(args.target, location, database, endpoint, args.processes, args.duration, args.skew)
+            for endpoint in args.endpoint or ENDPOINTS
+        ]
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(30)
+
+    print(json.dumps({
+        "commit": _git_commit(),
+        "target": args.target,
+        "processes": args.processes,
+        "duration": args.duration,
+        "results": results,
+    }, indent=2))
+
+
+if __name__ == "__main__":
+    main()
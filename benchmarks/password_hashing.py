@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Measure login throughput (password verifications per second per core).
+
+Usage:
+    uv run python -m benchmarks.password_hashing
+    uv run python -m benchmarks.password_hashing --method scrypt:16384:8:1 --processes 4
+"""
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from werkzeug.security import check_password_hash, generate_password_hash
+
+DEFAULT_METHODS = (
+    "scrypt:32768:8:1",
+    "scrypt:16384:8:1",
+    "pbkdf2:sha256:1000000",
+    "pbkdf2:sha256:600000",
+    "pbkdf2:sha256:260000",
+)
+
+
+def _verify_for(pwhash: str, duration: float) -> int:
+    """Verify a hash repeatedly for duration seconds; returns the count."""
+    count = 0
+    deadline = time.perf_counter() + duration
+    while time.perf_counter() < deadline:
+        check_password_hash(pwhash, "benchmark-password")
+        count += 1
+    return count
+
+
+def measure(method: str, processes: int, duration: float) -> dict:
+    """Run verifications on every process and report per-core throughput."""
+    pwhash = generate_password_hash("benchmark-password", method)
+    with ProcessPoolExecutor(max_workers=processes) as pool:
+        counts = list(pool.map(_verify_for, [pwhash] * processes, [duration] * processes))
+    total = sum(counts)
+    return {
+        "method": method,
+        "processes": processes,
+        "verifications": total,
+        "logins_per_second": round(total / duration, 2),
+        "logins_per_second_per_core": round(total / duration / processes, 2),
+        "ms_per_login": round(1000 * duration * processes / total, 2) if total else None,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--method", action="append", help="werkzeug method string (repeatable)")
+    parser.add_argument("--processes", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--duration", type=float, default=3.0, help="seconds per method")
+    args = parser.parse_args()
+
+    results = [measure(method, args.processes, args.duration) for method in args.method or DEFAULT_METHODS]
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
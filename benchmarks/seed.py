@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Seed a database with users, surveys and skewed responses for load tests.
+
+Usage:
+    uv run python -m benchmarks.seed --database bench.db
+    uv run python -m benchmarks.seed --database bench.db --users 200 --surveys 2000 --responses 500000
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+from datetime import datetime, timedelta
+
+SEED_PASSWORD = "benchmark-password"
+CHUNK_SIZE = 5000
+
+
+def zipf_weights(count: int, skew: float) -> list[float]:
+    """Popularity weights where rank r gets 1 / r**skew."""
+    return [1 / (rank ** skew) for rank in range(1, count + 1)]
+
+
+def seed(database: str, users: int, surveys: int, responses: int, options: int = 4,
+         skew: float = 1.1, days: int = 30, random_seed: int = 42) -> dict:
+    """Populate database and return a summary of what was written.
+
+    Surveys are spread evenly across users; responses follow a Zipf
+    distribution over surveys and options and are spread over the last
+    ``days`` days, so a few surveys are hot and most are cold.
+    """
+    os.environ["DATABASE_PATH"] = database
+    from src import create_app
+    from src.extensions import db
+    from src.ingest import insert_votes
+    from src.models import Survey, SurveyOption, User
+
+    rng = random.Random(random_seed)
+    app = create_app()
+    started = time.perf_counter()
+    with app.app_context():
+        # Every user shares one hash made with the configured method, so
+        # logins cost what they cost in production without seeding N hashes.
+        password_hash = app.extensions["password_hasher"].hash(SEED_PASSWORD)
+        db.session.execute(User.__table__.insert(), [
+            {"email": f"bench-{i}@example.com", "password_hash": password_hash} for i in range(users)
+        ])
+        user_ids = [row.id for row in User.query.filter(User.email.like("bench-%")).order_by(User.id)]
+
+        now = datetime.utcnow()
+        created = [now - timedelta(seconds=rng.randrange(days * 86400)) for _ in range(surveys)]
+        db.session.execute(Survey.__table__.insert(), [
+            {
+                "user_id": user_ids[i % len(user_ids)],
+                "title": f"Benchmark survey {i}",
+                "description": "How did we do today? " * rng.randint(1, 12),
+                "is_active": True,
+                "created_at": created[i],
+                "updated_at": created[i],
+            }
+            for i in range(surveys)
+        ])
+        survey_ids = [row.id for row in Survey.query.filter(Survey.title.like("Benchmark survey %")).order_by(Survey.id)]
+        db.session.execute(SurveyOption.__table__.insert(), [
+            {"survey_id": survey_id, "option_text": f"Option {n}", "option_order": n}
+            for survey_id in survey_ids for n in range(1, options + 1)
+        ])
+        option_ids: dict[int, list[int]] = {}
+        for survey_id, option_id in db.session.query(SurveyOption.survey_id, SurveyOption.id).filter(
+            SurveyOption.survey_id.in_(survey_ids)
+        ).order_by(SurveyOption.survey_id, SurveyOption.option_order):
+            option_ids.setdefault(survey_id, []).append(option_id)
+        db.session.commit()
+
+        survey_weights = zipf_weights(len(survey_ids), skew)
+        option_weights = zipf_weights(options, skew)
+        written = 0
+        while written < responses:
+            size = min(CHUNK_SIZE, responses - written)
+            chosen = rng.choices(survey_ids, survey_weights, k=size)
+            insert_votes([
+                {
+                    "survey_id": survey_id,
+                    "option_id": rng.choices(option_ids[survey_id], option_weights)[0],
+                    "respondent_email": f"r{rng.randrange(responses)}@example.com" if rng.random() < 0.3 else None,
+                    "response_date": now - timedelta(seconds=rng.randrange(days * 86400)),
+                }
+                for survey_id in chosen
+            ])
+            db.session.commit()
+            written += size
+        db.session.remove()
+
+    return {
+        "database": database,
+        "users": users,
+        "surveys": surveys,
+        "responses": responses,
+        "options_per_survey": options,
+        "skew": skew,
+        "seconds": round(time.perf_counter() - started, 2),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database", required=True, help="SQLite file to create or extend")
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--surveys", type=int, default=500)
+    parser.add_argument("--responses", type=int, default=100000)
+    parser.add_argument("--options", type=int, default=4, help="options per survey")
+    parser.add_argument("--skew", type=float, default=1.1, help="Zipf exponent for survey and option popularity")
+    parser.add_argument("--days", type=int, default=30, help="spread response dates over this many days")
+    parser.add_argument("--random-seed", type=int, default=42)
+    args = parser.parse_args()
+
+    summary = seed(args.database, args.users, args.surveys, args.responses, args.options,
+                   args.skew, args.days, args.random_seed)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
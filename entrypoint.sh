@@ -6,11 +6,15 @@
 
 set -e
 
-# Initialize database if it doesn't exist
-if [ ! -f "/app/survey.db" ]; then
-    echo "Initializing database..."
-    python -c "from src import create_app; from src.extensions import db; app = create_app(); app.app_context().push(); db.create_all()"
-fi
+# Create or migrate the database schema
+echo "Migrating database..."
+flask --app run migrate
+
+# Fill the shared template bytecode cache and precompress static files
+flask --app run compile-assets
+
+# Workers only verify the schema version from here on
+export SCHEMA_AUTO_MIGRATE=false
 
 # Start Gunicorn
 exec gunicorn -c gunicorn.conf.py run:app
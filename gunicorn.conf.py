@@ -5,10 +5,47 @@
 
 """Gunicorn configuration."""
 
+import os
+
 bind = "0.0.0.0:8000"
 workers = 2
-worker_class = "sync"
+# Threaded workers keep serving while some requests wait on SQLite or on
+# password hashing. The app sizes its database pool and password hashing
+# limit from the same variable; VOTE_INGEST_MODE=flush only batches votes
+# across these threads, and hashing is only shed with more than one.
+worker_class = "gthread"
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
 timeout = 30
 keepalive = 2
 max_requests = 1000
 max_requests_jitter = 100
+# Import the app and compile templates once in the master; workers (including
+# those recycled by max_requests) fork from it instead of starting cold.
+preload_app = os.getenv("GUNICORN_PRELOAD", "true").lower() in ("1", "true", "yes", "on")
+
+
+def when_ready(server):
+    """Warm the preloaded app so forked workers inherit compiled templates."""
+    app = getattr(server.app, "callable", None)
+    if app is not None:
+        from src.startup import warm_templates
+        server.log.info("Compiled %d templates before forking workers", warm_templates(app))
+
+
+def on_starting(server):
+    """Start metrics from zero; workers of the previous run left files behind."""
+    if os.getenv("METRICS_ENABLED", "").lower() in ("1", "true", "yes", "on"):
+        from flask import Flask
+        from src.config import load_config
+        from src.metrics import clear_directory
+        app = Flask(__name__)
+        load_config(app)
+        clear_directory(app.config["METRICS_DIR"])
+
+
+def worker_exit(server, worker):
+    """Drain write-behind buffers and save metrics before a worker is recycled or stopped."""
+    from src.metrics import flush_all
+    from src.write_behind import close_all
+    close_all()
+    flush_all()
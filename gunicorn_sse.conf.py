@@ -0,0 +1,26 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Gunicorn configuration for the live results (Server-Sent Events) process.
+
+Sync workers would be tied up for the whole life of a stream, so live
+results run in a separate threaded process next to the main server:
+
+    LIVE_RESULTS_MODE=sse gunicorn -c gunicorn_sse.conf.py run:app
+
+Set LIVE_RESULTS_MODE=sse for the main server too, and route
+/survey/<id>/results/stream to this port at the reverse proxy. Without
+this process leave the default "poll" mode, which needs no streams.
+A single worker lets every viewer share one tally poll per tick.
+"""
+
+import os
+
+bind = os.getenv("SSE_BIND", "0.0.0.0:8001")
+workers = 1
+worker_class = "gthread"
+threads = int(os.getenv("SSE_THREADS", "200"))
+timeout = 30
+keepalive = 75
@@ -5,8 +5,15 @@
 
 """Application entry point."""
 
+import logging
+import os
 from src import create_app
 
+logging.basicConfig(
+    level=os.getenv("LOG_LEVEL", "INFO"),
+    format="%(asctime)s %(levelname)s %(name)s: %(message)s"
+)
+
 app = create_app()
 
 if __name__ == "__main__":
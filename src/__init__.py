@@ -5,52 +5,97 @@
 
 """Flask application factory."""
 
-import os
-from pathlib import Path
+import time
+
+_import_started = time.perf_counter()
+
+from typing import Any
 from flask import Flask, redirect, url_for
 from flask_login import current_user
 from dotenv import load_dotenv
+from werkzeug.middleware.proxy_fix import ProxyFix
+from src import database
+from src.config import load_config
 from src.extensions import db, login_manager, csrf
 
 load_dotenv()
 
+_import_seconds = time.perf_counter() - _import_started
 
-def create_app() -> Flask:
+
+def create_app(config: dict[str, Any] | None = None) -> Flask:
     """Create and configure Flask application."""
+    from src import startup
+    timer = startup.StartupTimer()
     app = Flask(
         __name__,
         template_folder="templates",
         static_folder="static"
     )
     
-    app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "dev-secret-key")
-    db_path = Path(os.getenv("DATABASE_PATH", "survey.db"))
-    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path.absolute()}"
-    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    load_config(app)
+    if config:
+        app.config.update(config)
+    timer.mark("config")
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", database.engine_options(app.config))
     
     db.init_app(app)
     csrf.init_app(app)
     login_manager.init_app(app)
     login_manager.login_view = "auth.login"
     
-    @login_manager.user_loader
-    def load_user(user_id: str):
-        from src.models import User
-        return User.query.get(int(user_id))
-    
-    from src.routes import auth_bp, surveys_bp, pages_bp
+    from src.routes import api_bp, auth_bp, surveys_bp, pages_bp
     
+    app.register_blueprint(api_bp)
     app.register_blueprint(auth_bp)
     app.register_blueprint(surveys_bp)
     app.register_blueprint(pages_bp)
     
+    from src import (
+        assets, commands, health, ingest, last_login, live_results, metrics, passwords, profiler, public_forms,
+        rate_limit, respondents, survey_cache, user_cache
+    )
+    assets.init_app(app)
+    health.init_app(app)
+    rate_limit.init_app(app)
+    # Outermost, so the rate limiter and request.remote_addr see the client
+    # address the trusted proxies forwarded rather than the last proxy's.
+    if app.config["PROXY_FIX_X_FOR"] or app.config["PROXY_FIX_X_PROTO"]:
+        app.wsgi_app = ProxyFix(
+            app.wsgi_app, x_for=app.config["PROXY_FIX_X_FOR"], x_proto=app.config["PROXY_FIX_X_PROTO"]
+        )
+    metrics.init_app(app)
+    profiler.init_app(app)
+    user_cache.init_app(app)
+    login_manager.user_loader(user_cache.load_user)
+    passwords.init_app(app)
+    last_login.init_app(app)
+    ingest.init_app(app)
+    survey_cache.init_app(app)
+    public_forms.init_app(app)
+    respondents.init_app(app)
+    live_results.init_app(app)
+    commands.init_app(app)
+    
     @app.route("/")
     def index():
         if current_user.is_authenticated:
             return redirect(url_for("surveys.dashboard"))
         return redirect(url_for("auth.login"))
     
+    timer.mark("extensions")
+    
     with app.app_context():
-        db.create_all()
+        from src import migrations
+        database.apply_profile(db.engine, app.config)
+        database.dispose_after_fork(db.engine)
+        # 'flask migrate' upgrades and reports the schema itself; checking
+        # here would refuse to load it, or leave it nothing to apply.
+        if commands.invoked_command() != "migrate":
+            migrations.ensure_schema(app.config["SCHEMA_AUTO_MIGRATE"])
+            timer.mark("schema")
+            respondents.load_index(app)
+        database.profile_report(db.engine)
     
+    startup.init_app(app, timer, _import_seconds)
     return app
@@ -0,0 +1,165 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Template bytecode cache, fingerprinted static URLs and precompressed assets."""
+
+import gzip
+import hashlib
+import logging
+import mimetypes
+import os
+import re
+import stat
+import threading
+from pathlib import Path
+from flask import Flask, Response, current_app, request, send_file, send_from_directory
+from jinja2 import FileSystemBytecodeCache
+from werkzeug.security import safe_join
+
+try:
+    import brotli
+except ImportError:  # Optional: without it only gzip variants are built.
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+COMPRESSIBLE = {".css", ".js", ".svg", ".html", ".json", ".txt", ".map"}
+# style.3f2a9c1d.css -> ("style", "3f2a9c1d", ".css")
+_FINGERPRINTED = re.compile(r"^(?P<stem>.+)\.(?P<digest>[0-9a-f]{8})(?P<suffix>\.[^./]+)$")
+
+
+class StaticAssets:
+    """Content hashes for static files, computed once per process."""
+
+    def __init__(self, folder: str | Path, check_mtime: bool = False) -> None:
+        self.folder = Path(folder)
+        self.check_mtime = check_mtime
+        self._digests: dict[str, tuple[float, str]] = {}
+        self._lock = threading.Lock()
+
+    def digest(self, filename: str) -> str | None:
+        """First 8 hex digits of the file's SHA-256, or None if it is not a file in the folder."""
+        cached = self._digests.get(filename)
+        if cached is not None and not self.check_mtime:
+            return cached[1]
+        # Names come from request paths; nothing outside the folder is read or cached.
+        joined = safe_join(str(self.folder), filename)
+        if joined is None:
+            return None
+        path = Path(joined)
+        try:
+            status = path.stat()
+        except OSError:
+            return None
+        if not stat.S_ISREG(status.st_mode):
+            return None
+        mtime = status.st_mtime
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        value = hashlib.sha256(path.read_bytes()).hexdigest()[:8]
+        with self._lock:
+            self._digests[filename] = (mtime, value)
+        return value
+
+    def fingerprinted(self, filename: str) -> str:
+        """The content-hashed name for filename, e.g. style.css -> style.3f2a9c1d.css."""
+        value = self.digest(filename)
+        if value is None:
+            return filename
+        stem, suffix = os.path.splitext(filename)
+        return f"{stem}.{value}{suffix}"
+
+    def resolve(self, requested: str) -> str | None:
+        """Map a fingerprinted name back to its file if the hash is current."""
+        match = _FINGERPRINTED.match(requested)
+        if match is None:
+            return None
+        filename = match["stem"] + match["suffix"]
+        return filename if self.digest(filename) == match["digest"] else None
+
+
+def _encoded_variant(path: Path) -> tuple[Path, str] | None:
+    """The best precompressed file the client accepts, if one is up to date."""
+    source_mtime = path.stat().st_mtime
+    for encoding, extension in (("br", ".br"), ("gzip", ".gz")):
+        candidate = path.with_name(path.name + extension)
+        if encoding in request.accept_encodings and candidate.is_file() \
+                and candidate.stat().st_mtime >= source_mtime:
+            return candidate, encoding
+    return None
+
+
+def serve_static(filename: str) -> Response:
+    """Static route: fingerprinted names are immutable and served precompressed."""
+    assets: StaticAssets = current_app.extensions["static_assets"]
+    original = assets.resolve(filename)
+    if original is None:
+        return send_from_directory(current_app.static_folder, filename)
+
+    path = assets.folder / original
+    variant = _encoded_variant(path)
+    if variant is None:
+        response = send_from_directory(current_app.static_folder, original)
+    else:
+        encoded, encoding = variant
+        response = send_file(encoded, mimetype=mimetypes.guess_type(original)[0], conditional=True)
+        response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    response.cache_control.public = True
+    response.cache_control.max_age = current_app.config["STATIC_MAX_AGE"]
+    response.cache_control.immutable = True
+    return response
+
+
+def private_directory(path: str) -> bool:
+    """Create path as a 0700 directory; True if only this user can write to it.
+
+    Jinja unmarshals cached bytecode, so a cache directory that another
+    user created or can write to would let them run code in the app.
+    """
+    os.makedirs(path, mode=0o700, exist_ok=True)
+    info = os.lstat(path)
+    return (
+        stat.S_ISDIR(info.st_mode)
+        and info.st_uid == os.getuid()
+        and stat.S_IMODE(info.st_mode) == stat.S_IRWXU
+    )
+
+
+def init_app(app: Flask) -> None:
+    """Install the bytecode cache and fingerprinted static URLs."""
+    cache_dir = app.config["TEMPLATE_CACHE_DIR"]
+    if cache_dir:
+        if private_directory(cache_dir):
+            app.jinja_env.bytecode_cache = FileSystemBytecodeCache(cache_dir)
+        else:
+            logger.warning("Template bytecode cache disabled: %s must be a 0700 directory owned by this user",
+                           cache_dir)
+
+    assets = StaticAssets(app.static_folder, check_mtime=app.debug)
+    app.extensions["static_assets"] = assets
+    app.view_functions["static"] = serve_static
+
+    @app.url_defaults
+    def fingerprint_static_urls(endpoint: str, values: dict) -> None:
+        if endpoint == "static" and "filename" in values:
+            values["filename"] = assets.fingerprinted(values["filename"])
+
+
+def compile_assets(app: Flask) -> dict[str, int]:
+    """Precompile templates into the bytecode cache and precompress static files."""
+    from src.startup import warm_templates
+    templates = warm_templates(app)
+    compressed = 0
+    for path in sorted(Path(app.static_folder).rglob("*")):
+        if not path.is_file() or path.suffix not in COMPRESSIBLE:
+            continue
+        data = path.read_bytes()
+        path.with_name(path.name + ".gz").write_bytes(gzip.compress(data, compresslevel=9, mtime=0))
+        compressed += 1
+        if brotli is not None:
+            path.with_name(path.name + ".br").write_bytes(brotli.compress(data, quality=11))
+            compressed += 1
+    return {"templates": templates, "compressed": compressed}
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Bounded in-process caches invalidated across workers by generation counters."""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+from sqlalchemy import Connection, select
+from sqlalchemy.dialects.sqlite import insert
+from src.extensions import db
+from src.models import CacheGeneration
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries expire after ttl seconds."""
+
+    def __init__(self, maxsize: int, ttl: float, clock: Callable[[], float] = time.monotonic) -> None:
+        self.maxsize = max(1, maxsize)
+        self.ttl = ttl
+        self.clock = clock
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry, refreshing its LRU position."""
+        with self._lock:
+            entry = self._data.get(key, _MISSING)
+            if entry is _MISSING:
+                return default
+            expires_at, value = entry
+            if expires_at <= self.clock():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store an entry, evicting the least recently used beyond maxsize."""
+        with self._lock:
+            self._data[key] = (self.clock() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: Hashable) -> None:
+        """Drop one entry if present."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._data.clear()
+
+
+class GenerationalCache(TTLCache):
+    """TTLCache that clears itself when a named generation counter moves.
+
+    The counter is read at most once per check_interval seconds, which bounds
+    how long another worker's change can stay invisible here.
+    """
+
+    def __init__(self, name: str, maxsize: int, ttl: float, check_interval: float,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        super().__init__(maxsize, ttl, clock)
+        self.name = name
+        self.check_interval = check_interval
+        self._generation: int | None = None
+        self._checked_at = float("-inf")
+
+    def sync(self) -> None:
+        """Clear the cache if the generation changed since the last check."""
+        now = self.clock()
+        if now - self._checked_at < self.check_interval:
+            return
+        generation = current_generation(self.name)
+        self._checked_at = now
+        if generation != self._generation:
+            self.clear()
+            self._generation = generation
+
+
+def current_generation(name: str) -> int:
+    """Read a generation counter; missing counters read as zero."""
+    value = db.session.execute(
+        select(CacheGeneration.generation).where(CacheGeneration.name == name)
+    ).scalar()
+    return value or 0
+
+
+def bump_generation(name: str, connection: Connection | None = None) -> None:
+    """Increment a generation counter in the current transaction.
+
+    Pass connection when calling from inside a flush (mapper events).
+    """
+    statement = insert(CacheGeneration).values(name=name, generation=1).on_conflict_do_update(
+        index_elements=[CacheGeneration.name],
+        set_={"generation": CacheGeneration.generation + 1}
+    )
+    (connection or db.session).execute(statement)
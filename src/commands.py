@@ -0,0 +1,130 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Flask CLI maintenance commands."""
+
+import sys
+import click
+from flask import Flask
+
+# Options of the flask command itself that take a value.
+_FLASK_VALUE_OPTIONS = ("-A", "--app", "-e", "--env-file")
+
+
+def invoked_command() -> str | None:
+    """Name of the flask CLI command the app is being loaded for, if any.
+
+    Flask loads the app before it parses the command's arguments, so the
+    name is read from the command line.
+    """
+    if click.get_current_context(silent=True) is None:
+        return None
+    args = iter(sys.argv[1:])
+    for arg in args:
+        if arg in _FLASK_VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+@click.command("migrate")
+@click.option("--status", is_flag=True, help="Show the schema version without migrating.")
+def migrate_command(status: bool) -> None:
+    """Create missing tables and apply pending schema migrations."""
+    from src import migrations
+    from src.extensions import db
+    if not status:
+        applied = migrations.ensure_schema(auto_migrate=True)
+        click.echo(f"Applied migrations: {', '.join(map(str, applied)) or 'none'}")
+    with db.engine.connect() as connection:
+        version = migrations.schema_version(connection)
+    click.echo(f"Schema version {version} (head {migrations.HEAD})")
+
+
+@click.command("reconcile-tallies")
+@click.option("--survey-id", type=int, default=None, help="Only rebuild this survey.")
+def reconcile_tallies_command(survey_id: int | None) -> None:
+    """Rebuild per-option vote tallies from survey_responses."""
+    from src.tallies import reconcile_tallies
+    rows = reconcile_tallies(survey_id)
+    click.echo(f"Rebuilt {rows} tally rows")
+
+
+@click.command("backfill-rollups")
+@click.option("--survey-id", type=int, default=None, help="Only rebuild this survey.")
+def backfill_rollups_command(survey_id: int | None) -> None:
+    """Rebuild hourly and daily response rollups from survey_responses."""
+    from src.trends import rebuild_rollups
+    rows = rebuild_rollups(survey_id)
+    click.echo(f"Rebuilt {rows} rollup rows")
+
+
+@click.command("recount-respondents")
+@click.option("--survey-id", type=int, default=None, help="Only check this survey.")
+@click.option("--rebuild", is_flag=True, help="Recompute the sketches from survey_responses first.")
+def recount_respondents_command(survey_id: int | None, rebuild: bool) -> None:
+    """Compare estimated unique respondents with an exact COUNT(DISTINCT)."""
+    from sqlalchemy import select
+    from src.extensions import db
+    from src.models import Survey
+    from src.unique_respondents import exact_respondents, rebuild_sketches, unique_respondents
+    if rebuild:
+        click.echo(f"Rebuilt {rebuild_sketches(survey_id=survey_id)} sketches")
+    query = select(Survey.id).order_by(Survey.id)
+    if survey_id is not None:
+        query = query.where(Survey.id == survey_id)
+    for current in db.session.scalars(query):
+        estimate = unique_respondents(current).estimate
+        exact = exact_respondents(current)
+        error = (estimate - exact) / exact * 100 if exact else 0.0
+        click.echo(f"Survey {current}: estimate {estimate}, exact {exact}, error {error:+.2f}%")
+
+
+@click.command("delete-survey")
+@click.argument("survey_id", type=int)
+@click.option("--chunk-size", type=int, default=None, help="Responses deleted per transaction.")
+def delete_survey_command(survey_id: int, chunk_size: int | None) -> None:
+    """Delete a survey and its responses in bounded transactions."""
+    from src.deletion import delete_survey
+    removed = delete_survey(survey_id, chunk_size)
+    if removed is None:
+        raise click.ClickException(f"Survey {survey_id} not found")
+    click.echo(f"Deleted survey {survey_id} and {removed} responses")
+
+
+@click.command("delete-user")
+@click.argument("email")
+@click.option("--chunk-size", type=int, default=None, help="Responses deleted per transaction.")
+def delete_user_command(email: str, chunk_size: int | None) -> None:
+    """Delete an account, its surveys and their responses in bounded transactions."""
+    from src.deletion import delete_user
+    from src.extensions import db
+    from src.models import User
+    user_id = db.session.scalar(db.select(User.id).where(User.email == email))
+    summary = delete_user(user_id, chunk_size) if user_id is not None else None
+    if summary is None:
+        raise click.ClickException(f"User {email} not found")
+    click.echo(f"Deleted {email}, {summary.surveys} surveys and {summary.responses} responses")
+
+
+@click.command("compile-assets")
+def compile_assets_command() -> None:
+    """Precompile templates and write gzip/brotli copies of static files."""
+    from flask import current_app
+    from src.assets import compile_assets
+    summary = compile_assets(current_app)
+    click.echo(f"Compiled {summary['templates']} templates, wrote {summary['compressed']} compressed files")
+
+
+def init_app(app: Flask) -> None:
+    """Register CLI commands with the app."""
+    app.cli.add_command(migrate_command)
+    app.cli.add_command(reconcile_tallies_command)
+    app.cli.add_command(backfill_rollups_command)
+    app.cli.add_command(recount_respondents_command)
+    app.cli.add_command(delete_survey_command)
+    app.cli.add_command(delete_user_command)
+    app.cli.add_command(compile_assets_command)
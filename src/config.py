@@ -0,0 +1,188 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Application configuration loaded from environment variables."""
+
+import os
+import tempfile
+from pathlib import Path
+from flask import Flask
+
+
+def env_int(name: str, default: int) -> int:
+    """Read an integer environment variable."""
+    value = os.getenv(name)
+    return int(value) if value not in (None, "") else default
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float environment variable."""
+    value = os.getenv(name)
+    return float(value) if value not in (None, "") else default
+
+
+def env_bool(name: str, default: bool) -> bool:
+    """Read a boolean environment variable."""
+    value = os.getenv(name)
+    if value in (None, ""):
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def load_config(app: Flask) -> None:
+    """Populate app.config from environment variables."""
+    app.config["SECRET_KEY"] = os.getenv("SECRET_KEY", "dev-secret-key")
+    db_path = Path(os.getenv("DATABASE_PATH", "survey.db"))
+    app.config["SQLALCHEMY_DATABASE_URI"] = f"sqlite:///{db_path.absolute()}"
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    # When false the app only checks the stored schema version and refuses
+    # to start if it is behind; 'flask migrate' does the upgrade (and skips
+    # the check when it loads the app).
+    app.config["SCHEMA_AUTO_MIGRATE"] = env_bool("SCHEMA_AUTO_MIGRATE", True)
+
+    # SQLite engine profile, applied to every pooled connection.
+    app.config["SQLITE_JOURNAL_MODE"] = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    app.config["SQLITE_SYNCHRONOUS"] = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    app.config["SQLITE_BUSY_TIMEOUT_MS"] = env_int("SQLITE_BUSY_TIMEOUT_MS", 5000)
+    app.config["SQLITE_CACHE_SIZE"] = env_int("SQLITE_CACHE_SIZE", -20000)
+    app.config["SQLITE_MMAP_SIZE"] = env_int("SQLITE_MMAP_SIZE", 268435456)
+    app.config["SQLITE_TEMP_STORE"] = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+
+    # One pooled connection per request thread plus headroom for background
+    # flushers; each gunicorn worker process has its own pool.
+    threads = env_int("GUNICORN_THREADS", 4)
+    app.config["WORKER_THREADS"] = threads
+    app.config["DB_POOL_SIZE"] = env_int("DB_POOL_SIZE", threads + 2)
+    app.config["DB_MAX_OVERFLOW"] = env_int("DB_MAX_OVERFLOW", threads)
+    app.config["DB_POOL_TIMEOUT"] = env_float("DB_POOL_TIMEOUT", 10.0)
+    app.config["DB_POOL_RECYCLE"] = env_int("DB_POOL_RECYCLE", 3600)
+
+    # Vote ingestion: "direct" commits each vote inline, "flush" acknowledges
+    # once the vote's batch has committed, "enqueue" acknowledges on buffering.
+    # Batches only form across request threads of one worker, so "flush" needs
+    # GUNICORN_THREADS > 1; with sync workers every vote waits out the interval alone.
+    app.config["VOTE_INGEST_MODE"] = os.getenv("VOTE_INGEST_MODE", "direct").lower()
+    app.config["VOTE_BATCH_SIZE"] = env_int("VOTE_BATCH_SIZE", 200)
+    app.config["VOTE_FLUSH_INTERVAL_MS"] = env_int("VOTE_FLUSH_INTERVAL_MS", 50)
+    app.config["VOTE_BUFFER_MAX"] = env_int("VOTE_BUFFER_MAX", 10000)
+    app.config["VOTE_ACK_TIMEOUT_MS"] = env_int("VOTE_ACK_TIMEOUT_MS", 5000)
+
+    # Public survey definition cache (per worker, LRU with TTL).
+    app.config["SURVEY_CACHE_SIZE"] = env_int("SURVEY_CACHE_SIZE", 1024)
+    app.config["SURVEY_CACHE_TTL"] = env_float("SURVEY_CACHE_TTL", 300.0)
+    app.config["SURVEY_CACHE_CHECK_INTERVAL_MS"] = env_int("SURVEY_CACHE_CHECK_INTERVAL_MS", 1000)
+
+    # Rows fetched per round trip when streaming response exports.
+    app.config["EXPORT_BATCH_SIZE"] = env_int("EXPORT_BATCH_SIZE", 1000)
+
+    # Surveys per dashboard page.
+    app.config["DASHBOARD_PAGE_SIZE"] = env_int("DASHBOARD_PAGE_SIZE", 20)
+
+    # Live results: "poll" refreshes the results page with a short JSON request
+    # every LIVE_RESULTS_POLL_SECONDS (0 turns updates off); "sse" streams them
+    # and needs the threaded gunicorn_sse.conf.py process behind the reverse
+    # proxy, since a stream holds a sync worker until it is killed.
+    app.config["LIVE_RESULTS_MODE"] = os.getenv("LIVE_RESULTS_MODE", "poll").lower()
+    app.config["LIVE_RESULTS_POLL_SECONDS"] = env_int("LIVE_RESULTS_POLL_SECONDS", 10)
+    app.config["SSE_MAX_PUSHES_PER_SECOND"] = env_float("SSE_MAX_PUSHES_PER_SECOND", 2.0)
+    app.config["SSE_MAX_DURATION"] = env_float("SSE_MAX_DURATION", 300.0)
+    app.config["SSE_HEARTBEAT"] = env_float("SSE_HEARTBEAT", 15.0)
+
+    # Password hashing (werkzeug method string, e.g. "scrypt" or "pbkdf2:sha256:600000").
+    # Hashes made with other parameters are upgraded on the next successful login.
+    app.config["PASSWORD_HASH_METHOD"] = os.getenv("PASSWORD_HASH_METHOD", "scrypt")
+    app.config["PASSWORD_SALT_LENGTH"] = env_int("PASSWORD_SALT_LENGTH", 16)
+    app.config["PASSWORD_HASH_WORKERS"] = env_int("PASSWORD_HASH_WORKERS", 0)
+    # At most PASSWORD_HASH_MAX_PENDING of a worker's threads hash at once
+    # (half of them by default); further logins get 503 instead of waiting.
+    # With a single thread per worker nothing is ever shed.
+    app.config["PASSWORD_HASH_MAX_PENDING"] = env_int("PASSWORD_HASH_MAX_PENDING", max(1, threads // 2))
+    app.config["PASSWORD_HASH_TIMEOUT"] = env_float("PASSWORD_HASH_TIMEOUT", 10.0)
+
+    # Flask-Login user loader cache (per worker).
+    app.config["USER_CACHE_SIZE"] = env_int("USER_CACHE_SIZE", 4096)
+    app.config["USER_CACHE_TTL"] = env_float("USER_CACHE_TTL", 300.0)
+    app.config["USER_CACHE_CHECK_INTERVAL_MS"] = env_int("USER_CACHE_CHECK_INTERVAL_MS", 1000)
+
+    # last_login tracking: at most one write per user per precision window,
+    # batched across users by a write-behind buffer.
+    app.config["LAST_LOGIN_PRECISION_SECONDS"] = env_float("LAST_LOGIN_PRECISION_SECONDS", 300.0)
+    app.config["LAST_LOGIN_BATCH_SIZE"] = env_int("LAST_LOGIN_BATCH_SIZE", 500)
+    app.config["LAST_LOGIN_FLUSH_INTERVAL_MS"] = env_int("LAST_LOGIN_FLUSH_INTERVAL_MS", 1000)
+    app.config["LAST_LOGIN_BUFFER_MAX"] = env_int("LAST_LOGIN_BUFFER_MAX", 10000)
+
+    # Bulk vote API: records accepted per request and rows per insert statement.
+    app.config["VOTE_BATCH_MAX_RECORDS"] = env_int("VOTE_BATCH_MAX_RECORDS", 5000)
+    app.config["VOTE_BATCH_CHUNK_SIZE"] = env_int("VOTE_BATCH_CHUNK_SIZE", 500)
+
+    # Trends: days shown on the results page, and the most buckets one trend request may return.
+    app.config["RESULTS_TREND_DAYS"] = env_int("RESULTS_TREND_DAYS", 14)
+    app.config["TREND_MAX_BUCKETS"] = env_int("TREND_MAX_BUCKETS", 1000)
+
+    # Opt-in /metrics. Every worker writes its values to METRICS_DIR, which
+    # must be shared by all workers of one deployment and cleared on start.
+    app.config["METRICS_ENABLED"] = env_bool("METRICS_ENABLED", False)
+    app.config["METRICS_DIR"] = os.getenv("METRICS_DIR", os.path.join(tempfile.gettempdir(), "survey-metrics"))
+    app.config["METRICS_FLUSH_INTERVAL_MS"] = env_int("METRICS_FLUSH_INTERVAL_MS", 1000)
+
+    # Development/staging profiler: per-request SQL log, N+1 warnings, and
+    # cProfile dumps of sampled requests slower than PROFILER_SLOW_MS.
+    app.config["PROFILER_ENABLED"] = env_bool("PROFILER_ENABLED", False)
+    app.config["PROFILER_REPEAT_THRESHOLD"] = env_int("PROFILER_REPEAT_THRESHOLD", 3)
+    app.config["PROFILER_SLOW_MS"] = env_int("PROFILER_SLOW_MS", 500)
+    app.config["PROFILER_SAMPLE_RATE"] = env_float("PROFILER_SAMPLE_RATE", 0.1)
+    app.config["PROFILER_DIR"] = os.getenv("PROFILER_DIR", os.path.join(tempfile.gettempdir(), "survey-profiles"))
+
+    # /ready probe: SQLite check timeout and how long a result is reused.
+    app.config["READY_TIMEOUT_MS"] = env_int("READY_TIMEOUT_MS", 500)
+    app.config["READY_CACHE_MS"] = env_int("READY_CACHE_MS", 2000)
+
+    # Jinja bytecode cache shared by all workers ("" disables it), and the
+    # browser cache lifetime of fingerprinted static files. Cached bytecode is
+    # executed, so the directory must be private to the app's user (0700).
+    app.config["TEMPLATE_CACHE_DIR"] = os.getenv(
+        "TEMPLATE_CACHE_DIR", os.path.join(app.instance_path, "jinja-cache")
+    )
+    app.config["STATIC_MAX_AGE"] = env_int("STATIC_MAX_AGE", 31536000)
+
+    # Public vote form protection: "signed" uses stateless per-survey tokens
+    # valid for one to two windows, so the anonymous page can be cached;
+    # "session" uses Flask-WTF's per-session CSRF token.
+    app.config["PUBLIC_FORM_PROTECTION"] = os.getenv("PUBLIC_FORM_PROTECTION", "signed")
+    app.config["PUBLIC_FORM_TOKEN_WINDOW"] = env_int("PUBLIC_FORM_TOKEN_WINDOW", 3600)
+    app.config["PUBLIC_PAGE_MAX_AGE"] = env_int("PUBLIC_PAGE_MAX_AGE", 60)
+
+    # One-vote-per-respondent surveys: each worker's Bloom filter size and
+    # false positive rate, and how many confirmed voters it remembers exactly.
+    # Anonymous respondents are told apart by address: set PROXY_FIX_X_FOR
+    # behind a proxy.
+    app.config["RESPONDENT_FILTER_CAPACITY"] = env_int("RESPONDENT_FILTER_CAPACITY", 1000000)
+    app.config["RESPONDENT_FILTER_ERROR_RATE"] = env_float("RESPONDENT_FILTER_ERROR_RATE", 0.001)
+    app.config["RESPONDENT_CONFIRMED_CACHE_SIZE"] = env_int("RESPONDENT_CONFIRMED_CACHE_SIZE", 10000)
+
+    # Reverse proxies in front of the app: how many X-Forwarded-For and
+    # X-Forwarded-Proto hops to trust. Leave at 0 when clients connect
+    # directly, as they could otherwise forge their address.
+    app.config["PROXY_FIX_X_FOR"] = env_int("PROXY_FIX_X_FOR", 0)
+    app.config["PROXY_FIX_X_PROTO"] = env_int("PROXY_FIX_X_PROTO", 0)
+
+    # Token-bucket limits on public vote POSTs, per client and survey and per
+    # survey overall (a rate of 0 disables that limit). RATE_LIMIT_DB is a
+    # SQLite file shared by every worker on the host. Clients are told apart
+    # by address, so behind a proxy set PROXY_FIX_X_FOR or they share a bucket;
+    # off by default for that reason.
+    app.config["RATE_LIMIT_ENABLED"] = env_bool("RATE_LIMIT_ENABLED", False)
+    app.config["RATE_LIMIT_DB"] = os.getenv(
+        "RATE_LIMIT_DB", os.path.join(tempfile.gettempdir(), "survey-ratelimit.db")
+    )
+    app.config["RATE_LIMIT_CLIENT_RATE"] = env_float("RATE_LIMIT_CLIENT_RATE", 0.2)
+    app.config["RATE_LIMIT_CLIENT_BURST"] = env_int("RATE_LIMIT_CLIENT_BURST", 10)
+    app.config["RATE_LIMIT_SURVEY_RATE"] = env_float("RATE_LIMIT_SURVEY_RATE", 200.0)
+    app.config["RATE_LIMIT_SURVEY_BURST"] = env_int("RATE_LIMIT_SURVEY_BURST", 400)
+
+    # Survey and account deletion: responses removed per transaction, and an
+    # optional pause between chunks to let other writers in.
+    app.config["DELETE_CHUNK_SIZE"] = env_int("DELETE_CHUNK_SIZE", 5000)
+    app.config["DELETE_CHUNK_PAUSE_MS"] = env_int("DELETE_CHUNK_PAUSE_MS", 0)
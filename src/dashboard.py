@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Keyset-paginated dashboard queries."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from sqlalchemy import and_, func, or_, select
+from src.extensions import db
+from src.models import Survey, SurveyOptionTally
+
+PREVIEW_CHARS = 160
+
+
+@dataclass(frozen=True)
+class DashboardSurvey:
+    id: int
+    title: str
+    description_preview: str | None
+    is_active: bool
+    created_at: datetime
+    response_count: int
+    last_response_at: datetime | None
+
+
+@dataclass(frozen=True)
+class DashboardPage:
+    surveys: list[DashboardSurvey]
+    next_cursor: str | None
+
+
+def encode_cursor(created_at: datetime, survey_id: int) -> str:
+    """Encode the keyset position after a survey."""
+    return f"{created_at.isoformat()}_{survey_id}"
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime, int] | None:
+    """Decode a cursor; malformed cursors restart from the first page."""
+    if not cursor:
+        return None
+    created_at, _, survey_id = cursor.rpartition("_")
+    try:
+        return datetime.fromisoformat(created_at), int(survey_id)
+    except ValueError:
+        return None
+
+
+def survey_stats(survey_ids: list[int]) -> dict[int, tuple[int, datetime | None]]:
+    """Response count and last response time per survey, in one grouped query."""
+    if not survey_ids:
+        return {}
+    rows = db.session.execute(
+        select(
+            SurveyOptionTally.survey_id,
+            func.sum(SurveyOptionTally.vote_count),
+            func.max(SurveyOptionTally.last_response_at)
+        ).where(
+            SurveyOptionTally.survey_id.in_(survey_ids)
+        ).group_by(SurveyOptionTally.survey_id)
+    )
+    return {survey_id: (count, last) for survey_id, count, last in rows}
+
+
+def dashboard_page(user_id: int, cursor: str | None, page_size: int) -> DashboardPage:
+    """Load one page of a user's surveys, newest first.
+
+    Ordered by (created_at DESC, id ASC), which matches the
+    (user_id, created_at DESC) index with its implicit rowid suffix.
+    """
+    statement = select(
+        Survey.id,
+        Survey.title,
+        func.substr(Survey.description, 1, PREVIEW_CHARS + 1).label("description_preview"),
+        Survey.is_active,
+        Survey.created_at
+    ).where(
+        Survey.user_id == user_id
+    ).order_by(
+        Survey.created_at.desc(), Survey.id
+    ).limit(page_size + 1)
+
+    position = decode_cursor(cursor)
+    if position is not None:
+        created_at, survey_id = position
+        statement = statement.where(
+            Survey.created_at <= created_at,
+            or_(Survey.created_at < created_at,
+                and_(Survey.created_at == created_at, Survey.id > survey_id))
+        )
+
+    rows = db.session.execute(statement).all()
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    stats = survey_stats([row.id for row in rows])
+
+    surveys = [
+        DashboardSurvey(
+            id=row.id,
+            title=row.title,
+            description_preview=row.description_preview,
+            is_active=bool(row.is_active),
+            created_at=row.created_at,
+            response_count=stats.get(row.id, (0, None))[0],
+            last_response_at=stats.get(row.id, (0, None))[1],
+        )
+        for row in rows
+    ]
+    next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id) if has_more else None
+    return DashboardPage(surveys, next_cursor)
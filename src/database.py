@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""SQLite engine performance profile."""
+
+import logging
+import os
+import weakref
+from typing import Any
+from flask import Config
+from sqlalchemy import Engine, event
+
+logger = logging.getLogger(__name__)
+
+REPORTED_PRAGMAS = (
+    "journal_mode", "synchronous", "busy_timeout", "cache_size", "mmap_size", "temp_store",
+    "foreign_keys",
+)
+
+
+def engine_options(config: Config) -> dict[str, Any]:
+    """Build SQLAlchemy engine options for the configured pool."""
+    return {
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_timeout": config["DB_POOL_TIMEOUT"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "connect_args": {"timeout": config["SQLITE_BUSY_TIMEOUT_MS"] / 1000},
+    }
+
+
+def connect_pragmas(config: Config) -> list[str]:
+    """Return the PRAGMA statements applied to every new connection."""
+    return [
+        f"PRAGMA journal_mode = {config['SQLITE_JOURNAL_MODE']}",
+        f"PRAGMA synchronous = {config['SQLITE_SYNCHRONOUS']}",
+        f"PRAGMA busy_timeout = {config['SQLITE_BUSY_TIMEOUT_MS']:d}",
+        f"PRAGMA cache_size = {config['SQLITE_CACHE_SIZE']:d}",
+        f"PRAGMA mmap_size = {config['SQLITE_MMAP_SIZE']:d}",
+        f"PRAGMA temp_store = {config['SQLITE_TEMP_STORE']}",
+        # The schema relies on ON DELETE CASCADE, which SQLite only honours
+        # when enforcement is switched on per connection.
+        "PRAGMA foreign_keys = ON",
+    ]
+
+
+def apply_profile(engine: Engine, config: Config) -> None:
+    """Run the profile pragmas whenever the engine opens a connection."""
+    pragmas = connect_pragmas(config)
+
+    @event.listens_for(engine, "connect")
+    def set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+def dispose_after_fork(engine: Engine) -> None:
+    """Give forked children (e.g. workers of a preloaded master) a fresh pool.
+
+    Connections opened before the fork stay with the parent; the child drops
+    its references without closing them, so the parent's connections are not
+    disturbed.
+    """
+    ref = weakref.ref(engine)
+
+    def reset_pool() -> None:
+        child_engine = ref()
+        if child_engine is not None:
+            child_engine.dispose(close=False)
+
+    os.register_at_fork(after_in_child=reset_pool)
+
+
+def profile_report(engine: Engine) -> dict[str, Any]:
+    """Read back the settings in effect and log them."""
+    with engine.connect() as connection:
+        report: dict[str, Any] = {
+            name: connection.exec_driver_sql(f"PRAGMA {name}").scalar()
+            for name in REPORTED_PRAGMAS
+        }
+    report["pool"] = engine.pool.status()
+    logger.info(
+        "SQLite profile: %s", " ".join(f"{key}={value}" for key, value in report.items())
+    )
+    return report
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Chunked server-side deletion of surveys and accounts.
+
+Responses are removed DELETE_CHUNK_SIZE rows per transaction, so a survey
+with millions of votes neither loads them into the session nor holds the
+SQLite write lock for long. The survey row then goes in one short
+transaction, and ON DELETE CASCADE removes its options, tallies, rollups
+and vote batches.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from flask import current_app
+from sqlalchemy import delete, select, update
+from src.extensions import db
+from src.models import Survey, SurveyResponse, User
+from src.survey_cache import invalidate_survey
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DeletionSummary:
+    surveys: int
+    responses: int
+
+
+def _limits(chunk_size: int | None, pause: float | None) -> tuple[int, float]:
+    if chunk_size is None:
+        chunk_size = current_app.config["DELETE_CHUNK_SIZE"]
+    if pause is None:
+        pause = current_app.config["DELETE_CHUNK_PAUSE_MS"] / 1000
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be at least 1")
+    return chunk_size, pause
+
+
+def delete_responses(survey_id: int, chunk_size: int, pause: float = 0.0) -> int:
+    """Delete a survey's responses in committed chunks; returns the rows removed."""
+    table = SurveyResponse.__table__
+    chunk = (
+        select(table.c.response_id)
+        .where(table.c.survey_id == survey_id)
+        .limit(chunk_size)
+        .scalar_subquery()
+    )
+    removed = 0
+    while True:
+        result = db.session.execute(delete(table).where(table.c.response_id.in_(chunk)))
+        db.session.commit()
+        removed += result.rowcount
+        if result.rowcount < chunk_size:
+            return removed
+        if pause:
+            # Lets waiting writers take the lock between chunks.
+            time.sleep(pause)
+
+
+def delete_survey(survey_id: int, chunk_size: int | None = None, pause: float | None = None) -> int | None:
+    """Delete a survey and everything under it; None if it does not exist.
+
+    The survey is closed first so no new votes arrive while its responses
+    are removed. Returns the number of responses deleted.
+    """
+    chunk_size, pause = _limits(chunk_size, pause)
+    closed = db.session.execute(
+        update(Survey.__table__)
+        .where(Survey.__table__.c.survey_id == survey_id)
+        .values(is_active=False, version=Survey.__table__.c.version + 1)
+    )
+    if not closed.rowcount:
+        db.session.rollback()
+        return None
+    invalidate_survey(survey_id)
+    db.session.commit()
+
+    removed = delete_responses(survey_id, chunk_size, pause)
+    db.session.execute(delete(Survey.__table__).where(Survey.__table__.c.survey_id == survey_id))
+    invalidate_survey(survey_id)
+    db.session.commit()
+    logger.info("Deleted survey %d with %d responses", survey_id, removed)
+    return removed
+
+
+def delete_user(user_id: int, chunk_size: int | None = None,
+                pause: float | None = None) -> DeletionSummary | None:
+    """Delete an account and all its surveys; None if it does not exist."""
+    chunk_size, pause = _limits(chunk_size, pause)
+    survey_ids = db.session.scalars(select(Survey.id).where(Survey.user_id == user_id)).all()
+    db.session.commit()
+    removed = 0
+    for survey_id in survey_ids:
+        removed += delete_survey(survey_id, chunk_size, pause) or 0
+
+    user = db.session.get(User, user_id)
+    if user is None:
+        return None
+    # passive_deletes: any survey created meanwhile goes by ON DELETE CASCADE,
+    # and the user cache is invalidated by its after_delete hook.
+    db.session.delete(user)
+    db.session.commit()
+    logger.info("Deleted user %d with %d surveys and %d responses", user_id, len(survey_ids), removed)
+    return DeletionSummary(surveys=len(survey_ids), responses=removed)
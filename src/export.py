@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Streaming CSV / NDJSON export of survey responses."""
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator
+from sqlalchemy import select
+from src.extensions import db
+from src.models import SurveyOption, SurveyResponse
+
+EXPORT_FORMATS = {
+    "csv": "text/csv; charset=utf-8",
+    "ndjson": "application/x-ndjson",
+}
+COLUMNS = ("response_id", "response_date", "option_id", "option_text", "respondent_email")
+# Spreadsheets evaluate cells starting with these as formulas.
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def parse_bound(value: str | None, end: bool = False) -> datetime | None:
+    """Parse an ISO date or datetime filter; a bare end date covers that whole day."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(value)
+    if end and len(value) == 10:
+        parsed += timedelta(days=1)
+    return parsed
+
+
+def response_rows(survey_id: int, start: datetime | None, end: datetime | None,
+                  batch_size: int) -> Iterator:
+    """Yield response rows in date order, fetched batch_size at a time."""
+    statement = select(
+        SurveyResponse.id.label("response_id"),
+        SurveyResponse.response_date,
+        SurveyResponse.option_id,
+        SurveyOption.option_text,
+        SurveyResponse.respondent_email
+    ).join(
+        SurveyOption, SurveyOption.id == SurveyResponse.option_id
+    ).where(
+        SurveyResponse.survey_id == survey_id
+    ).order_by(
+        SurveyResponse.response_date
+    ).execution_options(yield_per=batch_size)
+    if start is not None:
+        statement = statement.where(SurveyResponse.response_date >= start)
+    if end is not None:
+        statement = statement.where(SurveyResponse.response_date < end)
+    yield from db.session.execute(statement)
+
+
+def _iso(value: datetime | None) -> str | None:
+    return value.isoformat() if value is not None else None
+
+
+def _text_cell(value: str | None) -> str:
+    """User-supplied text for a CSV cell, quoted so it cannot run as a formula."""
+    if not value:
+        return ""
+    return "'" + value if value.startswith(FORMULA_PREFIXES) else value
+
+
+def encode_csv(rows: Iterable, batch_size: int) -> Iterator[bytes]:
+    """Encode rows as CSV, one chunk per batch."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(COLUMNS)
+    for count, row in enumerate(rows, 1):
+        writer.writerow((row.response_id, _iso(row.response_date), row.option_id,
+                         _text_cell(row.option_text), _text_cell(row.respondent_email)))
+        if count % batch_size == 0:
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue().encode()
+
+
+def encode_ndjson(rows: Iterable, batch_size: int) -> Iterator[bytes]:
+    """Encode rows as newline-delimited JSON, one chunk per batch."""
+    lines = []
+    for row in rows:
+        record = dict(row._mapping, response_date=_iso(row.response_date))
+        lines.append(json.dumps(record))
+        if len(lines) >= batch_size:
+            yield ("\n".join(lines) + "\n").encode()
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode()
+
+
+def gzip_stream(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Compress a byte stream incrementally into a single gzip member."""
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
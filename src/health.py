@@ -0,0 +1,111 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Liveness and readiness probes answered before Flask sees the request."""
+
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable
+from flask import Flask
+from sqlalchemy import Engine
+from src.extensions import db
+
+HEALTH_PATH = "/health"
+READY_PATH = "/ready"
+
+
+class ReadinessCheck:
+    """Cached database readiness, probed on a connection outside the app's pool.
+
+    The probe owns one SQLite connection, so orchestrator checks never wait
+    for, or hold, a pooled connection that a request could use. Results are
+    reused for cache_seconds; concurrent probes during a refresh get the
+    previous result instead of queueing.
+    """
+
+    def __init__(self, engine: Engine, capacity: int | None, timeout: float, cache_seconds: float,
+                 clock: Callable[[], float] = time.monotonic) -> None:
+        self.engine = engine
+        self.capacity = capacity
+        self.database = engine.url.database
+        self.timeout = timeout
+        self.cache_seconds = cache_seconds
+        self.clock = clock
+        self._connection: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+        self._result: tuple[bool, str] = (False, "not checked")
+        self._checked_at: float | None = None
+
+    def __call__(self) -> tuple[bool, str]:
+        """Return (ready, reason), refreshing at most once per cache_seconds."""
+        now = self.clock()
+        if self._checked_at is not None and now - self._checked_at < self.cache_seconds:
+            return self._result
+        if not self._lock.acquire(blocking=self._checked_at is None):
+            return self._result
+        try:
+            self._result = self._check()
+            self._checked_at = self.clock()
+            return self._result
+        finally:
+            self._lock.release()
+
+    def _check(self) -> tuple[bool, str]:
+        if self.capacity is not None and self.engine.pool.checkedout() >= self.capacity:
+            return False, "connection pool exhausted"
+        try:
+            if self._connection is None:
+                self._connection = sqlite3.connect(
+                    f"file:{self.database}?mode=ro", uri=True, timeout=self.timeout, check_same_thread=False
+                )
+            self._connection.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+        except sqlite3.Error as exc:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+            return False, f"database unavailable: {exc}"
+        return True, "ready"
+
+
+class HealthCheckMiddleware:
+    """WSGI middleware serving /health and /ready without routing, sessions or login."""
+
+    def __init__(self, wsgi_app: Callable, ready: Callable[[], tuple[bool, str]]) -> None:
+        self.wsgi_app = wsgi_app
+        self.ready = ready
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        path = environ.get("PATH_INFO")
+        if path == HEALTH_PATH:
+            return self._respond(start_response, True, "ok")
+        if path == READY_PATH:
+            return self._respond(start_response, *self.ready())
+        return self.wsgi_app(environ, start_response)
+
+    @staticmethod
+    def _respond(start_response: Callable, ok: bool, message: str) -> list[bytes]:
+        body = message.encode()
+        start_response("200 OK" if ok else "503 Service Unavailable", [
+            ("Content-Type", "text/plain; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+            ("Cache-Control", "no-store"),
+        ])
+        return [body]
+
+
+def init_app(app: Flask) -> None:
+    """Put the probe middleware in front of the application."""
+    with app.app_context():
+        engine = db.engine
+    overflow = app.config["DB_MAX_OVERFLOW"]
+    check = ReadinessCheck(
+        engine,
+        capacity=app.config["DB_POOL_SIZE"] + overflow if overflow >= 0 else None,
+        timeout=app.config["READY_TIMEOUT_MS"] / 1000,
+        cache_seconds=app.config["READY_CACHE_MS"] / 1000,
+    )
+    app.extensions["readiness"] = check
+    app.wsgi_app = HealthCheckMiddleware(app.wsgi_app, check)
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""HTTP conditional request helpers (ETag / Last-Modified)."""
+
+from datetime import datetime, timezone
+from flask import Response, request
+from werkzeug.http import is_resource_modified
+
+
+def _as_utc(value: datetime | None) -> datetime | None:
+    if value is None:
+        return None
+    # Timestamps are stored as naive UTC; HTTP dates have one-second precision.
+    return value.replace(tzinfo=timezone.utc, microsecond=0)
+
+
+def not_modified(etag: str, last_modified: datetime | None = None) -> Response | None:
+    """Return a 304 response if the client's copy is still current.
+
+    Call before rendering so unchanged pages cost no template work.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return None
+    if is_resource_modified(request.environ, etag=etag, last_modified=_as_utc(last_modified)):
+        return None
+    return with_validators(Response(status=304), etag, last_modified)
+
+
+def with_validators(
+    response: Response,
+    etag: str,
+    last_modified: datetime | None = None,
+    cache_control: str = "private, no-cache",
+) -> Response:
+    """Attach ETag, Last-Modified and Cache-Control headers to a response."""
+    response.set_etag(etag)
+    if last_modified is not None:
+        response.last_modified = _as_utc(last_modified)
+    response.headers["Cache-Control"] = cache_control
+    response.vary.add("Cookie")
+    return response
@@ -0,0 +1,108 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Survey vote ingestion with optional write-behind group commit."""
+
+import logging
+from datetime import datetime
+from flask import Flask, current_app
+from sqlalchemy.exc import IntegrityError
+from src.extensions import db
+from src.models import SurveyResponse
+from src.unique_respondents import add_respondents
+from src.write_behind import WriteBehindBuffer
+
+logger = logging.getLogger(__name__)
+
+INGEST_MODES = ("direct", "flush", "enqueue")
+
+
+class VoteIngestError(RuntimeError):
+    """Raised when a vote could not be acknowledged as recorded."""
+
+
+class DuplicateVoteError(VoteIngestError):
+    """Raised when the respondent already voted in a one-vote survey."""
+
+
+def is_duplicate_vote(error: Exception | None) -> bool:
+    """True if error is the unique respondent index refusing a repeat vote."""
+    return isinstance(error, IntegrityError) and "respondent_hash" in str(error.orig)
+
+
+def init_app(app: Flask) -> None:
+    """Set up the vote buffer when a write-behind mode is configured."""
+    mode = app.config["VOTE_INGEST_MODE"]
+    if mode not in INGEST_MODES:
+        raise ValueError(f"VOTE_INGEST_MODE must be one of {', '.join(INGEST_MODES)}")
+    if mode == "flush" and app.config["WORKER_THREADS"] < 2:
+        logger.warning(
+            "VOTE_INGEST_MODE=flush with single-threaded workers adds up to %d ms per vote "
+            "without batching; set GUNICORN_THREADS > 1 or use direct",
+            app.config["VOTE_FLUSH_INTERVAL_MS"],
+        )
+    if mode != "direct":
+        app.extensions["vote_buffer"] = WriteBehindBuffer(
+            app,
+            "votes",
+            insert_votes,
+            max_batch=app.config["VOTE_BATCH_SIZE"],
+            interval=app.config["VOTE_FLUSH_INTERVAL_MS"] / 1000,
+            max_pending=app.config["VOTE_BUFFER_MAX"],
+            expected_error=is_duplicate_vote,
+        )
+
+
+def insert_votes(rows: list[dict]) -> None:
+    """Insert vote rows with a single executemany in the current transaction."""
+    if rows:
+        db.session.execute(SurveyResponse.__table__.insert(), rows)
+        add_respondents(rows)
+        metrics = current_app.extensions.get("metrics")
+        if metrics is not None:
+            metrics.inc("votes_ingested_total", len(rows))
+
+
+def submit_vote(survey_id: int, option_id: int, respondent_email: str | None,
+                respondent_hash: str | None = None) -> None:
+    """Record one vote according to VOTE_INGEST_MODE.
+
+    respondent_hash is set for one-vote surveys; a repeat raises
+    DuplicateVoteError, except in enqueue mode where it is dropped at flush.
+    """
+    row = {
+        "survey_id": survey_id,
+        "option_id": option_id,
+        "respondent_email": respondent_email,
+        "respondent_hash": respondent_hash,
+        "response_date": datetime.utcnow(),
+    }
+    buffer: WriteBehindBuffer | None = current_app.extensions.get("vote_buffer")
+    ticket = buffer.submit(row) if buffer is not None else None
+
+    if ticket is None:
+        # Direct mode, or the buffer is full/closed: write through.
+        try:
+            insert_votes([row])
+            db.session.commit()
+        except IntegrityError as exc:
+            db.session.rollback()
+            if is_duplicate_vote(exc):
+                raise DuplicateVoteError("Respondent has already voted") from exc
+            raise
+        return
+
+    if current_app.config["VOTE_INGEST_MODE"] == "flush":
+        timeout = current_app.config["VOTE_ACK_TIMEOUT_MS"] / 1000
+        if not ticket.wait(timeout):
+            # Only report failure for a vote that can no longer be written,
+            # or a client retrying the 503 would be counted twice.
+            if buffer.withdraw(ticket):
+                raise VoteIngestError("Vote was not committed in time")
+            if is_duplicate_vote(ticket.error):
+                raise DuplicateVoteError("Respondent has already voted")
+            if ticket.error is not None:
+                raise VoteIngestError("Vote could not be committed")
+            # Already being written: accepted, as in enqueue mode.
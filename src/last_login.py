@@ -0,0 +1,86 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Coalesced, throttled last_login tracking written behind the login request."""
+
+from datetime import datetime, timedelta
+from flask import Flask, current_app
+from sqlalchemy import bindparam, or_, update
+from src.cache import TTLCache
+from src.extensions import db
+from src.models import User
+from src.write_behind import WriteBehindBuffer
+
+
+class LastLoginTracker:
+    """Records logins at most once per user per precision window.
+
+    Logins inside the window are dropped before they reach the buffer, and
+    the buffer writes each batch as one executemany UPDATE.
+    """
+
+    def __init__(self, app: Flask, precision: float, batch_size: int = 500,
+                 interval: float = 1.0, max_pending: int = 10000) -> None:
+        self.precision = timedelta(seconds=precision)
+        self._recent = TTLCache(max_pending, precision)
+        self.buffer = WriteBehindBuffer(
+            app,
+            "last-login",
+            write_last_logins,
+            max_batch=batch_size,
+            interval=interval,
+            max_pending=max_pending,
+        )
+
+    def record(self, user: User, when: datetime | None = None) -> bool:
+        """Queue a login time for user; False when it falls inside the window."""
+        when = when or datetime.utcnow()
+        if user.last_login is not None and when - user.last_login < self.precision:
+            return False
+        if self._recent.get(user.id) is not None:
+            return False
+        self._recent.set(user.id, when)
+        row = {"user_id": user.id, "last_login": when}
+        if self.buffer.submit(row) is None:
+            # Buffer full or closed: write through.
+            write_last_logins([row])
+            db.session.commit()
+        return True
+
+
+def write_last_logins(rows: list[dict]) -> None:
+    """Apply the newest login per user with a single executemany."""
+    latest: dict[int, dict] = {}
+    for row in rows:
+        current = latest.get(row["user_id"])
+        if current is None or row["last_login"] > current["last_login"]:
+            latest[row["user_id"]] = row
+    if not latest:
+        return
+    # Bind names must differ from column names ("user_id", "last_login").
+    users = User.__table__
+    statement = update(users).where(
+        users.c.user_id == bindparam("uid"),
+        or_(users.c.last_login.is_(None), users.c.last_login < bindparam("login_at")),
+    ).values(last_login=bindparam("login_at"))
+    db.session.execute(statement, [
+        {"uid": user_id, "login_at": row["last_login"]} for user_id, row in latest.items()
+    ])
+
+
+def init_app(app: Flask) -> None:
+    """Create the per-worker last_login tracker."""
+    app.extensions["last_login"] = LastLoginTracker(
+        app,
+        precision=app.config["LAST_LOGIN_PRECISION_SECONDS"],
+        batch_size=app.config["LAST_LOGIN_BATCH_SIZE"],
+        interval=app.config["LAST_LOGIN_FLUSH_INTERVAL_MS"] / 1000,
+        max_pending=app.config["LAST_LOGIN_BUFFER_MAX"],
+    )
+
+
+def record_login(user: User) -> bool:
+    """Queue a last_login update for user through the app's tracker."""
+    return current_app.extensions["last_login"].record(user)
@@ -0,0 +1,174 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Live survey results over Server-Sent Events with shared, coalesced fan-out.
+
+Streams are only served in LIVE_RESULTS_MODE=sse, by the threaded process
+of gunicorn_sse.conf.py. Otherwise the results page polls tally_payloads.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Iterator
+from flask import Flask
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+from src.extensions import db
+from src.models import SurveyOption, SurveyOptionTally
+
+logger = logging.getLogger(__name__)
+
+LIVE_RESULTS_MODES = ("poll", "sse")
+
+
+class SurveyFeed:
+    """Latest tally snapshot for one survey, shared by all of its viewers.
+
+    Viewers wait for the sequence number to move and then read the newest
+    payload, so slow viewers skip intermediate updates instead of queueing them.
+    """
+
+    def __init__(self) -> None:
+        self.cond = threading.Condition()
+        self.seq = 0
+        self.payload: str | None = None
+        self.subscribers = 0
+
+    def publish(self, payload: str) -> None:
+        with self.cond:
+            if payload == self.payload:
+                return
+            self.payload = payload
+            self.seq += 1
+            self.cond.notify_all()
+
+    def wait(self, seen: int, timeout: float) -> tuple[int, str | None]:
+        """Wait for a snapshot newer than seen; returns (seq, payload or None)."""
+        with self.cond:
+            self.cond.wait_for(lambda: self.seq > seen, timeout)
+            if self.seq > seen:
+                return self.seq, self.payload
+            return seen, None
+
+
+def tally_payloads(survey_ids: list[int]) -> dict[int, str]:
+    """Read tallies for several surveys in one query and encode them as JSON."""
+    rows = db.session.execute(
+        select(
+            SurveyOption.survey_id,
+            SurveyOption.option_order,
+            func.coalesce(SurveyOptionTally.vote_count, 0)
+        ).outerjoin(
+            SurveyOptionTally, SurveyOption.id == SurveyOptionTally.option_id
+        ).where(
+            SurveyOption.survey_id.in_(survey_ids)
+        ).order_by(SurveyOption.survey_id, SurveyOption.option_order)
+    )
+    counts: dict[int, list[int]] = {survey_id: [] for survey_id in survey_ids}
+    for survey_id, _, vote_count in rows:
+        counts[survey_id].append(vote_count)
+    return {
+        survey_id: json.dumps({"total": sum(values), "counts": values})
+        for survey_id, values in counts.items()
+    }
+
+
+class TallyBroadcaster:
+    """Polls tallies for every watched survey once per tick in this worker."""
+
+    def __init__(self, app: Flask, interval: float) -> None:
+        self.app = app
+        self.interval = interval
+        self.feeds: dict[int, SurveyFeed] = {}
+        self._lock = threading.Lock()
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+
+    def subscribe(self, survey_id: int) -> SurveyFeed:
+        """Join the feed for a survey, starting the poller if needed."""
+        with self._lock:
+            feed = self.feeds.setdefault(survey_id, SurveyFeed())
+            feed.subscribers += 1
+            if self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._thread = None
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="sse-tallies", daemon=True)
+                self._thread.start()
+            return feed
+
+    def unsubscribe(self, survey_id: int) -> None:
+        """Leave a survey's feed; the last viewer out removes it."""
+        with self._lock:
+            feed = self.feeds.get(survey_id)
+            if feed is None:
+                return
+            feed.subscribers -= 1
+            if feed.subscribers <= 0:
+                del self.feeds[survey_id]
+
+    def poll(self) -> None:
+        """Read and publish tallies for all watched surveys in one query."""
+        with self._lock:
+            feeds = dict(self.feeds)
+        if not feeds:
+            return
+        with self.app.app_context():
+            try:
+                payloads = tally_payloads(list(feeds))
+            finally:
+                db.session.remove()
+        for survey_id, payload in payloads.items():
+            feeds[survey_id].publish(payload)
+
+    def _run(self) -> None:
+        # New viewers publish their own initial snapshot, so the first poll
+        # can wait a full tick.
+        while True:
+            time.sleep(self.interval)
+            with self._lock:
+                if not self.feeds:
+                    self._thread = None
+                    return
+            try:
+                self.poll()
+            except SQLAlchemyError:
+                logger.exception("Live results poll failed")
+
+
+def init_app(app: Flask) -> None:
+    """Create the per-worker tally broadcaster when streams are enabled."""
+    mode = app.config["LIVE_RESULTS_MODE"]
+    if mode not in LIVE_RESULTS_MODES:
+        raise ValueError(f"LIVE_RESULTS_MODE must be one of {', '.join(LIVE_RESULTS_MODES)}")
+    if mode != "sse":
+        return
+    rate = max(app.config["SSE_MAX_PUSHES_PER_SECOND"], 0.01)
+    app.extensions["tally_broadcaster"] = TallyBroadcaster(app, 1 / rate)
+
+
+def event_stream(broadcaster: TallyBroadcaster, survey_id: int, initial: str,
+                 max_duration: float, heartbeat: float) -> Iterator[str]:
+    """Yield SSE messages for a survey until max_duration elapses."""
+    feed = broadcaster.subscribe(survey_id)
+    feed.publish(initial)
+    deadline = time.monotonic() + max_duration
+    seen = 0
+    try:
+        yield "retry: 2000\n\n"
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            seen, payload = feed.wait(seen, min(heartbeat, remaining))
+            if payload is not None:
+                yield f"event: tallies\ndata: {payload}\n\n"
+            else:
+                yield ": keepalive\n\n"
+    finally:
+        broadcaster.unsubscribe(survey_id)
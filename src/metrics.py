@@ -0,0 +1,276 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Opt-in Prometheus-style metrics aggregated across worker processes.
+
+Each process keeps its own counters and histograms and periodically writes
+them to a JSON file in METRICS_DIR; /metrics sums every file in the
+directory, so any worker can answer for all of them.
+"""
+
+import atexit
+import json
+import os
+import shutil
+import threading
+import time
+import weakref
+from pathlib import Path
+from typing import Any
+from flask import Flask, Response, g, has_request_context, request, template_rendered, before_render_template
+from sqlalchemy import event
+from src.extensions import db
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (1, 2, 5, 10, 20, 50, 100)
+
+# name -> (type, help)
+METRICS = {
+    "http_requests_total": ("counter", "Requests by blueprint, endpoint, method and status."),
+    "http_request_duration_seconds": ("histogram", "Request latency by blueprint and endpoint."),
+    "db_statements_per_request": ("histogram", "SQL statements run by one request."),
+    "db_time_per_request_seconds": ("histogram", "Time spent in SQL by one request."),
+    "db_statements_total": ("counter", "SQL statements run, inside or outside requests."),
+    "db_time_seconds_total": ("counter", "Time spent in SQL, inside or outside requests."),
+    "votes_ingested_total": ("counter", "Survey responses inserted."),
+    "rate_limited_total": ("counter", "Vote submissions refused by the rate limiter, by limit."),
+    "template_render_seconds": ("histogram", "Template render time by template."),
+}
+
+Labels = tuple[tuple[str, str], ...]
+
+_registries: "weakref.WeakSet[MetricsRegistry]" = weakref.WeakSet()
+
+
+class MetricsRegistry:
+    """Counters and histograms for this process, persisted to a shared directory."""
+
+    def __init__(self, directory: str | Path, flush_interval: float = 1.0) -> None:
+        self.directory = Path(directory)
+        self.flush_interval = flush_interval
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, Labels], float] = {}
+        self._histograms: dict[tuple[str, Labels], list[float]] = {}
+        self._buckets: dict[str, tuple[float, ...]] = {}
+        self._dirty = False
+        self._pid = os.getpid()
+        self._path = self._file_for_pid()
+        self._thread: threading.Thread | None = None
+        _registries.add(self)
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        """Add value to a counter."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._check_pid()
+            self._counters[key] = self._counters.get(key, 0.0) + value
+            self._dirty = True
+        self._ensure_thread()
+
+    def observe(self, name: str, value: float, buckets: tuple[float, ...] = LATENCY_BUCKETS,
+                **labels: str) -> None:
+        """Record one observation in a histogram."""
+        key = (name, tuple(sorted(labels.items())))
+        with self._lock:
+            self._check_pid()
+            self._buckets[name] = buckets
+            # Per-bucket (not cumulative) counts, then sum and count.
+            slots = self._histograms.setdefault(key, [0.0] * (len(buckets) + 2))
+            for i, bound in enumerate(buckets):
+                if value <= bound:
+                    slots[i] += 1
+                    break
+            slots[-2] += value
+            slots[-1] += 1
+            self._dirty = True
+        self._ensure_thread()
+
+    def snapshot(self) -> dict[str, Any]:
+        """This process's values in the on-disk format."""
+        with self._lock:
+            return {
+                "counters": [[name, list(labels), value] for (name, labels), value in self._counters.items()],
+                "histograms": [
+                    [name, list(labels), list(self._buckets[name]), slots]
+                    for (name, labels), slots in self._histograms.items()
+                ],
+            }
+
+    def flush(self) -> None:
+        """Write this process's values to its file in the metrics directory."""
+        with self._lock:
+            self._check_pid()
+            self._dirty = False
+            path = self._path
+        self.directory.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(".tmp")
+        temporary.write_text(json.dumps(self.snapshot()))
+        os.replace(temporary, path)
+
+    def collect(self) -> str:
+        """Aggregate every process file and render the text exposition format."""
+        self.flush()
+        counters: dict[tuple[str, Labels], float] = {}
+        histograms: dict[tuple[str, Labels], tuple[list[float], list[float]]] = {}
+        for path in sorted(self.directory.glob("metrics-*.json")):
+            try:
+                data = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            for name, labels, value in data["counters"]:
+                key = (name, tuple(tuple(pair) for pair in labels))
+                counters[key] = counters.get(key, 0.0) + value
+            for name, labels, buckets, slots in data["histograms"]:
+                key = (name, tuple(tuple(pair) for pair in labels))
+                _, totals = histograms.setdefault(key, (buckets, [0.0] * len(slots)))
+                for i, value in enumerate(slots):
+                    totals[i] += value
+        return render(counters, histograms)
+
+    def _file_for_pid(self) -> Path:
+        # The start time keeps a recycled pid from overwriting a dead worker's totals.
+        return self.directory / f"metrics-{os.getpid()}-{time.time_ns()}.json"
+
+    def _check_pid(self) -> None:
+        # A worker forked from a preloaded master starts from zero, not from
+        # the master's values.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._path = self._file_for_pid()
+            self._counters.clear()
+            self._histograms.clear()
+            self._thread = None
+
+    def _ensure_thread(self) -> None:
+        if self._thread is None or not self._thread.is_alive():
+            with self._lock:
+                if self._thread is None or not self._thread.is_alive():
+                    self._thread = threading.Thread(target=self._run, name="metrics-flush", daemon=True)
+                    self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            time.sleep(self.flush_interval)
+            if self._dirty:
+                self.flush()
+
+
+def flush_all() -> None:
+    """Write every registry with unsaved values; used on worker shutdown."""
+    for metrics in list(_registries):
+        if metrics._dirty:
+            metrics.flush()
+
+
+def clear_directory(directory: str | Path) -> None:
+    """Remove per-process files from a previous run; call before workers start."""
+    shutil.rmtree(directory, ignore_errors=True)
+
+
+atexit.register(flush_all)
+
+
+def _label_text(labels: Labels, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = [*labels, *extra]
+    if not pairs:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"') for _, value in pairs)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(pairs, escaped)) + "}"
+
+
+def _number(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(value)
+
+
+def render(counters: dict, histograms: dict) -> str:
+    """Render aggregated values in the Prometheus text exposition format."""
+    lines: list[str] = []
+    for name, (kind, help_text) in METRICS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} {kind}")
+        if kind == "counter":
+            for (metric, labels), value in sorted(counters.items()):
+                if metric == name:
+                    lines.append(f"{name}{_label_text(labels)} {_number(value)}")
+            continue
+        for (metric, labels), (buckets, slots) in sorted(histograms.items()):
+            if metric != name:
+                continue
+            cumulative = 0.0
+            for bound, count in zip(buckets, slots):
+                cumulative += count
+                lines.append(f"{name}_bucket{_label_text(labels, (('le', _number(bound)),))} {_number(cumulative)}")
+            lines.append(f"{name}_bucket{_label_text(labels, (('le', '+Inf'),))} {_number(slots[-1])}")
+            lines.append(f"{name}_sum{_label_text(labels)} {_number(slots[-2])}")
+            lines.append(f"{name}_count{_label_text(labels)} {_number(slots[-1])}")
+    return "\n".join(lines) + "\n"
+
+
+def registry(app: Flask) -> MetricsRegistry | None:
+    """The app's metrics registry, or None when metrics are disabled."""
+    return app.extensions.get("metrics")
+
+
+def init_app(app: Flask) -> None:
+    """Install request, SQL and template instrumentation and the /metrics route."""
+    if not app.config["METRICS_ENABLED"]:
+        return
+    metrics = MetricsRegistry(app.config["METRICS_DIR"], app.config["METRICS_FLUSH_INTERVAL_MS"] / 1000)
+    app.extensions["metrics"] = metrics
+
+    @app.before_request
+    def start_request_metrics() -> None:
+        g.metrics_started = time.perf_counter()
+        g.metrics_sql = [0, 0.0]
+
+    @app.after_request
+    def record_request_metrics(response: Response) -> Response:
+        started = g.pop("metrics_started", None)
+        if started is None:
+            return response
+        endpoint = request.endpoint or "unmatched"
+        blueprint = request.blueprint or "app"
+        statements, sql_time = g.pop("metrics_sql", (0, 0.0))
+        metrics.inc("http_requests_total", blueprint=blueprint, endpoint=endpoint,
+                    method=request.method, status=str(response.status_code))
+        metrics.observe("http_request_duration_seconds", time.perf_counter() - started,
+                        blueprint=blueprint, endpoint=endpoint)
+        metrics.observe("db_statements_per_request", statements, STATEMENT_BUCKETS,
+                        blueprint=blueprint, endpoint=endpoint)
+        metrics.observe("db_time_per_request_seconds", sql_time, blueprint=blueprint, endpoint=endpoint)
+        return response
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("metrics_started", []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info["metrics_started"].pop()
+        elapsed = time.perf_counter() - started
+        metrics.inc("db_statements_total")
+        metrics.inc("db_time_seconds_total", elapsed)
+        if has_request_context() and "metrics_sql" in g:
+            g.metrics_sql[0] += 1
+            g.metrics_sql[1] += elapsed
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(db.engine, "after_cursor_execute", after_cursor_execute)
+
+    def template_started(sender: Flask, template, context, **extra) -> None:
+        if has_request_context():
+            g.setdefault("metrics_templates", []).append(time.perf_counter())
+
+    def template_finished(sender: Flask, template, context, **extra) -> None:
+        stack = g.get("metrics_templates") if has_request_context() else None
+        if stack:
+            metrics.observe("template_render_seconds", time.perf_counter() - stack.pop(),
+                            template=template.name or "string")
+
+    before_render_template.connect(template_started, app, weak=False)
+    template_rendered.connect(template_finished, app, weak=False)
+
+    @app.route("/metrics")
+    def metrics_endpoint() -> Response:
+        return Response(metrics.collect(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,288 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Versioned schema migrations tracked in SQLite's user_version pragma."""
+
+import logging
+from dataclasses import dataclass
+from typing import Callable
+from sqlalchemy import Connection, Engine, inspect
+from sqlalchemy.schema import CreateTable
+from src.extensions import db
+from src.models.survey import ROLLUP_BUCKETS, ROLLUP_TRIGGER, TALLY_TRIGGER
+from src.unique_respondents import rebuild_sketches
+
+logger = logging.getLogger(__name__)
+
+Step = str | Callable[[Connection], None]
+
+
+class SchemaVersionError(RuntimeError):
+    """Raised when the database schema does not match this code's HEAD."""
+
+
+@dataclass(frozen=True)
+class Migration:
+    """One schema version: SQL statements or callables run in a transaction.
+
+    Migrations that rebuild tables set rebuilds_tables; they run with foreign
+    key enforcement off, as dropping a parent table would otherwise cascade,
+    and are checked with foreign_key_check before they commit.
+    """
+    version: int
+    description: str
+    steps: tuple[Step, ...]
+    rebuilds_tables: bool = False
+
+
+def add_column(table: str, column: str, ddl: str) -> Step:
+    """Step that adds a column unless it already exists."""
+    def step(connection: Connection) -> None:
+        columns = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({table})")}
+        if column not in columns:
+            connection.exec_driver_sql(f"ALTER TABLE {table} ADD COLUMN {column} {ddl}")
+    return step
+
+
+def rebuild_table(name: str, create: str, indexes: tuple[str, ...]) -> Step:
+    """Step that recreates a table as create defines it, keeping rows.
+
+    SQLite cannot change a column's constraints in place, so this follows its
+    documented create-copy-drop-rename procedure. create and indexes are
+    literal DDL, frozen with the migration so later model changes cannot
+    alter what it does. Triggers on the table are dropped with it; the
+    migration must recreate them.
+    """
+    def step(connection: Connection) -> None:
+        temporary = f"{name}__rebuild"
+        connection.exec_driver_sql(create.replace(f"CREATE TABLE {name} (", f"CREATE TABLE {temporary} (", 1))
+        existing = {row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({name})")}
+        columns = ", ".join(
+            row[1] for row in connection.exec_driver_sql(f"PRAGMA table_info({temporary})") if row[1] in existing
+        )
+        connection.exec_driver_sql(f"INSERT INTO {temporary} ({columns}) SELECT {columns} FROM {name}")
+        connection.exec_driver_sql(f"DROP TABLE {name}")
+        connection.exec_driver_sql(f"ALTER TABLE {temporary} RENAME TO {name}")
+        for index in indexes:
+            connection.exec_driver_sql(index)
+    return step
+
+
+def delete_orphans(connection: Connection) -> None:
+    """Step that deletes rows whose parent row is missing, logging the counts.
+
+    Databases written before foreign keys were enforced can hold, for
+    example, responses to option ids that never existed. Removing one
+    orphan can orphan its children, so this repeats until
+    foreign_key_check is clean. Tallies and rollups are recounted when
+    responses were removed. Run with foreign keys off.
+    """
+    removed: dict[str, int] = {}
+    while violations := connection.exec_driver_sql("PRAGMA foreign_key_check").all():
+        rowids: dict[str, set[int]] = {}
+        for table, rowid, *_ in violations:
+            if rowid is None:
+                raise SchemaVersionError(f"Cannot remove rows with missing parents from {table}")
+            rowids.setdefault(table, set()).add(rowid)
+        for table, ids in rowids.items():
+            ids = sorted(ids)
+            for start in range(0, len(ids), 500):
+                chunk = ", ".join(str(rowid) for rowid in ids[start:start + 500])
+                connection.exec_driver_sql(f"DELETE FROM {table} WHERE rowid IN ({chunk})")
+            removed[table] = removed.get(table, 0) + len(ids)
+    for table, count in sorted(removed.items()):
+        logger.warning("Removed %d rows from %s whose parent row is missing", count, table)
+    if "survey_responses" in removed:
+        for statement in (*TALLY_BACKFILL, *ROLLUP_BACKFILL):
+            connection.exec_driver_sql(statement)
+
+
+def create_table(name: str) -> Step:
+    """Step that creates a table from its model unless it already exists."""
+    def step(connection: Connection) -> None:
+        table = db.metadata.tables[name]
+        connection.exec_driver_sql(
+            str(CreateTable(table, if_not_exists=True).compile(dialect=connection.dialect))
+        )
+    return step
+
+
+TALLY_BACKFILL = (
+    "DELETE FROM survey_option_tallies",
+    "INSERT INTO survey_option_tallies (option_id, survey_id, vote_count, last_response_at) "
+    "SELECT option_id, survey_id, COUNT(*), MAX(response_date) "
+    "FROM survey_responses GROUP BY option_id, survey_id",
+)
+
+ROLLUP_BACKFILL = (
+    "DELETE FROM survey_response_rollups",
+    *(
+        "INSERT INTO survey_response_rollups (survey_id, granularity, bucket, option_id, vote_count) "
+        f"SELECT survey_id, '{granularity}', strftime('{fmt}', response_date), option_id, COUNT(*) "
+        "FROM survey_responses WHERE response_date IS NOT NULL "
+        f"GROUP BY survey_id, strftime('{fmt}', response_date), option_id"
+        for granularity, fmt in ROLLUP_BUCKETS.items()
+    ),
+)
+
+MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, "Hot-path indexes for tallies, dashboard and option listing", (
+        "CREATE INDEX IF NOT EXISTS ix_survey_responses_survey_option "
+        "ON survey_responses (survey_id, option_id)",
+        "CREATE INDEX IF NOT EXISTS ix_surveys_user_created "
+        "ON surveys (user_id, created_at DESC)",
+        "CREATE INDEX IF NOT EXISTS ix_survey_options_survey_order "
+        "ON survey_options (survey_id, option_order)",
+    )),
+    Migration(2, "Survey version counter for cache validators", (
+        add_column("surveys", "version", "INTEGER NOT NULL DEFAULT 1"),
+    )),
+    Migration(3, "Response date index for exports and date ranges", (
+        "CREATE INDEX IF NOT EXISTS ix_survey_responses_survey_date "
+        "ON survey_responses (survey_id, response_date)",
+    )),
+    Migration(4, "Last-response timestamps on tallies for the dashboard", (
+        add_column("survey_option_tallies", "last_response_at", "DATETIME"),
+        "CREATE INDEX IF NOT EXISTS ix_survey_option_tallies_survey "
+        "ON survey_option_tallies (survey_id)",
+        "DROP TRIGGER IF EXISTS survey_responses_tally_insert",
+        TALLY_TRIGGER,
+        *TALLY_BACKFILL,
+    )),
+    Migration(5, "Hourly and daily response rollups for trends", (
+        ROLLUP_TRIGGER,
+        *ROLLUP_BACKFILL,
+    )),
+    Migration(6, "ON DELETE CASCADE from users down to responses", (
+        rebuild_table(
+            "surveys",
+            "CREATE TABLE surveys ("
+            "survey_id INTEGER NOT NULL, user_id INTEGER NOT NULL, title VARCHAR(255) NOT NULL, "
+            "description TEXT, is_active BOOLEAN, created_at DATETIME, updated_at DATETIME, "
+            "version INTEGER DEFAULT '1' NOT NULL, PRIMARY KEY (survey_id), "
+            "FOREIGN KEY(user_id) REFERENCES users (user_id) ON DELETE CASCADE)",
+            ("CREATE INDEX ix_surveys_user_created ON surveys (user_id, created_at DESC)",),
+        ),
+        rebuild_table(
+            "survey_options",
+            "CREATE TABLE survey_options ("
+            "option_id INTEGER NOT NULL, survey_id INTEGER NOT NULL, option_text VARCHAR(255) NOT NULL, "
+            "option_order INTEGER NOT NULL, PRIMARY KEY (option_id), "
+            "FOREIGN KEY(survey_id) REFERENCES surveys (survey_id) ON DELETE CASCADE)",
+            ("CREATE INDEX ix_survey_options_survey_order ON survey_options (survey_id, option_order)",),
+        ),
+        rebuild_table(
+            "survey_responses",
+            "CREATE TABLE survey_responses ("
+            "response_id INTEGER NOT NULL, survey_id INTEGER NOT NULL, option_id INTEGER NOT NULL, "
+            "respondent_email VARCHAR(255), response_date DATETIME, PRIMARY KEY (response_id), "
+            "FOREIGN KEY(survey_id) REFERENCES surveys (survey_id) ON DELETE CASCADE, "
+            "FOREIGN KEY(option_id) REFERENCES survey_options (option_id) ON DELETE CASCADE)",
+            (
+                "CREATE INDEX ix_survey_responses_option ON survey_responses (option_id)",
+                "CREATE INDEX ix_survey_responses_survey_option ON survey_responses (survey_id, option_id)",
+                "CREATE INDEX ix_survey_responses_survey_date ON survey_responses (survey_id, response_date)",
+            ),
+        ),
+        delete_orphans,
+        TALLY_TRIGGER,
+        ROLLUP_TRIGGER,
+        "CREATE INDEX IF NOT EXISTS ix_survey_response_rollups_option "
+        "ON survey_response_rollups (option_id)",
+    ), rebuilds_tables=True),
+    Migration(7, "One vote per respondent", (
+        add_column("surveys", "one_vote_per_respondent", "BOOLEAN NOT NULL DEFAULT 0"),
+        add_column("survey_responses", "respondent_hash", "VARCHAR(32)"),
+        "CREATE UNIQUE INDEX IF NOT EXISTS uq_survey_responses_respondent "
+        "ON survey_responses (survey_id, respondent_hash) WHERE respondent_hash IS NOT NULL",
+    )),
+    Migration(8, "Unique respondent sketches", (
+        create_table("survey_respondent_sketches"),
+        rebuild_sketches,
+    )),
+)
+
+HEAD = MIGRATIONS[-1].version
+
+
+def schema_version(connection: Connection) -> int:
+    """Return the schema version stored in the database."""
+    return connection.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def upgrade(engine: Engine | None = None) -> list[int]:
+    """Apply pending migrations in order; returns the versions applied."""
+    engine = engine or db.engine
+    applied = []
+    for migration in MIGRATIONS:
+        # The driver's implicit transactions do not cover DDL, and the
+        # foreign_keys pragma is ignored inside a transaction, so each
+        # migration manages its own BEGIN/COMMIT.
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+            if schema_version(connection) >= migration.version:
+                continue
+            logger.info("Applying migration %d: %s", migration.version, migration.description)
+            enforced = connection.exec_driver_sql("PRAGMA foreign_keys").scalar()
+            if migration.rebuilds_tables:
+                connection.exec_driver_sql("PRAGMA foreign_keys = OFF")
+            try:
+                connection.exec_driver_sql("BEGIN IMMEDIATE")
+                try:
+                    for step in migration.steps:
+                        if callable(step):
+                            step(connection)
+                        else:
+                            connection.exec_driver_sql(step)
+                    if migration.rebuilds_tables:
+                        violations = connection.exec_driver_sql("PRAGMA foreign_key_check").all()
+                        if violations:
+                            tables = sorted({row[0] for row in violations})
+                            raise SchemaVersionError(
+                                f"Migration {migration.version} found {len(violations)} rows "
+                                f"with missing parents in {', '.join(tables)}"
+                            )
+                    connection.exec_driver_sql(f"PRAGMA user_version = {migration.version:d}")
+                except Exception:
+                    connection.exec_driver_sql("ROLLBACK")
+                    raise
+                connection.exec_driver_sql("COMMIT")
+            finally:
+                connection.exec_driver_sql(f"PRAGMA foreign_keys = {'ON' if enforced else 'OFF'}")
+        applied.append(migration.version)
+    return applied
+
+
+def stamp(engine: Engine, version: int) -> None:
+    """Record version as applied without running any migration."""
+    with engine.begin() as connection:
+        connection.exec_driver_sql(f"PRAGMA user_version = {version:d}")
+
+
+def ensure_schema(auto_migrate: bool, engine: Engine | None = None) -> list[int]:
+    """Check the stored schema version with one PRAGMA read; migrate if allowed.
+
+    A database already at HEAD costs nothing more. A new, empty database is
+    created from the models and stamped at HEAD; an older one is upgraded
+    when auto_migrate is set and rejected otherwise. Returns the migration
+    versions applied.
+    """
+    engine = engine or db.engine
+    with engine.connect() as connection:
+        version = schema_version(connection)
+        fresh = version == 0 and not inspect(connection).get_table_names()
+    if version == HEAD:
+        return []
+    if version > HEAD:
+        raise SchemaVersionError(f"Database schema version {version} is newer than this code (head {HEAD})")
+    if not auto_migrate:
+        raise SchemaVersionError(
+            f"Database schema version {version} is behind head {HEAD}; run 'flask migrate'"
+        )
+    db.metadata.create_all(engine)
+    if fresh:
+        stamp(engine, HEAD)
+        logger.info("Created schema at version %d", HEAD)
+        return []
+    return upgrade(engine)
@@ -6,6 +6,11 @@
 """Models package."""
 
 from src.models.user import User
-from src.models.survey import Survey, SurveyOption, SurveyResponse
+from src.models.cache import CacheGeneration
+from src.models.survey import (
+    Survey, SurveyOption, SurveyOptionTally, SurveyRespondentSketch, SurveyResponse, SurveyResponseRollup
+)
+from src.models.vote_batch import VoteBatch
 
-__all__ = ["User", "Survey", "SurveyOption", "SurveyResponse"]
+__all__ = ["User", "CacheGeneration", "Survey", "SurveyOption", "SurveyOptionTally", "SurveyRespondentSketch",
+           "SurveyResponse", "SurveyResponseRollup", "VoteBatch"]
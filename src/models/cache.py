@@ -0,0 +1,19 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Cache generation model."""
+
+from src.extensions import db
+
+
+class CacheGeneration(db.Model):
+    """Counter bumped whenever cached data of a given name changes.
+
+    Every worker process polls it to invalidate its in-process caches.
+    """
+    __tablename__ = "cache_generations"
+    
+    name = db.Column(db.String(64), primary_key=True)
+    generation = db.Column(db.Integer, nullable=False, default=0)
@@ -6,45 +6,172 @@
 """Survey models."""
 
 from datetime import datetime
+from sqlalchemy import DDL, event
 from src.extensions import db
 
 
 class Survey(db.Model):
     __tablename__ = "surveys"
+    __table_args__ = (
+        db.Index("ix_surveys_user_created", "user_id", db.desc("created_at")),
+    )
     
     id = db.Column("survey_id", db.Integer, primary_key=True)
-    user_id = db.Column(db.Integer, db.ForeignKey("users.user_id"), nullable=False)
+    user_id = db.Column(db.Integer, db.ForeignKey("users.user_id", ondelete="CASCADE"), nullable=False)
     title = db.Column(db.String(255), nullable=False)
     description = db.Column(db.Text)
     is_active = db.Column(db.Boolean, default=True)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    version = db.Column(db.Integer, nullable=False, default=1, server_default="1")
+    one_vote_per_respondent = db.Column(db.Boolean, nullable=False, default=False, server_default="0")
     
     user = db.relationship("User", back_populates="surveys")
-    options = db.relationship("SurveyOption", back_populates="survey", cascade="all, delete-orphan")
-    responses = db.relationship("SurveyResponse", back_populates="survey", cascade="all, delete-orphan")
+    # Children are removed by ON DELETE CASCADE; the ORM never loads them to delete.
+    options = db.relationship(
+        "SurveyOption", back_populates="survey", cascade="all, delete-orphan", passive_deletes=True
+    )
+    responses = db.relationship(
+        "SurveyResponse", back_populates="survey", cascade="all, delete-orphan", passive_deletes=True
+    )
+    
+    # Incremented on every ORM update; used as the HTTP cache validator.
+    __mapper_args__ = {"version_id_col": version}
 
 
 class SurveyOption(db.Model):
     __tablename__ = "survey_options"
+    __table_args__ = (
+        db.Index("ix_survey_options_survey_order", "survey_id", "option_order"),
+    )
     
     id = db.Column("option_id", db.Integer, primary_key=True)
-    survey_id = db.Column(db.Integer, db.ForeignKey("surveys.survey_id"), nullable=False)
+    survey_id = db.Column(db.Integer, db.ForeignKey("surveys.survey_id", ondelete="CASCADE"), nullable=False)
     option_text = db.Column(db.String(255), nullable=False)
     option_order = db.Column(db.Integer, nullable=False)
     
     survey = db.relationship("Survey", back_populates="options")
-    responses = db.relationship("SurveyResponse", back_populates="option", cascade="all, delete-orphan")
+    responses = db.relationship(
+        "SurveyResponse", back_populates="option", cascade="all, delete-orphan", passive_deletes=True
+    )
+    tally = db.relationship(
+        "SurveyOptionTally", uselist=False, cascade="all, delete-orphan", passive_deletes=True
+    )
 
 
 class SurveyResponse(db.Model):
     __tablename__ = "survey_responses"
+    __table_args__ = (
+        db.Index("ix_survey_responses_survey_option", "survey_id", "option_id"),
+        db.Index("ix_survey_responses_survey_date", "survey_id", "response_date"),
+        # Lets ON DELETE CASCADE from survey_options find responses without a scan.
+        db.Index("ix_survey_responses_option", "option_id"),
+        # One vote per respondent; only surveys in that mode set respondent_hash.
+        db.Index(
+            "uq_survey_responses_respondent", "survey_id", "respondent_hash",
+            unique=True, sqlite_where=db.text("respondent_hash IS NOT NULL")
+        ),
+    )
     
     id = db.Column("response_id", db.Integer, primary_key=True)
-    survey_id = db.Column(db.Integer, db.ForeignKey("surveys.survey_id"), nullable=False)
-    option_id = db.Column(db.Integer, db.ForeignKey("survey_options.option_id"), nullable=False)
+    survey_id = db.Column(db.Integer, db.ForeignKey("surveys.survey_id", ondelete="CASCADE"), nullable=False)
+    option_id = db.Column(
+        db.Integer, db.ForeignKey("survey_options.option_id", ondelete="CASCADE"), nullable=False
+    )
     respondent_email = db.Column(db.String(255))
+    respondent_hash = db.Column(db.String(32))
     response_date = db.Column(db.DateTime, default=datetime.utcnow)
     
     survey = db.relationship("Survey", back_populates="responses")
     option = db.relationship("SurveyOption", back_populates="responses")
+
+
+class SurveyOptionTally(db.Model):
+    """Denormalized vote count per option.
+
+    Maintained by a database trigger in the same transaction as each
+    response insert; ``src.tallies.reconcile_tallies`` rebuilds it.
+    """
+    __tablename__ = "survey_option_tallies"
+    __table_args__ = (
+        db.Index("ix_survey_option_tallies_survey", "survey_id"),
+    )
+    
+    option_id = db.Column(
+        db.Integer, db.ForeignKey("survey_options.option_id", ondelete="CASCADE"), primary_key=True
+    )
+    survey_id = db.Column(db.Integer, nullable=False)
+    vote_count = db.Column(db.Integer, nullable=False, default=0)
+    last_response_at = db.Column(db.DateTime)
+
+
+TALLY_TRIGGER = (
+    "CREATE TRIGGER IF NOT EXISTS survey_responses_tally_insert "
+    "AFTER INSERT ON survey_responses BEGIN "
+    "INSERT INTO survey_option_tallies (option_id, survey_id, vote_count, last_response_at) "
+    "VALUES (NEW.option_id, NEW.survey_id, 1, NEW.response_date) "
+    "ON CONFLICT (option_id) DO UPDATE SET vote_count = vote_count + 1, "
+    "last_response_at = CASE WHEN last_response_at IS NULL "
+    "OR excluded.last_response_at > last_response_at "
+    "THEN excluded.last_response_at ELSE last_response_at END; "
+    "END"
+)
+
+event.listen(db.metadata, "after_create", DDL(TALLY_TRIGGER))
+
+
+class SurveyResponseRollup(db.Model):
+    """Vote counts per option per hour and per day.
+
+    Maintained by a database trigger as responses arrive, like the tallies;
+    ``src.trends.rebuild_rollups`` backfills it from survey_responses.
+    """
+    __tablename__ = "survey_response_rollups"
+    __table_args__ = (
+        db.Index("ix_survey_response_rollups_option", "option_id"),
+    )
+    
+    survey_id = db.Column(db.Integer, primary_key=True)
+    granularity = db.Column(db.String(8), primary_key=True)
+    bucket = db.Column(db.DateTime, primary_key=True)
+    option_id = db.Column(
+        db.Integer, db.ForeignKey("survey_options.option_id", ondelete="CASCADE"), primary_key=True
+    )
+    vote_count = db.Column(db.Integer, nullable=False, default=0)
+
+
+# strftime formats that truncate a stored DateTime to the start of its bucket,
+# written in SQLAlchemy's SQLite DateTime storage format.
+ROLLUP_BUCKETS = {
+    "hour": "%Y-%m-%d %H:00:00.000000",
+    "day": "%Y-%m-%d 00:00:00.000000",
+}
+
+ROLLUP_TRIGGER = (
+    "CREATE TRIGGER IF NOT EXISTS survey_responses_rollup_insert "
+    "AFTER INSERT ON survey_responses WHEN NEW.response_date IS NOT NULL BEGIN "
+    + "".join(
+        "INSERT INTO survey_response_rollups (survey_id, granularity, bucket, option_id, vote_count) "
+        f"VALUES (NEW.survey_id, '{granularity}', strftime('{fmt}', NEW.response_date), NEW.option_id, 1) "
+        "ON CONFLICT (survey_id, granularity, bucket, option_id) DO UPDATE SET vote_count = vote_count + 1; "
+        for granularity, fmt in ROLLUP_BUCKETS.items()
+    )
+    + "END"
+)
+
+# DDL applies %-formatting, so the strftime patterns need escaping there.
+event.listen(db.metadata, "after_create", DDL(ROLLUP_TRIGGER.replace("%", "%%")))
+
+
+class SurveyRespondentSketch(db.Model):
+    """HyperLogLog sketch of distinct respondent emails per survey.
+
+    Updated with each insert by ``src.ingest.insert_votes``;
+    ``src.unique_respondents.rebuild_sketches`` recomputes it.
+    """
+    __tablename__ = "survey_respondent_sketches"
+    
+    survey_id = db.Column(
+        db.Integer, db.ForeignKey("surveys.survey_id", ondelete="CASCADE"), primary_key=True
+    )
+    registers = db.Column(db.LargeBinary, nullable=False)
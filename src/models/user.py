@@ -19,4 +19,6 @@ class User(UserMixin, db.Model):
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     last_login = db.Column(db.DateTime)
     
-    surveys = db.relationship("Survey", back_populates="user", cascade="all, delete-orphan")
+    surveys = db.relationship(
+        "Survey", back_populates="user", cascade="all, delete-orphan", passive_deletes=True
+    )
@@ -0,0 +1,23 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Vote batch model."""
+
+from datetime import datetime
+from src.extensions import db
+
+
+class VoteBatch(db.Model):
+    """A bulk vote submission, remembered so a retried batch is applied once."""
+    __tablename__ = "vote_batches"
+    __table_args__ = (
+        db.UniqueConstraint("survey_id", "idempotency_key", name="uq_vote_batches_survey_key"),
+    )
+    
+    id = db.Column("batch_id", db.Integer, primary_key=True)
+    survey_id = db.Column(db.Integer, db.ForeignKey("surveys.survey_id", ondelete="CASCADE"), nullable=False)
+    idempotency_key = db.Column(db.String(64), nullable=False)
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    result = db.Column(db.Text, nullable=False)
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Password hashing with tunable parameters and an optional bounded process pool."""
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Callable
+from flask import Flask
+from werkzeug.security import check_password_hash, generate_password_hash
+
+
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the hashing pool is saturated and the request should back off."""
+
+
+class PasswordHasher:
+    """Hashes and verifies passwords with the configured werkzeug method.
+
+    With workers > 0 the CPU-heavy work runs in a per-worker process pool.
+    Inline or pooled, at most max_pending threads of a worker may be hashing;
+    beyond that callers get PasswordHasherBusy instead of waiting, so a login
+    storm cannot occupy every request thread. The limit is per process, so it
+    only sheds load under threaded workers (gunicorn gthread).
+    """
+
+    def __init__(self, method: str, salt_length: int, workers: int = 0,
+                 max_pending: int = 8, timeout: float = 10.0) -> None:
+        self.method = method
+        self.salt_length = salt_length
+        self.workers = workers
+        self.timeout = timeout
+        self._slots = threading.BoundedSemaphore(max(1, max_pending))
+        self._executor: ProcessPoolExecutor | None = None
+        self._pid = os.getpid()
+        self._prefix: str | None = None
+        self._lock = threading.Lock()
+
+    def hash(self, password: str) -> str:
+        """Hash a password with the configured method."""
+        return self._run(generate_password_hash, password, self.method, self.salt_length)
+
+    def verify(self, pwhash: str, password: str) -> bool:
+        """Check a password against a stored hash."""
+        return self._run(check_password_hash, pwhash, password)
+
+    def needs_rehash(self, pwhash: str) -> bool:
+        """True when a stored hash was made with different parameters."""
+        params, _, rest = pwhash.partition("$")
+        salt = rest.partition("$")[0]
+        return params != self.method_prefix or len(salt) != self.salt_length
+
+    @property
+    def method_prefix(self) -> str:
+        """The full parameter string werkzeug records for the configured method."""
+        if self._prefix is None:
+            self._prefix = generate_password_hash("", self.method, self.salt_length).partition("$")[0]
+        return self._prefix
+
+    def shutdown(self) -> None:
+        """Stop the process pool, if one was started."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def _pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            # Pools cannot be shared across fork; each worker starts its own.
+            if self._executor is None or self._pid != os.getpid():
+                self._pid = os.getpid()
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+                )
+            return self._executor
+
+    def _run(self, func: Callable[..., Any], *args: Any) -> Any:
+        if not self._slots.acquire(blocking=False):
+            raise PasswordHasherBusy("Password hashing is saturated")
+        try:
+            if self.workers <= 0:
+                return func(*args)
+            return self._pool().submit(func, *args).result(self.timeout)
+        except FutureTimeoutError as exc:
+            raise PasswordHasherBusy("Password hashing timed out") from exc
+        finally:
+            self._slots.release()
+
+
+def init_app(app: Flask) -> None:
+    """Create the app's password hasher from configuration."""
+    app.extensions["password_hasher"] = PasswordHasher(
+        app.config["PASSWORD_HASH_METHOD"],
+        app.config["PASSWORD_SALT_LENGTH"],
+        workers=app.config["PASSWORD_HASH_WORKERS"],
+        max_pending=app.config["PASSWORD_HASH_MAX_PENDING"],
+        timeout=app.config["PASSWORD_HASH_TIMEOUT"],
+    )
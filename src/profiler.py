@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Development/staging request profiler: per-request SQL log and N+1 detection."""
+
+import cProfile
+import logging
+import random
+import re
+import sys
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from flask import Flask, Response, g, has_request_context, request
+from sqlalchemy import event
+from src.extensions import db
+
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+_IN_LIST = re.compile(r"\(\?(?:\s*,\s*\?)*\)")
+_PROFILER_FILES = {__file__}
+
+
+@dataclass
+class QueryRecord:
+    """One SQL statement run during a request."""
+    statement: str
+    duration: float
+    caller: str
+
+
+@dataclass
+class RequestProfile:
+    """Everything the profiler saw during one request."""
+    started: float
+    queries: list[QueryRecord] = field(default_factory=list)
+    profile: cProfile.Profile | None = None
+
+    @property
+    def sql_time(self) -> float:
+        return sum(query.duration for query in self.queries)
+
+    def repeated(self, threshold: int) -> list[tuple[str, int, str]]:
+        """Statement shapes run at least threshold times: (shape, count, first caller)."""
+        counts = Counter(statement_shape(query.statement) for query in self.queries)
+        callers: dict[str, str] = {}
+        for query in self.queries:
+            callers.setdefault(statement_shape(query.statement), query.caller)
+        return [
+            (shape, count, callers[shape])
+            for shape, count in counts.most_common() if count >= threshold
+        ]
+
+
+def statement_shape(statement: str) -> str:
+    """Normalize a statement so calls differing only in parameters compare equal."""
+    return _IN_LIST.sub("(?...)", " ".join(statement.split()))
+
+
+def calling_site() -> str:
+    """The innermost template or application frame that led to the current query."""
+    frame = sys._getframe(1)
+    while frame is not None:
+        filename = frame.f_code.co_filename
+        if filename.endswith(".html"):
+            return f"template {Path(filename).name}"
+        if (filename not in _PROFILER_FILES and filename.startswith(str(PROJECT_ROOT))
+                and "site-packages" not in filename):
+            relative = Path(filename).relative_to(PROJECT_ROOT)
+            return f"{relative}:{frame.f_lineno} in {frame.f_code.co_name}"
+        frame = frame.f_back
+    return "unknown"
+
+
+def init_app(app: Flask) -> None:
+    """Install the profiler when PROFILER_ENABLED is set."""
+    if not app.config["PROFILER_ENABLED"]:
+        return
+    threshold = app.config["PROFILER_REPEAT_THRESHOLD"]
+    slow = app.config["PROFILER_SLOW_MS"] / 1000
+    sample_rate = app.config["PROFILER_SAMPLE_RATE"]
+    directory = Path(app.config["PROFILER_DIR"])
+
+    @app.before_request
+    def start_profile() -> None:
+        current = RequestProfile(time.perf_counter())
+        if sample_rate > 0 and random.random() < sample_rate:
+            current.profile = cProfile.Profile()
+            try:
+                current.profile.enable()
+            except ValueError:
+                # Another profiler is already active in this process.
+                current.profile = None
+        g.request_profile = current
+
+    @app.after_request
+    def finish_profile(response: Response) -> Response:
+        current: RequestProfile | None = g.pop("request_profile", None)
+        if current is None:
+            return response
+        if current.profile is not None:
+            current.profile.disable()
+        elapsed = time.perf_counter() - current.started
+        repeated = current.repeated(threshold)
+
+        response.headers["X-Query-Count"] = str(len(current.queries))
+        response.headers["X-Query-Repeats"] = str(len(repeated))
+        response.headers.add(
+            "Server-Timing",
+            f'db;dur={current.sql_time * 1000:.2f};desc="{len(current.queries)} queries", '
+            f"app;dur={elapsed * 1000:.2f}"
+        )
+
+        logger.info(
+            "%s %s %s %.1fms: %d queries in %.1fms",
+            request.method, request.path, response.status_code,
+            elapsed * 1000, len(current.queries), current.sql_time * 1000
+        )
+        for shape, count, caller in repeated:
+            logger.warning("Possible N+1 on %s: %d x %s (first from %s)",
+                           request.endpoint, count, shape[:200], caller)
+        for query in current.queries:
+            logger.debug("  %.2fms %s [%s]", query.duration * 1000, query.statement, query.caller)
+
+        if current.profile is not None and elapsed >= slow:
+            directory.mkdir(parents=True, exist_ok=True)
+            path = directory / (
+                f"{datetime.utcnow():%Y%m%dT%H%M%S%f}-{request.endpoint or 'unmatched'}"
+                f"-{elapsed * 1000:.0f}ms.prof"
+            )
+            current.profile.dump_stats(path)
+            logger.warning("Slow request %s %s (%.0fms) profiled to %s",
+                           request.method, request.path, elapsed * 1000, path)
+        return response
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        conn.info.setdefault("profiler_started", []).append(time.perf_counter())
+
+    def after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+        started = conn.info["profiler_started"].pop()
+        current = g.get("request_profile") if has_request_context() else None
+        if current is not None:
+            current.queries.append(QueryRecord(statement, time.perf_counter() - started, calling_site()))
+
+    with app.app_context():
+        event.listen(db.engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(db.engine, "after_cursor_execute", after_cursor_execute)
@@ -0,0 +1,127 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Stateless protection for the public vote form, and a shared page cache.
+
+In "signed" mode the form carries a token naming the survey and the current
+time window, signed with SECRET_KEY. Every visitor in a window gets the
+same token without a session cookie, so the anonymous page is identical for
+all of them: it is rendered once per worker and may be cached downstream.
+A token stays valid for one to two windows. "session" mode keeps Flask-WTF's
+per-session CSRF token. Owner pages always use Flask-WTF.
+"""
+
+import hashlib
+import time
+from typing import Callable
+from flask import Flask, current_app, session
+from flask_login import current_user
+from flask_wtf.csrf import CSRFError
+from itsdangerous import BadSignature, Signer
+from src.cache import TTLCache
+from src.extensions import csrf
+
+PROTECTION_MODES = ("session", "signed")
+
+
+class SignedFormTokens:
+    """Per-survey form tokens that change once per window."""
+
+    def __init__(self, secret_key: str, window: int, clock: Callable[[], float] = time.time) -> None:
+        if window < 1:
+            raise ValueError("window must be at least one second")
+        self.window = window
+        self.clock = clock
+        self._signer = Signer(secret_key, salt="survey-vote-form", digest_method=hashlib.sha256)
+
+    def current_window(self) -> int:
+        return int(self.clock() // self.window)
+
+    def issue(self, survey_id: int) -> str:
+        """The token for survey_id in the current window."""
+        return self._signer.sign(f"{survey_id}:{self.current_window()}").decode()
+
+    def verify(self, survey_id: int, token: str) -> bool:
+        """True if token was issued for survey_id in this window or the previous one."""
+        try:
+            value = self._signer.unsign(token).decode()
+        except (BadSignature, UnicodeError):
+            return False
+        token_survey, _, window = value.partition(":")
+        if token_survey != str(survey_id) or not window.isdigit():
+            return False
+        return 0 <= self.current_window() - int(window) <= 1
+
+
+def init_app(app: Flask) -> None:
+    """Set up signed tokens and the shared page cache when configured."""
+    mode = app.config["PUBLIC_FORM_PROTECTION"]
+    if mode not in PROTECTION_MODES:
+        raise ValueError(f"PUBLIC_FORM_PROTECTION must be one of {', '.join(PROTECTION_MODES)}")
+    if mode == "signed":
+        window = app.config["PUBLIC_FORM_TOKEN_WINDOW"]
+        app.extensions["form_tokens"] = SignedFormTokens(app.config["SECRET_KEY"], window)
+        app.extensions["public_pages"] = TTLCache(app.config["SURVEY_CACHE_SIZE"], window)
+
+
+def _tokens() -> SignedFormTokens | None:
+    return current_app.extensions.get("form_tokens")
+
+
+def signed() -> bool:
+    """True when public forms carry signed, time-windowed tokens."""
+    return _tokens() is not None
+
+
+def form_token(survey_id: int) -> str | None:
+    """The signed token to embed in the form, or None in session mode."""
+    tokens = _tokens()
+    return tokens.issue(survey_id) if tokens is not None else None
+
+
+def token_window() -> int:
+    """Index of the current token window, for cache validators."""
+    tokens = _tokens()
+    if tokens is not None:
+        return tokens.current_window()
+    limit = current_app.config.get("WTF_CSRF_TIME_LIMIT") or 0
+    return int(time.time() // (limit / 2)) if limit else 0
+
+
+def protect(survey_id: int, token: str | None) -> None:
+    """Validate a vote submission; raises CSRFError (400) when it fails."""
+    if not current_app.config.get("WTF_CSRF_ENABLED", True):
+        return
+    tokens = _tokens()
+    if tokens is None:
+        csrf.protect()
+    elif not token or not tokens.verify(survey_id, token):
+        raise CSRFError("The survey form has expired. Reload the page and try again.")
+
+
+def shareable() -> bool:
+    """True when the page about to be rendered is the same for every visitor."""
+    return (
+        signed()
+        and not current_user.is_authenticated
+        and "_flashes" not in session
+    )
+
+
+def shared_page(survey_id: int, version: int, render: Callable[[], str]) -> str:
+    """Rendered anonymous page for this survey version and token window."""
+    pages: TTLCache = current_app.extensions["public_pages"]
+    key = (survey_id, version, token_window())
+    html = pages.get(key)
+    if html is None:
+        html = render()
+        pages.set(key, html)
+    return html
+
+
+def cache_control() -> str:
+    """Cache-Control for a shareable page; never outlives its token."""
+    max_age = min(current_app.config["PUBLIC_PAGE_MAX_AGE"], current_app.config["PUBLIC_FORM_TOKEN_WINDOW"])
+    return f"public, max-age={max_age}"
@@ -0,0 +1,24 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""EXPLAIN QUERY PLAN helpers for catching full table scans."""
+
+from typing import Any
+from sqlalchemy import Connection
+
+
+def explain(connection: Connection, statement: str, parameters: Any = ()) -> list[str]:
+    """Return the EXPLAIN QUERY PLAN detail lines for a statement."""
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+    return [row[-1] for row in rows]
+
+
+def full_scans(plan: list[str]) -> list[str]:
+    """Return the plan lines that scan a table without an index."""
+    return [
+        line for line in plan
+        if line.startswith("SCAN ") and " USING " not in line
+        and not line.startswith(("SCAN CONSTANT", "SCAN (subquery"))
+    ]
@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Host-wide token-bucket limits on public vote submissions.
+
+Buckets live in a small SQLite sidecar file that every worker on the host
+opens, so the limits hold across gunicorn processes. The check runs as WSGI
+middleware: a rejected POST /s/<id> never reaches Flask's session, CSRF or
+ORM handling. Clients are keyed by REMOTE_ADDR, which is the forwarded
+client address once PROXY_FIX_X_FOR trusts the proxies in front.
+"""
+
+import logging
+import math
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Callable, Iterable
+from flask import Flask
+
+logger = logging.getLogger(__name__)
+
+VOTE_PATH = re.compile(r"^/s/(\d+)$")
+# Waiting longer than this for the sidecar's lock lets the request through.
+BUSY_TIMEOUT = 0.1
+PRUNE_INTERVAL = 60.0
+
+SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS buckets ("
+    "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL) WITHOUT ROWID"
+)
+# Refill, then take one token, in one atomic statement; no row comes back
+# when the bucket is empty.
+TAKE = (
+    "INSERT INTO buckets (key, tokens, updated) VALUES (:key, :burst - 1, :now) "
+    "ON CONFLICT (key) DO UPDATE SET "
+    "tokens = MIN(:burst, tokens + MAX(:now - updated, 0) * :rate) - 1, updated = :now "
+    "WHERE MIN(:burst, tokens + MAX(:now - updated, 0) * :rate) >= 1 "
+    "RETURNING tokens"
+)
+
+
+class TokenBucketStore:
+    """Token buckets in a SQLite file shared by every process on the host."""
+
+    def __init__(self, path: str, clock: Callable[[], float] = time.time) -> None:
+        self.path = path
+        self.clock = clock
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid = os.getpid()
+        self._pruned_at = 0.0
+
+    def _connect(self) -> sqlite3.Connection:
+        # A worker forked from a preloaded master opens its own connection.
+        if self._connection is None or self._pid != os.getpid():
+            self._pid = os.getpid()
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(
+                self.path, timeout=BUSY_TIMEOUT, isolation_level=None, check_same_thread=False
+            )
+            connection.execute("PRAGMA journal_mode = WAL")
+            connection.execute("PRAGMA synchronous = OFF")
+            connection.execute(SCHEMA)
+            self._connection = connection
+        return self._connection
+
+    def take(self, key: str, rate: float, burst: int) -> bool:
+        """Take one token from key's bucket; False if it is empty."""
+        now = self.clock()
+        with self._lock:
+            connection = self._connect()
+            row = connection.execute(TAKE, {"key": key, "burst": burst, "rate": rate, "now": now}).fetchone()
+            return row is not None
+
+    def refund(self, key: str, burst: int) -> None:
+        """Return a token taken from key's bucket."""
+        with self._lock:
+            self._connect().execute(
+                "UPDATE buckets SET tokens = MIN(?, tokens + 1) WHERE key = ?", (burst, key)
+            )
+
+    def prune(self, max_idle: float) -> int:
+        """Delete buckets idle long enough to have refilled; returns rows removed."""
+        with self._lock:
+            cursor = self._connect().execute("DELETE FROM buckets WHERE updated < ?", (self.clock() - max_idle,))
+            self._pruned_at = self.clock()
+            return cursor.rowcount
+
+    def due_for_prune(self) -> bool:
+        return self.clock() - self._pruned_at >= PRUNE_INTERVAL
+
+
+class RateLimitMiddleware:
+    """WSGI middleware answering 429 to vote POSTs over the client or survey limit."""
+
+    def __init__(self, wsgi_app: Callable, app: Flask, store: TokenBucketStore) -> None:
+        self.wsgi_app = wsgi_app
+        self.app = app
+        self.store = store
+
+    def __call__(self, environ: dict, start_response: Callable) -> Iterable[bytes]:
+        if environ.get("REQUEST_METHOD") == "POST" and self.app.config["RATE_LIMIT_ENABLED"]:
+            match = VOTE_PATH.match(environ.get("PATH_INFO", ""))
+            if match:
+                retry_after = self.check(match.group(1), environ.get("REMOTE_ADDR") or "unknown")
+                if retry_after:
+                    return self._reject(start_response, retry_after)
+        return self.wsgi_app(environ, start_response)
+
+    def check(self, survey_id: str, client: str) -> int:
+        """Seconds the client should wait, or 0 if the vote may proceed."""
+        config = self.app.config
+        limits = [
+            (key, rate, burst) for key, rate, burst in (
+                (f"client:{client}:{survey_id}", config["RATE_LIMIT_CLIENT_RATE"], config["RATE_LIMIT_CLIENT_BURST"]),
+                (f"survey:{survey_id}", config["RATE_LIMIT_SURVEY_RATE"], config["RATE_LIMIT_SURVEY_BURST"]),
+            ) if rate > 0
+        ]
+        try:
+            taken = []
+            for key, rate, burst in limits:
+                if not self.store.take(key, rate, burst):
+                    # A vote refused by the survey limit must not use up the client's tokens.
+                    for taken_key, taken_burst in taken:
+                        self.store.refund(taken_key, taken_burst)
+                    metrics = self.app.extensions.get("metrics")
+                    if metrics is not None:
+                        metrics.inc("rate_limited_total", limit=key.split(":", 1)[0])
+                    return max(1, math.ceil(1 / rate))
+                taken.append((key, burst))
+            if limits and self.store.due_for_prune():
+                self.store.prune(max(burst / rate for _, rate, burst in limits))
+        except (OSError, sqlite3.Error) as exc:
+            # Fail open: a stuck sidecar must not take voting down with it.
+            logger.warning("Rate limiter unavailable, allowing request: %s", exc)
+        return 0
+
+    @staticmethod
+    def _reject(start_response: Callable, retry_after: int) -> list[bytes]:
+        body = b"Too many responses, please slow down"
+        start_response("429 Too Many Requests", [
+            ("Content-Type", "text/plain; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+            ("Retry-After", str(retry_after)),
+            ("Cache-Control", "no-store"),
+        ])
+        return [body]
+
+
+def init_app(app: Flask) -> None:
+    """Put the vote rate limiter in front of the application."""
+    if app.config["RATE_LIMIT_ENABLED"] and not app.config["PROXY_FIX_X_FOR"] \
+            and app.config["RATE_LIMIT_CLIENT_RATE"] > 0:
+        logger.warning(
+            "Vote rate limits key clients on the connecting address (PROXY_FIX_X_FOR=0); "
+            "behind a proxy every voter shares one bucket"
+        )
+    store = TokenBucketStore(app.config["RATE_LIMIT_DB"])
+    app.extensions["rate_limit"] = store
+    app.wsgi_app = RateLimitMiddleware(app.wsgi_app, app, store)
@@ -0,0 +1,178 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""One vote per respondent, screened by a per-worker Bloom filter.
+
+Surveys with one_vote_per_respondent store a keyed hash of each respondent
+(their email, or the client address when they give none) in
+survey_responses.respondent_hash, where a partial unique index allows one
+vote each. In front of the index every worker keeps a fixed-size Bloom
+filter of (survey, respondent) pairs, loaded from the index at startup,
+and an exact LRU of respondents it knows have voted:
+
+- not in the filter: not seen by this worker; the vote goes to the
+  database, where the unique index has the final say;
+- in the LRU: rejected without touching the database;
+- in the filter only: confirmed with one indexed read, since the filter
+  can give false positives.
+
+The client address is only a reliable key when clients connect directly or
+PROXY_FIX_X_FOR trusts the proxies in front; otherwise every anonymous
+respondent behind a proxy shares its address and only the first can vote.
+"""
+
+import hashlib
+import hmac
+import logging
+import math
+import threading
+from typing import Iterable
+from flask import Flask, current_app
+from sqlalchemy import select
+from src.cache import TTLCache
+from src.extensions import db
+from src.models import SurveyResponse
+
+logger = logging.getLogger(__name__)
+
+# Confirmed voters are remembered for this long in each worker.
+CONFIRMED_TTL = 3600.0
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter sized for capacity items at error_rate."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        if capacity < 1 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate between 0 and 1")
+        self.capacity = capacity
+        self.size = max(8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hashes = max(1, round(self.size / capacity * math.log(2)))
+        self._bits = bytearray((self.size + 7) // 8)
+        self._lock = threading.Lock()
+        self.count = 0
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + i * second) % self.size for i in range(self.hashes))
+
+    def add(self, key: str) -> None:
+        with self._lock:
+            for position in self._positions(key):
+                self._bits[position >> 3] |= 1 << (position & 7)
+            self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        bits = self._bits
+        return all(bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def saturated(self) -> bool:
+        """True once more than capacity items were added; false positives rise past error_rate."""
+        return self.count > self.capacity
+
+
+class RespondentIndex:
+    """This worker's view of who has voted in one-vote surveys."""
+
+    def __init__(self, capacity: int, error_rate: float, confirmed_size: int) -> None:
+        self.filter = BloomFilter(capacity, error_rate)
+        self.confirmed = TTLCache(confirmed_size, CONFIRMED_TTL)
+
+    @staticmethod
+    def _key(survey_id: int, respondent: str) -> str:
+        return f"{survey_id}:{respondent}"
+
+    def add(self, survey_id: int, respondent: str, confirmed: bool = True) -> None:
+        key = self._key(survey_id, respondent)
+        self.filter.add(key)
+        if confirmed:
+            self.confirmed.set(key, True)
+
+    def has_voted(self, survey_id: int, respondent: str) -> bool:
+        """True if respondent has a vote in survey_id (filtered, then confirmed)."""
+        key = self._key(survey_id, respondent)
+        if key not in self.filter:
+            return False
+        if self.confirmed.get(key):
+            return True
+        found = db.session.scalar(
+            select(SurveyResponse.id)
+            .where(SurveyResponse.survey_id == survey_id, SurveyResponse.respondent_hash == respondent)
+            .limit(1)
+        )
+        if found is None:
+            return False
+        self.confirmed.set(key, True)
+        return True
+
+    def load(self) -> int:
+        """Fill the filter from the unique index, up to its capacity; returns rows read."""
+        query = (
+            select(SurveyResponse.survey_id, SurveyResponse.respondent_hash)
+            .where(SurveyResponse.respondent_hash.is_not(None))
+            .limit(self.filter.capacity)
+            .execution_options(yield_per=10000)
+        )
+        loaded = 0
+        for survey_id, respondent in db.session.execute(query):
+            self.filter.add(self._key(survey_id, respondent))
+            loaded += 1
+        if loaded >= self.filter.capacity:
+            logger.warning("Respondent filter is full (%d entries); raise RESPONDENT_FILTER_CAPACITY", loaded)
+        return loaded
+
+
+def init_app(app: Flask) -> None:
+    """Create this worker's respondent filter; load_index fills it."""
+    app.extensions["respondents"] = RespondentIndex(
+        capacity=app.config["RESPONDENT_FILTER_CAPACITY"],
+        error_rate=app.config["RESPONDENT_FILTER_ERROR_RATE"],
+        confirmed_size=app.config["RESPONDENT_CONFIRMED_CACHE_SIZE"],
+    )
+
+
+def load_index(app: Flask) -> int:
+    """Rebuild the filter from the database; call once the schema is current."""
+    loaded = app.extensions["respondents"].load()
+    logger.info("Loaded %d respondents into the duplicate vote filter", loaded)
+    return loaded
+
+
+def respondent_key(email: str | None, client: str | None) -> str | None:
+    """Keyed hash identifying a respondent by email, else by client address."""
+    if email:
+        identity = "email:" + email.strip().lower()
+    elif client:
+        identity = "client:" + client
+    else:
+        return None
+    secret = current_app.config["SECRET_KEY"].encode()
+    return hmac.new(secret, identity.encode(), hashlib.sha256).hexdigest()[:32]
+
+
+def has_voted(survey_id: int, respondent: str) -> bool:
+    """True if this respondent already voted in survey_id."""
+    return current_app.extensions["respondents"].has_voted(survey_id, respondent)
+
+
+def record_vote(survey_id: int, respondent: str) -> None:
+    """Remember an accepted (or rejected duplicate) vote in this worker."""
+    current_app.extensions["respondents"].add(survey_id, respondent)
+
+
+def existing_respondents(survey_id: int, respondents: list[str], chunk_size: int = 500) -> set[str]:
+    """Which of respondents already voted in survey_id, read from the index."""
+    found: set[str] = set()
+    for start in range(0, len(respondents), chunk_size):
+        found.update(db.session.scalars(
+            select(SurveyResponse.respondent_hash).where(
+                SurveyResponse.survey_id == survey_id,
+                SurveyResponse.respondent_hash.in_(respondents[start:start + chunk_size]),
+            )
+        ))
+    return found
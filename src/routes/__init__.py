@@ -5,8 +5,9 @@
 
 """Routes package."""
 
+from src.routes.api import api_bp
 from src.routes.auth import auth_bp
 from src.routes.surveys import surveys_bp
 from src.routes.pages import pages_bp
 
-__all__ = ["auth_bp", "surveys_bp", "pages_bp"]
+__all__ = ["api_bp", "auth_bp", "surveys_bp", "pages_bp"]
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""JSON API routes."""
+
+from flask import Blueprint, current_app, jsonify, request, Response
+from flask_login import current_user
+from src import export
+from src.extensions import csrf
+from src.live_results import tally_payloads
+from src.models import Survey
+from src.survey_cache import get_definition
+from src.trends import GRANULARITIES, trend_series
+from src.vote_batches import BatchConflictError, submit_batch
+
+api_bp = Blueprint("api", __name__, url_prefix="/api")
+
+# Session-authenticated, but only application/json bodies are accepted, which
+# a cross-site form cannot send without a CORS preflight.
+csrf.exempt(api_bp)
+
+
+def _error(message: str, status: int) -> tuple[Response, int]:
+    return jsonify({"error": message}), status
+
+
+@api_bp.route("/surveys/<int:survey_id>/responses/batch", methods=["POST"])
+def submit_responses(survey_id: int) -> Response | tuple[Response, int]:
+    """Record a batch of offline votes for one of the current user's surveys."""
+    if not current_user.is_authenticated:
+        return _error("Authentication required", 401)
+    if not request.is_json:
+        return _error("Expected an application/json body", 415)
+    
+    survey = Survey.query.filter_by(id=survey_id, user_id=current_user.id).first()
+    definition = get_definition(survey_id) if survey else None
+    if not definition:
+        return _error("Survey not found", 404)
+    if not definition.is_active:
+        return _error("Survey is inactive", 409)
+    
+    payload = request.get_json(silent=True)
+    records = payload.get("responses") if isinstance(payload, dict) else None
+    if not isinstance(records, list):
+        return _error("Body must be an object with a 'responses' list", 400)
+    max_records = current_app.config["VOTE_BATCH_MAX_RECORDS"]
+    if len(records) > max_records:
+        return _error(f"At most {max_records} responses per batch", 413)
+    
+    idempotency_key = request.headers.get("Idempotency-Key", "").strip() or None
+    if idempotency_key and len(idempotency_key) > 64:
+        return _error("Idempotency-Key must be at most 64 characters", 400)
+    
+    try:
+        summary, replayed = submit_batch(
+            survey_id, records, definition.option_ids, idempotency_key,
+            current_app.config["VOTE_BATCH_CHUNK_SIZE"], definition.one_vote_per_respondent
+        )
+    except BatchConflictError as exc:
+        return _error(str(exc), 409)
+    response = jsonify(summary)
+    if replayed:
+        response.headers["Idempotent-Replayed"] = "true"
+    return response
+
+
+@api_bp.route("/surveys/<int:survey_id>/trend")
+def survey_trend(survey_id: int) -> Response | tuple[Response, int]:
+    """Votes per option per hour or day for one of the current user's surveys."""
+    if not current_user.is_authenticated:
+        return _error("Authentication required", 401)
+    
+    survey = Survey.query.filter_by(id=survey_id, user_id=current_user.id).first()
+    if not survey:
+        return _error("Survey not found", 404)
+    
+    granularity = request.args.get("granularity", "day")
+    if granularity not in GRANULARITIES:
+        return _error(f"granularity must be one of {', '.join(GRANULARITIES)}", 400)
+    try:
+        start = export.parse_bound(request.args.get("start"))
+        end = export.parse_bound(request.args.get("end"), end=True)
+    except ValueError:
+        return _error("Invalid date filter, use YYYY-MM-DD", 400)
+    
+    series = trend_series(
+        survey_id, granularity, start, end, max_buckets=current_app.config["TREND_MAX_BUCKETS"]
+    )
+    return jsonify(series.as_dict())
+
+
+@api_bp.route("/surveys/<int:survey_id>/tallies")
+def survey_live_tallies(survey_id: int) -> Response | tuple[Response, int]:
+    """Current vote counts per option, polled by the results page."""
+    if not current_user.is_authenticated:
+        return _error("Authentication required", 401)
+    
+    survey = Survey.query.filter_by(id=survey_id, user_id=current_user.id).first()
+    if not survey:
+        return _error("Survey not found", 404)
+    
+    response = Response(tally_payloads([survey_id])[survey_id], mimetype="application/json")
+    response.headers["Cache-Control"] = "no-store"
+    return response
@@ -5,16 +5,27 @@
 
 """Authentication routes."""
 
-from datetime import datetime
-from flask import Blueprint, render_template, request, redirect, url_for, flash, Response
-from flask_login import login_user, logout_user
-from werkzeug.security import generate_password_hash, check_password_hash
+from flask import Blueprint, current_app, render_template, request, redirect, url_for, flash, Response
+from flask_login import current_user, login_required, login_user, logout_user
+from src.deletion import delete_user
 from src.extensions import db
+from src.last_login import record_login
 from src.models import User
+from src.passwords import PasswordHasher, PasswordHasherBusy
 
 auth_bp = Blueprint("auth", __name__)
 
 
+def _hasher() -> PasswordHasher:
+    return current_app.extensions["password_hasher"]
+
+
+@auth_bp.errorhandler(PasswordHasherBusy)
+def hasher_busy(error: PasswordHasherBusy) -> tuple[str, int, dict[str, str]]:
+    """Shed load when password hashing is saturated."""
+    return "Too many sign-ins in progress, please try again shortly", 503, {"Retry-After": "1"}
+
+
 @auth_bp.route("/register", methods=["GET", "POST"])
 def register() -> str | Response:
     """User registration."""
@@ -32,7 +43,7 @@ def register() -> str | Response:
         
         user = User(
             email=email,
-            password_hash=generate_password_hash(password)
+            password_hash=_hasher().hash(password)
         )
         db.session.add(user)
         db.session.commit()
@@ -52,9 +63,11 @@ def login() -> str | Response:
         
         user = User.query.filter_by(email=email).first()
         
-        if user and check_password_hash(user.password_hash, password):
-            user.last_login = datetime.utcnow()
-            db.session.commit()
+        if user and _hasher().verify(user.password_hash, password):
+            if _hasher().needs_rehash(user.password_hash):
+                user.password_hash = _hasher().hash(password)
+                db.session.commit()
+            record_login(user)
             login_user(user)
             return redirect(url_for("surveys.dashboard"))
         
@@ -68,3 +81,17 @@ def logout() -> Response:
     """User logout."""
     logout_user()
     return redirect(url_for("auth.login"))
+
+
+@auth_bp.route("/account/delete", methods=["POST"])
+@login_required
+def delete_account() -> Response:
+    """Delete the signed-in account and all of its surveys."""
+    user = db.session.get(User, current_user.id)
+    if user is None or not _hasher().verify(user.password_hash, request.form.get("password", "")):
+        flash("Password is incorrect; account not deleted")
+        return redirect(url_for("surveys.dashboard"))
+    logout_user()
+    delete_user(user.id)
+    flash("Your account and surveys have been deleted.")
+    return redirect(url_for("auth.login"))
@@ -5,11 +5,24 @@
 
 """Survey routes."""
 
-from flask import Blueprint, render_template, request, redirect, url_for, flash, Response
+from datetime import datetime
+from flask import (
+    Blueprint, current_app, render_template, request, redirect, url_for, flash, make_response,
+    stream_with_context, Response
+)
 from flask_login import login_required, current_user
-from sqlalchemy import func
-from src.extensions import db
-from src.models import Survey, SurveyOption, SurveyResponse
+from src import export, public_forms, respondents
+from src.dashboard import PREVIEW_CHARS, dashboard_page
+from src.deletion import delete_survey
+from src.extensions import csrf, db
+from src.http_cache import not_modified, with_validators
+from src.ingest import DuplicateVoteError, VoteIngestError, submit_vote
+from src.live_results import event_stream, tally_payloads
+from src.models import Survey, SurveyOption
+from src.survey_cache import get_definition, invalidate_survey
+from src.tallies import survey_tallies
+from src.trends import trend_series
+from src.unique_respondents import unique_respondents
 
 surveys_bp = Blueprint("surveys", __name__)
 
@@ -18,8 +31,15 @@ surveys_bp = Blueprint("surveys", __name__)
 @login_required
 def dashboard() -> str:
     """User dashboard."""
-    surveys = Survey.query.filter_by(user_id=current_user.id).order_by(Survey.created_at.desc()).all()
-    return render_template("dashboard.html", surveys=surveys)
+    cursor = request.args.get("after")
+    page = dashboard_page(current_user.id, cursor, current_app.config["DASHBOARD_PAGE_SIZE"])
+    return render_template(
+        "dashboard.html",
+        surveys=page.surveys,
+        next_cursor=page.next_cursor,
+        is_first_page=not cursor,
+        preview_chars=PREVIEW_CHARS
+    )
 
 
 @surveys_bp.route("/survey/create", methods=["GET", "POST"])
@@ -43,7 +63,10 @@ def create_survey() -> str | Response:
             flash("At least 2 options are required")
             return render_template("create_survey.html")
         
-        survey = Survey(user_id=current_user.id, title=title, description=description)
+        survey = Survey(
+            user_id=current_user.id, title=title, description=description,
+            one_vote_per_respondent=bool(request.form.get("one_vote_per_respondent"))
+        )
         db.session.add(survey)
         db.session.flush()
         
@@ -73,40 +96,97 @@ def toggle_survey(survey_id: int) -> Response:
         return redirect(url_for("surveys.dashboard"))
     
     survey.is_active = not survey.is_active
+    invalidate_survey(survey_id)
     db.session.commit()
     
     return redirect(url_for("surveys.dashboard"))
 
 
+@surveys_bp.route("/survey/<int:survey_id>/delete", methods=["POST"])
+@login_required
+def delete_survey_route(survey_id: int) -> Response:
+    """Delete a survey and all of its responses."""
+    owned = db.session.scalar(
+        db.select(Survey.id).where(Survey.id == survey_id, Survey.user_id == current_user.id)
+    )
+    if owned is None:
+        flash("Survey not found")
+    else:
+        delete_survey(survey_id)
+        flash("Survey deleted")
+    return redirect(url_for("surveys.dashboard"))
+
+
+def _survey_page_validators(survey) -> tuple[str, datetime | None]:
+    """ETag and Last-Modified for the public page.
+
+    The ETag covers survey version, viewer and form token age. Signed pages
+    send no Last-Modified: the embedded token rotates while updated_at stays
+    put, so If-Modified-Since alone would keep serving an expired form.
+    """
+    window = public_forms.token_window()
+    etag = f"s{survey.id}-v{survey.version}-u{current_user.get_id() or 0}-w{window}"
+    return etag, None if public_forms.signed() else survey.updated_at
+
+
+def _render_survey_page(survey) -> str:
+    return render_template(
+        "survey_response.html", survey=survey, options=survey.options,
+        form_token=public_forms.form_token(survey.id)
+    )
+
+
 @surveys_bp.route("/s/<int:survey_id>", methods=["GET", "POST"])
-def survey_response(survey_id: int) -> str | tuple[str, int]:
+@csrf.exempt  # Checked by public_forms.protect in either protection mode.
+def survey_response(survey_id: int) -> str | Response | tuple[str, int]:
     """Public survey response page."""
-    survey = Survey.query.filter_by(id=survey_id, is_active=True).first()
+    survey = get_definition(survey_id)
     
-    if not survey:
+    if not survey or not survey.is_active:
         return "Survey not found or inactive", 404
     
-    options = SurveyOption.query.filter_by(survey_id=survey_id).order_by(SurveyOption.option_order).all()
+    etag, last_modified = _survey_page_validators(survey)
+    cached = not_modified(etag, last_modified)
+    if cached:
+        return cached
     
     if request.method == "POST":
-        option_id = request.form.get("option_id")
+        public_forms.protect(survey_id, request.form.get("form_token"))
+        option_id = request.form.get("option_id", "").strip()
         respondent_email = request.form.get("email", "").strip()
         
         if not option_id:
             flash("Please select an option")
-            return render_template("survey_response.html", survey=survey, options=options)
+            return _render_survey_page(survey)
         
-        response = SurveyResponse(
-            survey_id=survey_id,
-            option_id=int(option_id),
-            respondent_email=respondent_email if respondent_email else None
-        )
-        db.session.add(response)
-        db.session.commit()
+        if not option_id.isdigit() or int(option_id) not in survey.option_ids:
+            flash("Please select a valid option")
+            return _render_survey_page(survey), 400
+        
+        respondent = None
+        if survey.one_vote_per_respondent:
+            # remote_addr is the forwarded client address under PROXY_FIX_X_FOR.
+            respondent = respondents.respondent_key(respondent_email, request.remote_addr)
+            if respondent and respondents.has_voted(survey_id, respondent):
+                return "You have already responded to this survey", 409
+        
+        try:
+            submit_vote(survey_id, int(option_id), respondent_email or None, respondent)
+        except DuplicateVoteError:
+            respondents.record_vote(survey_id, respondent)
+            return "You have already responded to this survey", 409
+        except VoteIngestError:
+            return "Unable to record your response, please try again", 503
+        
+        if respondent:
+            respondents.record_vote(survey_id, respondent)
         
         return render_template("survey_thanks.html")
     
-    return render_template("survey_response.html", survey=survey, options=options)
+    if public_forms.shareable():
+        html = public_forms.shared_page(survey.id, survey.version, lambda: _render_survey_page(survey))
+        return with_validators(make_response(html), etag, last_modified, public_forms.cache_control())
+    return with_validators(make_response(_render_survey_page(survey)), etag, last_modified)
 
 
 @surveys_bp.route("/survey/<int:survey_id>/results")
@@ -119,25 +199,87 @@ def survey_results(survey_id: int) -> str | Response:
         flash("Survey not found")
         return redirect(url_for("surveys.dashboard"))
     
-    results = db.session.query(
-        SurveyOption.option_text,
-        SurveyOption.option_order,
-        func.count(SurveyResponse.id).label("vote_count")
-    ).outerjoin(
-        SurveyResponse, SurveyOption.id == SurveyResponse.option_id
-    ).filter(
-        SurveyOption.survey_id == survey_id
-    ).group_by(
-        SurveyOption.id
-    ).order_by(
-        SurveyOption.option_order
-    ).all()
+    results = survey_tallies(survey_id)
+    # The trend window moves at midnight UTC even when no votes arrive.
+    etag = (f"r{survey.id}-v{survey.version}-" + "-".join(str(r.vote_count) for r in results)
+            + f"-d{datetime.utcnow():%Y%m%d}")
+    cached = not_modified(etag)
+    if cached:
+        return cached
     
     total_votes = sum(r.vote_count for r in results)
+    trend = trend_series(survey_id, "day", max_buckets=current_app.config["RESULTS_TREND_DAYS"])
     
-    return render_template(
+    response = make_response(render_template(
         "survey_results.html",
         survey=survey,
         results=results,
-        total_votes=total_votes
+        total_votes=total_votes,
+        respondents=unique_respondents(survey_id),
+        trend=trend
+    ))
+    return with_validators(response, etag)
+
+
+@surveys_bp.route("/survey/<int:survey_id>/results/stream")
+@login_required
+def results_stream(survey_id: int) -> Response | tuple[str, int]:
+    """Stream live tallies as Server-Sent Events."""
+    if current_app.config["LIVE_RESULTS_MODE"] != "sse":
+        return "Live results streaming is disabled", 404
+    survey = Survey.query.filter_by(id=survey_id, user_id=current_user.id).first()
+    
+    if not survey:
+        return "Survey not found", 404
+    
+    initial = tally_payloads([survey_id])[survey_id]
+    # Streams can stay open for minutes; never hold a pooled connection.
+    db.session.remove()
+    
+    stream = event_stream(
+        current_app.extensions["tally_broadcaster"],
+        survey_id,
+        initial,
+        max_duration=current_app.config["SSE_MAX_DURATION"],
+        heartbeat=current_app.config["SSE_HEARTBEAT"]
+    )
+    response = Response(stream, mimetype="text/event-stream")
+    response.headers["Cache-Control"] = "no-cache"
+    response.headers["X-Accel-Buffering"] = "no"
+    return response
+
+
+@surveys_bp.route("/survey/<int:survey_id>/export")
+@login_required
+def export_responses(survey_id: int) -> Response | tuple[str, int]:
+    """Stream survey responses as CSV or NDJSON."""
+    survey = Survey.query.filter_by(id=survey_id, user_id=current_user.id).first()
+    
+    if not survey:
+        flash("Survey not found")
+        return redirect(url_for("surveys.dashboard"))
+    
+    fmt = request.args.get("format", "csv")
+    if fmt not in export.EXPORT_FORMATS:
+        return "Unsupported export format", 400
+    
+    try:
+        start = export.parse_bound(request.args.get("start"))
+        end = export.parse_bound(request.args.get("end"), end=True)
+    except ValueError:
+        return "Invalid date filter, use YYYY-MM-DD", 400
+    
+    batch_size = current_app.config["EXPORT_BATCH_SIZE"]
+    encode = export.encode_csv if fmt == "csv" else export.encode_ndjson
+    body = encode(export.response_rows(survey_id, start, end, batch_size), batch_size)
+    
+    headers = {"Content-Disposition": f"attachment; filename=survey-{survey_id}-responses.{fmt}"}
+    if "gzip" in request.accept_encodings:
+        body = export.gzip_stream(body)
+        headers["Content-Encoding"] = "gzip"
+    
+    response = Response(
+        stream_with_context(body), mimetype=export.EXPORT_FORMATS[fmt], headers=headers
     )
+    response.vary.add("Accept-Encoding")
+    return response
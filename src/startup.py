@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Startup timing report and preload helpers."""
+
+import logging
+import os
+import threading
+import time
+from flask import Flask, Response, g
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Records how long each phase of the app factory took."""
+
+    def __init__(self) -> None:
+        self.started = time.perf_counter()
+        self._last = self.started
+        self.phases: dict[str, float] = {}
+
+    def mark(self, phase: str) -> None:
+        """Close the current phase under name phase."""
+        now = time.perf_counter()
+        self.phases[phase] = now - self._last
+        self._last = now
+
+    @property
+    def total(self) -> float:
+        return self._last - self.started
+
+
+def init_app(app: Flask, timer: StartupTimer, import_seconds: float) -> None:
+    """Log the startup report and time the first request in each worker process."""
+    report = {
+        "import_ms": round(import_seconds * 1000, 1),
+        "app_factory_ms": round(timer.total * 1000, 1),
+        **{f"{phase}_ms": round(seconds * 1000, 1) for phase, seconds in timer.phases.items()},
+        "first_request_ms": {},
+    }
+    app.extensions["startup"] = report
+    logger.info(
+        "Startup: import=%.1fms app_factory=%.1fms (%s)",
+        report["import_ms"], report["app_factory_ms"],
+        " ".join(f"{phase}={seconds * 1000:.1f}ms" for phase, seconds in timer.phases.items())
+    )
+    timed_pids: set[int] = set()
+    lock = threading.Lock()
+
+    @app.before_request
+    def start_first_request() -> None:
+        pid = os.getpid()
+        if pid not in timed_pids:
+            with lock:
+                if pid not in timed_pids:
+                    timed_pids.add(pid)
+                    g.first_request_started = time.perf_counter()
+
+    @app.after_request
+    def finish_first_request(response: Response) -> Response:
+        started = g.pop("first_request_started", None)
+        if started is not None:
+            elapsed = (time.perf_counter() - started) * 1000
+            report["first_request_ms"][os.getpid()] = round(elapsed, 1)
+            logger.info("First request in process %d took %.1fms", os.getpid(), elapsed)
+        return response
+
+
+def warm_templates(app: Flask) -> int:
+    """Compile every template now, e.g. in a preloading master before fork."""
+    names = app.jinja_env.list_templates(extensions=["html"])
+    for name in names:
+        app.jinja_env.get_template(name)
+    return len(names)
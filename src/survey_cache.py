@@ -0,0 +1,95 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Cached immutable survey definitions for the public response page."""
+
+from dataclasses import dataclass
+from datetime import datetime
+from flask import Flask, current_app
+from sqlalchemy import select
+from src.cache import GenerationalCache, bump_generation
+from src.extensions import db
+from src.models import Survey, SurveyOption
+
+GENERATION = "surveys"
+
+
+@dataclass(frozen=True)
+class OptionDefinition:
+    id: int
+    option_text: str
+
+
+@dataclass(frozen=True)
+class SurveyDefinition:
+    """Everything the public page needs to render and validate a vote."""
+    id: int
+    title: str
+    description: str | None
+    is_active: bool
+    version: int
+    one_vote_per_respondent: bool
+    updated_at: datetime | None
+    options: tuple[OptionDefinition, ...]
+    option_ids: frozenset[int]
+
+
+def init_app(app: Flask) -> None:
+    """Create the per-worker survey definition cache."""
+    app.extensions["survey_cache"] = GenerationalCache(
+        GENERATION,
+        maxsize=app.config["SURVEY_CACHE_SIZE"],
+        ttl=app.config["SURVEY_CACHE_TTL"],
+        check_interval=app.config["SURVEY_CACHE_CHECK_INTERVAL_MS"] / 1000,
+    )
+
+
+def load_definition(survey_id: int) -> SurveyDefinition | None:
+    """Load a survey definition from the database."""
+    survey = db.session.execute(
+        select(
+            Survey.id, Survey.title, Survey.description, Survey.is_active,
+            Survey.version, Survey.one_vote_per_respondent, Survey.updated_at
+        ).where(Survey.id == survey_id)
+    ).first()
+    if survey is None:
+        return None
+    options = tuple(
+        OptionDefinition(row.id, row.option_text)
+        for row in db.session.execute(
+            select(SurveyOption.id, SurveyOption.option_text)
+            .where(SurveyOption.survey_id == survey_id)
+            .order_by(SurveyOption.option_order)
+        )
+    )
+    return SurveyDefinition(
+        id=survey.id,
+        title=survey.title,
+        description=survey.description,
+        is_active=bool(survey.is_active),
+        version=survey.version,
+        one_vote_per_respondent=bool(survey.one_vote_per_respondent),
+        updated_at=survey.updated_at,
+        options=options,
+        option_ids=frozenset(option.id for option in options),
+    )
+
+
+def get_definition(survey_id: int) -> SurveyDefinition | None:
+    """Return a survey definition, loading it on a cache miss."""
+    cache: GenerationalCache = current_app.extensions["survey_cache"]
+    cache.sync()
+    definition = cache.get(survey_id)
+    if definition is None:
+        definition = load_definition(survey_id)
+        if definition is not None:
+            cache.set(survey_id, definition)
+    return definition
+
+
+def invalidate_survey(survey_id: int) -> None:
+    """Invalidate a survey in every worker; call before committing the change."""
+    bump_generation(GENERATION)
+    current_app.extensions["survey_cache"].pop(survey_id)
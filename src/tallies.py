@@ -0,0 +1,48 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Per-option vote tallies."""
+
+from sqlalchemy import delete, func, insert, select
+from src.extensions import db
+from src.models import SurveyOption, SurveyOptionTally, SurveyResponse
+
+
+def survey_tallies(survey_id: int) -> list:
+    """Return option text, order and vote count for a survey in O(options)."""
+    return db.session.query(
+        SurveyOption.option_text,
+        SurveyOption.option_order,
+        func.coalesce(SurveyOptionTally.vote_count, 0).label("vote_count")
+    ).outerjoin(
+        SurveyOptionTally, SurveyOption.id == SurveyOptionTally.option_id
+    ).filter(
+        SurveyOption.survey_id == survey_id
+    ).order_by(
+        SurveyOption.option_order
+    ).all()
+
+
+def reconcile_tallies(survey_id: int | None = None) -> int:
+    """Rebuild tallies from survey_responses; returns the number of rows written."""
+    counts = select(
+        SurveyResponse.option_id,
+        SurveyResponse.survey_id,
+        func.count(SurveyResponse.id),
+        func.max(SurveyResponse.response_date)
+    ).group_by(SurveyResponse.option_id, SurveyResponse.survey_id)
+    clear = delete(SurveyOptionTally)
+    if survey_id is not None:
+        counts = counts.where(SurveyResponse.survey_id == survey_id)
+        clear = clear.where(SurveyOptionTally.survey_id == survey_id)
+
+    db.session.execute(clear)
+    result = db.session.execute(
+        insert(SurveyOptionTally).from_select(
+            ["option_id", "survey_id", "vote_count", "last_response_at"], counts
+        )
+    )
+    db.session.commit()
+    return result.rowcount
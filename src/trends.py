@@ -0,0 +1,120 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Votes over time, served from hourly and daily rollups."""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from sqlalchemy import delete, func, insert, literal, select
+from src.extensions import db
+from src.models import SurveyOption, SurveyResponse, SurveyResponseRollup
+from src.models.survey import ROLLUP_BUCKETS
+
+GRANULARITIES = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+DEFAULT_BUCKETS = {"hour": 48, "day": 30}
+
+
+@dataclass
+class TrendSeries:
+    """Per-option vote counts for consecutive buckets, gaps filled with zero."""
+    granularity: str
+    buckets: list[datetime]
+    options: list[dict]
+
+    @property
+    def totals(self) -> list[int]:
+        """Votes across all options per bucket."""
+        totals = [0] * len(self.buckets)
+        for option in self.options:
+            for i, count in enumerate(option["counts"]):
+                totals[i] += count
+        return totals
+
+    def as_dict(self) -> dict:
+        """JSON-ready form with ISO bucket starts."""
+        return {
+            "granularity": self.granularity,
+            "buckets": [bucket.isoformat() for bucket in self.buckets],
+            "totals": self.totals,
+            "options": self.options,
+        }
+
+
+def bucket_start(value: datetime, granularity: str) -> datetime:
+    """Truncate a datetime to the start of its bucket."""
+    if granularity == "day":
+        return value.replace(hour=0, minute=0, second=0, microsecond=0)
+    return value.replace(minute=0, second=0, microsecond=0)
+
+
+def trend_series(survey_id: int, granularity: str, start: datetime | None = None,
+                 end: datetime | None = None, max_buckets: int = 1000) -> TrendSeries:
+    """Read a survey's trend from rollups in time proportional to buckets x options.
+
+    The range defaults to the most recent DEFAULT_BUCKETS buckets and is
+    clamped to max_buckets, keeping the newest end.
+    """
+    step = GRANULARITIES[granularity]
+    last = bucket_start(end - timedelta(microseconds=1) if end else datetime.utcnow(), granularity)
+    first = bucket_start(start, granularity) if start else last - step * (DEFAULT_BUCKETS[granularity] - 1)
+    count = min(max(0, (last - first) // step + 1), max(1, max_buckets))
+    first = last - step * (count - 1)
+    buckets = [first + step * i for i in range(count)]
+
+    options = db.session.execute(
+        select(SurveyOption.id, SurveyOption.option_text)
+        .where(SurveyOption.survey_id == survey_id)
+        .order_by(SurveyOption.option_order)
+    ).all()
+    positions = {bucket: i for i, bucket in enumerate(buckets)}
+    counts = {option_id: [0] * count for option_id, _ in options}
+    if buckets:
+        rows = db.session.execute(
+            select(SurveyResponseRollup.bucket, SurveyResponseRollup.option_id, SurveyResponseRollup.vote_count)
+            .where(
+                SurveyResponseRollup.survey_id == survey_id,
+                SurveyResponseRollup.granularity == granularity,
+                SurveyResponseRollup.bucket.between(buckets[0], buckets[-1]),
+            )
+        )
+        for bucket, option_id, vote_count in rows:
+            if option_id in counts and bucket in positions:
+                counts[option_id][positions[bucket]] = vote_count
+
+    return TrendSeries(granularity, buckets, [
+        {"option_id": option_id, "option_text": option_text, "counts": counts[option_id]}
+        for option_id, option_text in options
+    ])
+
+
+def rebuild_rollups(survey_id: int | None = None) -> int:
+    """Rebuild rollups from survey_responses; returns the number of rows written."""
+    clear = delete(SurveyResponseRollup)
+    if survey_id is not None:
+        clear = clear.where(SurveyResponseRollup.survey_id == survey_id)
+    db.session.execute(clear)
+
+    written = 0
+    for granularity, fmt in ROLLUP_BUCKETS.items():
+        bucket = func.strftime(fmt, SurveyResponse.response_date)
+        counts = select(
+            SurveyResponse.survey_id,
+            literal(granularity),
+            bucket,
+            SurveyResponse.option_id,
+            func.count(SurveyResponse.id)
+        ).where(
+            SurveyResponse.response_date.is_not(None)
+        ).group_by(SurveyResponse.survey_id, bucket, SurveyResponse.option_id)
+        if survey_id is not None:
+            counts = counts.where(SurveyResponse.survey_id == survey_id)
+        result = db.session.execute(
+            insert(SurveyResponseRollup).from_select(
+                ["survey_id", "granularity", "bucket", "option_id", "vote_count"], counts
+            )
+        )
+        written += result.rowcount
+    db.session.commit()
+    return written
@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Approximate distinct respondent counts from per-survey HyperLogLog sketches.
+
+Each survey's sketch holds 2**PRECISION one-byte registers, stored
+zlib-compressed in survey_respondent_sketches. Inserts merge the new
+respondent emails into it in the same transaction, so the results page
+reads one small row instead of running COUNT(DISTINCT respondent_email).
+The standard error is 1.04 / sqrt(2**PRECISION), about 1.6%.
+"""
+
+import hashlib
+import math
+import zlib
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Iterable
+from sqlalchemy import Connection, delete, func, select
+from sqlalchemy.dialects.sqlite import insert
+from src.extensions import db
+from src.models import SurveyRespondentSketch, SurveyResponse
+
+PRECISION = 12
+
+
+class HyperLogLog:
+    """HyperLogLog cardinality sketch over 64-bit hashes."""
+
+    def __init__(self, precision: int = PRECISION, registers: bytes | None = None) -> None:
+        self.precision = precision
+        self.size = 1 << precision
+        self.registers = bytearray(registers) if registers is not None else bytearray(self.size)
+        if len(self.registers) != self.size:
+            raise ValueError(f"expected {self.size} registers, got {len(self.registers)}")
+
+    @property
+    def standard_error(self) -> float:
+        return 1.04 / math.sqrt(self.size)
+
+    def add(self, value: str) -> None:
+        hashed = int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+        index = hashed >> (64 - self.precision)
+        remaining = hashed & ((1 << (64 - self.precision)) - 1)
+        rank = (64 - self.precision) - remaining.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, values: Iterable[str]) -> None:
+        for value in values:
+            self.add(value)
+
+    def count(self) -> int:
+        """Estimated number of distinct values added."""
+        m = self.size
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -register for register in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate while many registers are empty.
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+    def to_bytes(self) -> bytes:
+        return zlib.compress(bytes(self.registers))
+
+    @classmethod
+    def from_bytes(cls, data: bytes, precision: int = PRECISION) -> "HyperLogLog":
+        return cls(precision, zlib.decompress(data))
+
+
+@dataclass(frozen=True)
+class RespondentEstimate:
+    estimate: int
+    standard_error: float
+
+
+def _save(connection, survey_id: int, sketch: HyperLogLog) -> None:
+    statement = insert(SurveyRespondentSketch).values(survey_id=survey_id, registers=sketch.to_bytes())
+    connection.execute(statement.on_conflict_do_update(
+        index_elements=[SurveyRespondentSketch.survey_id],
+        set_={"registers": statement.excluded.registers},
+    ))
+
+
+def _load(connection, survey_id: int) -> HyperLogLog:
+    data = connection.execute(
+        select(SurveyRespondentSketch.registers).where(SurveyRespondentSketch.survey_id == survey_id)
+    ).scalar()
+    return HyperLogLog.from_bytes(data) if data is not None else HyperLogLog()
+
+
+def add_respondents(rows: list[dict]) -> None:
+    """Merge the emails of newly inserted vote rows into their surveys' sketches.
+
+    Call in the inserting transaction: it already holds SQLite's write lock,
+    so the read-modify-write cannot interleave with another writer.
+    """
+    by_survey: dict[int, list[str]] = {}
+    for row in rows:
+        if row.get("respondent_email"):
+            by_survey.setdefault(row["survey_id"], []).append(row["respondent_email"])
+    for survey_id, emails in by_survey.items():
+        sketch = _load(db.session, survey_id)
+        before = bytes(sketch.registers)
+        sketch.update(emails)
+        if sketch.registers != before:
+            _save(db.session, survey_id, sketch)
+
+
+def unique_respondents(survey_id: int) -> RespondentEstimate:
+    """Estimated distinct respondent emails for a survey, in constant time."""
+    sketch = _load(db.session, survey_id)
+    return RespondentEstimate(sketch.count(), sketch.standard_error)
+
+
+def exact_respondents(survey_id: int) -> int:
+    """Exact distinct respondent emails; scans the survey's responses."""
+    return db.session.scalar(
+        select(func.count(func.distinct(SurveyResponse.respondent_email)))
+        .where(SurveyResponse.survey_id == survey_id)
+    )
+
+
+def rebuild_sketches(connection: Connection | None = None, survey_id: int | None = None) -> int:
+    """Recompute sketches from survey_responses; returns the number written.
+
+    Streams responses in survey order so only one sketch is in memory.
+    """
+    session_owned = connection is None
+    connection = connection or db.session
+    rows = select(SurveyResponse.survey_id, SurveyResponse.respondent_email).where(
+        SurveyResponse.respondent_email.is_not(None)
+    ).order_by(SurveyResponse.survey_id)
+    clear = delete(SurveyRespondentSketch)
+    if survey_id is not None:
+        rows = rows.where(SurveyResponse.survey_id == survey_id)
+        clear = clear.where(SurveyRespondentSketch.survey_id == survey_id)
+
+    connection.execute(clear)
+    written = 0
+    result = connection.execute(rows.execution_options(yield_per=10000))
+    for current, group in groupby(result, key=lambda row: row[0]):
+        sketch = HyperLogLog()
+        sketch.update(email for _, email in group)
+        _save(connection, current, sketch)
+        written += 1
+    if session_owned:
+        db.session.commit()
+    return written
@@ -0,0 +1,67 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Per-worker cache behind the Flask-Login user loader."""
+
+from dataclasses import dataclass
+from flask import Flask, current_app, has_app_context
+from flask_login import UserMixin
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import load_only
+from src.cache import GenerationalCache, bump_generation
+from src.extensions import db
+from src.models import User
+
+GENERATION = "users"
+
+
+@dataclass(frozen=True, eq=False)
+class CachedUser(UserMixin):
+    """The authenticated user as views see it: no password hash, no ORM state."""
+    id: int
+    email: str
+
+
+def init_app(app: Flask) -> None:
+    """Create the user cache and register it as the Flask-Login user loader."""
+    app.extensions["user_cache"] = GenerationalCache(
+        GENERATION,
+        maxsize=app.config["USER_CACHE_SIZE"],
+        ttl=app.config["USER_CACHE_TTL"],
+        check_interval=app.config["USER_CACHE_CHECK_INTERVAL_MS"] / 1000,
+    )
+
+
+def load_user(user_id: str) -> CachedUser | None:
+    """Return the session user, hitting the users table only on a cache miss."""
+    cache: GenerationalCache = current_app.extensions["user_cache"]
+    cache.sync()
+    key = int(user_id)
+    cached = cache.get(key)
+    if cached is None:
+        user = db.session.get(User, key, options=[load_only(User.id, User.email)])
+        if user is None:
+            return None
+        cached = CachedUser(user.id, user.email)
+        cache.set(key, cached)
+    return cached
+
+
+def _invalidate(connection, target: User) -> None:
+    bump_generation(GENERATION, connection)
+    if has_app_context() and "user_cache" in current_app.extensions:
+        current_app.extensions["user_cache"].pop(target.id)
+
+
+@event.listens_for(User, "after_update")
+def _user_updated(mapper, connection, target: User) -> None:
+    # Only fields held by CachedUser matter; last_login and rehashes do not.
+    if inspect(target).attrs.email.history.has_changes():
+        _invalidate(connection, target)
+
+
+@event.listens_for(User, "after_delete")
+def _user_deleted(mapper, connection, target: User) -> None:
+    _invalidate(connection, target)
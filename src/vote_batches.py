@@ -0,0 +1,157 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Bulk vote submission for kiosks and offline collectors."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from pydantic import BaseModel, ConfigDict, Field, ValidationError
+from sqlalchemy.exc import IntegrityError
+from src import respondents
+from src.extensions import db
+from src.ingest import insert_votes, is_duplicate_vote
+from src.models import VoteBatch
+
+# Collector clocks drift; allow a little skew before calling a vote "future".
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+DUPLICATE_ERROR = "email: already responded to this survey"
+
+
+class BatchConflictError(RuntimeError):
+    """Raised when a batch conflicts with concurrent writes and cannot be applied."""
+
+
+class VoteRecord(BaseModel):
+    """One offline vote as sent by a collector."""
+    model_config = ConfigDict(extra="forbid", str_strip_whitespace=True)
+
+    option_id: int = Field(strict=True)
+    email: str | None = Field(default=None, max_length=255)
+    response_date: datetime | None = None
+
+
+def _error_message(error: ValidationError) -> str:
+    first = error.errors()[0]
+    field = ".".join(str(part) for part in first["loc"])
+    return f"{field}: {first['msg']}" if field else first["msg"]
+
+
+def validate_records(survey_id: int, records: list[Any], option_ids: frozenset[int] | set[int],
+                     now: datetime, one_vote: bool = False) -> tuple[list[dict], list[dict]]:
+    """Validate records against a survey's options.
+
+    With one_vote, records with an email carry its respondent hash and
+    repeats of an email within the batch are rejected. Returns the
+    insertable rows and a per-record result in request order.
+    """
+    rows: list[dict] = []
+    results: list[dict] = []
+    seen: set[str] = set()
+    for index, raw in enumerate(records):
+        try:
+            record = VoteRecord.model_validate(raw)
+        except ValidationError as exc:
+            results.append({"index": index, "status": "rejected", "error": _error_message(exc)})
+            continue
+        if record.option_id not in option_ids:
+            results.append({"index": index, "status": "rejected", "error": "option_id: not an option of this survey"})
+            continue
+        response_date = record.response_date or now
+        if response_date.tzinfo is not None:
+            response_date = response_date.astimezone(timezone.utc).replace(tzinfo=None)
+        if response_date > now + MAX_CLOCK_SKEW:
+            results.append({"index": index, "status": "rejected", "error": "response_date: in the future"})
+            continue
+        respondent = respondents.respondent_key(record.email, None) if one_vote else None
+        if respondent is not None:
+            if respondent in seen:
+                results.append({"index": index, "status": "rejected", "error": DUPLICATE_ERROR})
+                continue
+            seen.add(respondent)
+        rows.append({
+            "survey_id": survey_id,
+            "option_id": record.option_id,
+            "respondent_email": record.email or None,
+            "respondent_hash": respondent,
+            "response_date": response_date,
+        })
+        results.append({"index": index, "status": "accepted"})
+    return rows, results
+
+
+def stored_result(survey_id: int, idempotency_key: str) -> dict | None:
+    """Return the summary recorded for an earlier batch with this key."""
+    batch = VoteBatch.query.filter_by(survey_id=survey_id, idempotency_key=idempotency_key).first()
+    return json.loads(batch.result) if batch else None
+
+
+def _reject_existing(survey_id: int, rows: list[dict], results: list[dict]) -> list[dict]:
+    """Drop rows whose respondent already voted, marking their results rejected."""
+    known = respondents.existing_respondents(
+        survey_id, [row["respondent_hash"] for row in rows if row["respondent_hash"]]
+    )
+    if not known:
+        return rows
+    accepted = [result for result in results if result["status"] == "accepted"]
+    kept = []
+    for row, result in zip(rows, accepted):
+        if row["respondent_hash"] in known:
+            result.update(status="rejected", error=DUPLICATE_ERROR)
+        else:
+            kept.append(row)
+    return kept
+
+
+def _write_batch(survey_id: int, rows: list[dict], summary: dict,
+                 idempotency_key: str | None, chunk_size: int) -> None:
+    if idempotency_key:
+        # Claim the key first so a concurrent retry fails before inserting votes.
+        db.session.add(VoteBatch(
+            survey_id=survey_id, idempotency_key=idempotency_key, result=json.dumps(summary)
+        ))
+        db.session.flush()
+    chunk_size = max(1, chunk_size)
+    for start in range(0, len(rows), chunk_size):
+        insert_votes(rows[start:start + chunk_size])
+    db.session.commit()
+
+
+def submit_batch(survey_id: int, records: list[Any], option_ids: frozenset[int] | set[int],
+                 idempotency_key: str | None, chunk_size: int, one_vote: bool = False) -> tuple[dict, bool]:
+    """Validate and insert a batch in one transaction, one executemany per chunk.
+
+    Returns (summary, replayed); replayed is True when the idempotency key
+    had already been applied and nothing new was written. Raises
+    BatchConflictError when concurrent writes keep the batch from committing.
+    """
+    if idempotency_key:
+        previous = stored_result(survey_id, idempotency_key)
+        if previous is not None:
+            return previous, True
+
+    rows, results = validate_records(survey_id, records, option_ids, datetime.utcnow(), one_vote)
+    if one_vote:
+        rows = _reject_existing(survey_id, rows, results)
+
+    # A second attempt covers respondents whose vote committed concurrently,
+    # after _reject_existing looked for them.
+    for attempt in range(2):
+        summary = {"accepted": len(rows), "rejected": len(results) - len(rows), "results": results}
+        try:
+            _write_batch(survey_id, rows, summary, idempotency_key, chunk_size)
+            break
+        except IntegrityError as exc:
+            db.session.rollback()
+            previous = stored_result(survey_id, idempotency_key) if idempotency_key else None
+            if previous is not None:
+                return previous, True
+            if attempt or not (one_vote and is_duplicate_vote(exc)):
+                raise BatchConflictError("Batch conflicts with concurrent changes, retry it") from exc
+            rows = _reject_existing(survey_id, rows, results)
+    for row in rows:
+        if row["respondent_hash"]:
+            respondents.record_vote(survey_id, row["respondent_hash"])
+    return summary, False
@@ -0,0 +1,195 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Write-behind buffers flushed in batches by a background thread."""
+
+import atexit
+import logging
+import os
+import threading
+import time
+import weakref
+from typing import Any, Callable
+from flask import Flask
+from sqlalchemy.exc import SQLAlchemyError, StatementError
+from src.extensions import db
+
+logger = logging.getLogger(__name__)
+
+_buffers: "weakref.WeakSet[WriteBehindBuffer]" = weakref.WeakSet()
+
+
+class FlushTicket:
+    """Completion handle for one buffered item."""
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.error: Exception | None = None
+
+    def resolve(self, error: Exception | None = None) -> None:
+        """Mark the item as written, or as failed with error."""
+        self.error = error
+        self._event.set()
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Wait for the flush; True only if the item was committed."""
+        return self._event.wait(timeout) and self.error is None
+
+
+class WriteBehindBuffer:
+    """In-process buffer that commits items in size- and time-bounded batches.
+
+    ``write_batch`` receives a list of items and runs inside an application
+    context; the buffer commits after it returns. A failing batch is retried
+    item by item so one bad row cannot discard its neighbours. Items refused
+    with an error ``expected_error`` accepts (e.g. duplicates) are logged at
+    debug level only.
+    """
+
+    def __init__(
+        self,
+        app: Flask,
+        name: str,
+        write_batch: Callable[[list[Any]], None],
+        max_batch: int = 200,
+        interval: float = 0.05,
+        max_pending: int = 10000,
+        expected_error: Callable[[Exception], bool] | None = None,
+    ) -> None:
+        self.app = app
+        self.name = name
+        self.write_batch = write_batch
+        self.max_batch = max(1, max_batch)
+        self.interval = max(0.0, interval)
+        self.max_pending = max(1, max_pending)
+        self.expected_error = expected_error
+        self._cond = threading.Condition()
+        self._items: list[tuple[Any, FlushTicket]] = []
+        self._first_at = 0.0
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        self._closed = False
+        _buffers.add(self)
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def submit(self, item: Any) -> FlushTicket | None:
+        """Queue an item; returns None when the buffer is full or closed."""
+        with self._cond:
+            if self._closed or len(self._items) >= self.max_pending:
+                return None
+            self._ensure_thread()
+            if not self._items:
+                self._first_at = time.monotonic()
+            ticket = FlushTicket()
+            self._items.append((item, ticket))
+            if len(self._items) == 1 or len(self._items) >= self.max_batch:
+                self._cond.notify()
+            return ticket
+
+    def withdraw(self, ticket: FlushTicket) -> bool:
+        """Remove a still-buffered item; False once a flush has taken it."""
+        with self._cond:
+            for index, (_, queued) in enumerate(self._items):
+                if queued is ticket:
+                    del self._items[index]
+                    return True
+        return False
+
+    def flush(self) -> None:
+        """Write everything currently buffered from the calling thread."""
+        while True:
+            with self._cond:
+                batch = self._take()
+            if not batch:
+                return
+            self._write(batch)
+
+    def close(self, timeout: float = 10.0) -> None:
+        """Stop accepting items, then drain whatever is still buffered."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None and thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+        self.flush()
+
+    def _ensure_thread(self) -> None:
+        # Threads do not survive fork, so a worker forked from a preloaded
+        # master starts its own flusher on first use.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._thread = None
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name=f"write-behind-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def _take(self) -> list[tuple[Any, FlushTicket]]:
+        batch = self._items[: self.max_batch]
+        del self._items[: self.max_batch]
+        if self._items:
+            self._first_at = time.monotonic()
+        return batch
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while True:
+                    if self._closed:
+                        return
+                    if len(self._items) >= self.max_batch:
+                        break
+                    if self._items:
+                        remaining = self._first_at + self.interval - time.monotonic()
+                        if remaining <= 0:
+                            break
+                        self._cond.wait(remaining)
+                    else:
+                        self._cond.wait()
+                batch = self._take()
+            self._write(batch)
+
+    def _write(self, batch: list[tuple[Any, FlushTicket]]) -> None:
+        with self.app.app_context():
+            try:
+                self.write_batch([item for item, _ in batch])
+                db.session.commit()
+            except SQLAlchemyError as exc:
+                db.session.rollback()
+                if len(batch) == 1:
+                    if self.expected_error is not None and self.expected_error(exc):
+                        logger.debug("%s: item refused: %s", self.name, _describe(exc))
+                    else:
+                        logger.error("%s: dropped item after failed write: %s", self.name, _describe(exc))
+                    batch[0][1].resolve(exc)
+                    return
+                logger.warning("%s: batch of %d failed, retrying individually", self.name, len(batch))
+                for entry in batch:
+                    self._write([entry])
+                return
+            finally:
+                db.session.remove()
+        for _, ticket in batch:
+            ticket.resolve()
+
+
+def _describe(exc: SQLAlchemyError) -> str:
+    """The error without its statement or bound parameters, which hold user data."""
+    if isinstance(exc, StatementError):
+        return f"{type(exc).__name__}: {exc.orig}"
+    return f"{type(exc).__name__}: {exc}"
+
+
+def close_all(timeout: float = 10.0) -> None:
+    """Drain every live buffer; used on worker shutdown."""
+    for buffer in list(_buffers):
+        buffer.close(timeout)
+
+
+atexit.register(close_all)
@@ -0,0 +1,34 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Helpers for recording the SQL a test runs."""
+
+from contextlib import AbstractContextManager, contextmanager
+from typing import Any, Iterator
+from sqlalchemy import Engine, event
+
+
+@contextmanager
+def capture_statements(engine: Engine, prefix: str = "") -> Iterator[list[tuple[str, Any]]]:
+    """Collect (statement, parameters) for every statement starting with prefix run on engine.
+
+    An executemany call is captured once, with its list of parameter sets.
+    """
+    captured: list[tuple[str, Any]] = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(prefix.upper()):
+            captured.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield captured
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+def capture_selects(engine: Engine) -> AbstractContextManager[list[tuple[str, Any]]]:
+    """Collect (statement, parameters) for every SELECT run on engine."""
+    return capture_statements(engine, "SELECT")
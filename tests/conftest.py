@@ -9,20 +9,32 @@ import pytest
 from src import create_app
 from src.extensions import db
 from src.models import User, Survey, SurveyOption
+from src.write_behind import close_all
 from werkzeug.security import generate_password_hash
 
 
 @pytest.fixture
-def app():
-    """Create test app with in-memory database."""
-    app = create_app()
+def app_config():
+    """Per-test config overrides applied before extensions initialize."""
+    return {}
+
+
+@pytest.fixture
+def app(tmp_path, monkeypatch, app_config):
+    """Create test app with an ephemeral database."""
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "test.db"))
+    app = create_app({
+        "RATE_LIMIT_ENABLED": False,
+        "RATE_LIMIT_DB": str(tmp_path / "ratelimit.db"),
+        **app_config,
+    })
     app.config["TESTING"] = True
-    app.config["SQLALCHEMY_DATABASE_URI"] = "sqlite:///:memory:"
     app.config["WTF_CSRF_ENABLED"] = False
     
     with app.app_context():
         db.create_all()
         yield app
+        close_all()
         db.session.remove()
         db.drop_all()
 
@@ -0,0 +1,100 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the template bytecode cache and fingerprinted static assets."""
+
+import gzip
+import os
+import shutil
+import pytest
+from src import create_app
+from src.assets import StaticAssets, private_directory
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    """Keep the bytecode cache inside the test's directory."""
+    return {"TEMPLATE_CACHE_DIR": str(tmp_path / "jinja")}
+
+
+@pytest.fixture
+def static_copy(app, tmp_path):
+    """Serve static files from a scratch copy so compressed variants stay local."""
+    folder = tmp_path / "static"
+    shutil.copytree(app.static_folder, folder)
+    app.static_folder = str(folder)
+    app.extensions["static_assets"] = StaticAssets(folder)
+    return folder
+
+
+def test_pages_link_fingerprinted_css(client, app):
+    """Test templates get content-hashed static URLs."""
+    digest = app.extensions["static_assets"].digest("style.css")
+    page = client.get("/login").get_data(as_text=True)
+
+    assert f"/static/style.{digest}.css" in page
+
+
+def test_fingerprinted_asset_is_immutable(client, app, static_copy):
+    """Test hashed URLs get far-future caching and stale hashes 404."""
+    url = f"/static/{app.extensions['static_assets'].fingerprinted('style.css')}"
+    response = client.get(url)
+
+    assert response.status_code == 200
+    assert response.mimetype == "text/css"
+    assert "immutable" in response.headers["Cache-Control"]
+    assert "max-age=31536000" in response.headers["Cache-Control"]
+    assert "Content-Encoding" not in response.headers
+    assert client.get("/static/style.00000000.css").status_code == 404
+    assert "immutable" not in client.get("/static/style.css").headers.get("Cache-Control", "")
+
+
+def test_names_outside_static_folder_are_not_read(client, app, static_copy):
+    """Test traversal names are refused before any file is hashed or cached."""
+    (static_copy.parent / "secret.py").write_text("SECRET = 1\n")
+    assets = app.extensions["static_assets"]
+    digest = StaticAssets(static_copy.parent).digest("secret.py")
+
+    assert client.get(f"/static/../secret.{digest}.py").status_code == 404
+    assert assets.resolve(f"../secret.{digest}.py") is None
+    assert assets.digest("../secret.py") is None
+    assert assets.digest(str(static_copy.parent / "secret.py")) is None
+    (static_copy / "folder.d").mkdir()
+    assert assets.digest("folder.d") is None
+    assert assets._digests == {}
+
+
+def test_precompressed_variant_served(client, app, static_copy):
+    """Test compile-assets output is served to clients that accept gzip."""
+    result = app.test_cli_runner().invoke(args=["compile-assets"])
+    assert "Compiled" in result.output
+    assert (static_copy / "style.css.gz").exists()
+
+    url = f"/static/{app.extensions['static_assets'].fingerprinted('style.css')}"
+    response = client.get(url, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert response.mimetype == "text/css"
+    assert gzip.decompress(response.data) == (static_copy / "style.css").read_bytes()
+
+
+def test_templates_use_bytecode_cache(client, app, tmp_path):
+    """Test rendered templates are written to the shared bytecode cache."""
+    client.get("/login")
+
+    assert list((tmp_path / "jinja").iterdir())
+    assert oct((tmp_path / "jinja").stat().st_mode & 0o777) == "0o700"
+
+
+def test_shared_cache_directory_is_refused(tmp_path, monkeypatch):
+    """Test a cache directory others can write to is not used."""
+    shared = tmp_path / "shared"
+    shared.mkdir()
+    os.chmod(shared, 0o777)
+    assert not private_directory(str(shared))
+
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "test.db"))
+    app = create_app({"TEMPLATE_CACHE_DIR": str(shared), "RATE_LIMIT_DB": str(tmp_path / "ratelimit.db")})
+    assert app.jinja_env.bytecode_cache is None
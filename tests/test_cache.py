@@ -0,0 +1,70 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for in-process caches and generation counters."""
+
+from src.cache import GenerationalCache, TTLCache, bump_generation, current_generation
+from src.extensions import db
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_ttl_cache_expires_entries():
+    """Test entries disappear after their TTL."""
+    clock = FakeClock()
+    cache = TTLCache(maxsize=10, ttl=5, clock=clock)
+    cache.set("a", 1)
+
+    assert cache.get("a") == 1
+    clock.now = 5
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    """Test the least recently used entry is evicted first."""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    cache.pop("c")
+    assert cache.get("c", "gone") == "gone"
+
+
+def test_generation_counter(app):
+    """Test generation counters start at zero and increment."""
+    assert current_generation("things") == 0
+    bump_generation("things")
+    bump_generation("things")
+    db.session.commit()
+    assert current_generation("things") == 2
+
+
+def test_generational_cache_clears_on_bump(app):
+    """Test a generation bump clears the cache at the next check."""
+    clock = FakeClock()
+    cache = GenerationalCache("things", maxsize=10, ttl=60, check_interval=1, clock=clock)
+    cache.sync()
+    cache.set("a", 1)
+
+    bump_generation("things")
+    db.session.commit()
+    cache.sync()
+    assert cache.get("a") == 1
+
+    clock.now = 1
+    cache.sync()
+    assert cache.get("a") is None
@@ -0,0 +1,27 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for environment configuration."""
+
+from src.config import env_bool, env_float, env_int
+
+
+def test_env_helpers_defaults(monkeypatch):
+    """Test unset variables fall back to defaults."""
+    monkeypatch.delenv("SURVEY_TEST_VALUE", raising=False)
+    assert env_int("SURVEY_TEST_VALUE", 3) == 3
+    assert env_float("SURVEY_TEST_VALUE", 1.5) == 1.5
+    assert env_bool("SURVEY_TEST_VALUE", True) is True
+
+
+def test_env_helpers_parse(monkeypatch):
+    """Test variables are parsed into their types."""
+    monkeypatch.setenv("SURVEY_TEST_VALUE", "42")
+    assert env_int("SURVEY_TEST_VALUE", 0) == 42
+    assert env_float("SURVEY_TEST_VALUE", 0.0) == 42.0
+    monkeypatch.setenv("SURVEY_TEST_VALUE", "yes")
+    assert env_bool("SURVEY_TEST_VALUE", False) is True
+    monkeypatch.setenv("SURVEY_TEST_VALUE", "off")
+    assert env_bool("SURVEY_TEST_VALUE", True) is False
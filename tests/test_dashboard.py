@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the paginated dashboard."""
+
+from datetime import datetime, timedelta
+import pytest
+from src.dashboard import dashboard_page, decode_cursor, encode_cursor
+from src.extensions import db
+from src.ingest import insert_votes
+from src.models import Survey, SurveyOption
+from tests.capture import capture_selects
+
+
+@pytest.fixture
+def many_surveys(app, test_user):
+    """Five surveys, two sharing a created_at timestamp."""
+    base = datetime(2026, 1, 1)
+    stamps = [base, base + timedelta(days=1), base + timedelta(days=1),
+              base + timedelta(days=2), base + timedelta(days=3)]
+    ids = []
+    for index, created_at in enumerate(stamps):
+        survey = Survey(user_id=test_user, title=f"Survey {index}",
+                        description="x" * 500, created_at=created_at)
+        db.session.add(survey)
+        db.session.flush()
+        db.session.add(SurveyOption(survey_id=survey.id, option_text="Yes", option_order=1))
+        ids.append(survey.id)
+    db.session.commit()
+    return ids
+
+
+def test_cursor_round_trip():
+    """Test cursors encode and decode keyset positions."""
+    created_at = datetime(2026, 5, 4, 3, 2, 1)
+    assert decode_cursor(encode_cursor(created_at, 42)) == (created_at, 42)
+    assert decode_cursor("garbage") is None
+    assert decode_cursor(None) is None
+
+
+def test_keyset_pages_cover_every_survey_once(app, test_user, many_surveys):
+    """Test walking the pages returns each survey exactly once, newest first."""
+    seen = []
+    cursor = None
+    while True:
+        page = dashboard_page(test_user, cursor, page_size=2)
+        seen.extend(survey.title for survey in page.surveys)
+        if page.next_cursor is None:
+            break
+        cursor = page.next_cursor
+
+    assert seen == ["Survey 4", "Survey 3", "Survey 1", "Survey 2", "Survey 0"]
+
+
+def test_dashboard_stats_in_one_query(app, test_user, many_surveys):
+    """Test counts and last-response times come from one grouped query."""
+    survey_id = many_surveys[-1]
+    option = SurveyOption.query.filter_by(survey_id=survey_id).first()
+    insert_votes([
+        {"survey_id": survey_id, "option_id": option.id, "response_date": datetime(2026, 2, day)}
+        for day in (1, 5, 3)
+    ])
+    db.session.commit()
+
+    with capture_selects(db.engine) as captured:
+        page = dashboard_page(test_user, None, page_size=3)
+
+    assert len(captured) == 2
+    newest = page.surveys[0]
+    assert newest.response_count == 3
+    assert newest.last_response_at == datetime(2026, 2, 5)
+    assert page.surveys[1].response_count == 0
+    assert len(newest.description_preview) == 161
+
+
+def test_dashboard_pagination_links(authenticated_client, app, test_user, many_surveys):
+    """Test the dashboard renders a link to older surveys."""
+    app.config["DASHBOARD_PAGE_SIZE"] = 2
+    response = authenticated_client.get("/dashboard")
+
+    assert b"Survey 4" in response.data
+    assert b"Survey 1" not in response.data
+    assert b"Older surveys" in response.data
+    assert b"0 responses" in response.data
+
+    page = dashboard_page(test_user, None, 2)
+    response = authenticated_client.get("/dashboard", query_string={"after": page.next_cursor})
+    assert b"Survey 1" in response.data
+    assert b"Newest" in response.data
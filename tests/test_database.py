@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the SQLite engine profile."""
+
+import pytest
+from src.database import profile_report
+from src.extensions import db
+
+
+def test_default_profile_in_effect(app):
+    """Test every pooled connection gets the profile pragmas."""
+    report = profile_report(db.engine)
+
+    assert report["journal_mode"] == "wal"
+    assert report["synchronous"] == 1
+    assert report["busy_timeout"] == 5000
+    assert report["cache_size"] == -20000
+    assert report["temp_store"] == 2
+    assert report["foreign_keys"] == 1
+    # GUNICORN_THREADS (4) request threads plus two for background flushers.
+    assert "Pool size: 6" in report["pool"]
+
+
+@pytest.mark.parametrize("app_config", [{
+    "SQLITE_SYNCHRONOUS": "FULL",
+    "SQLITE_BUSY_TIMEOUT_MS": 250,
+    "DB_POOL_SIZE": 7,
+}])
+def test_profile_overrides(app):
+    """Test profile settings can be overridden."""
+    report = profile_report(db.engine)
+
+    assert report["synchronous"] == 2
+    assert report["busy_timeout"] == 250
+    assert "Pool size: 7" in report["pool"]
+
+
+def test_profile_is_logged(app, caplog):
+    """Test the startup report is logged."""
+    with caplog.at_level("INFO", logger="src.database"):
+        profile_report(db.engine)
+    assert "SQLite profile: journal_mode=wal" in caplog.text
@@ -0,0 +1,122 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for chunked survey and account deletion."""
+
+from datetime import datetime
+from sqlalchemy import func, select
+from src.deletion import delete_survey, delete_user
+from src.extensions import db
+from src.ingest import insert_votes
+from src.models import (
+    Survey, SurveyOption, SurveyOptionTally, SurveyResponse, SurveyResponseRollup, User, VoteBatch
+)
+from tests.capture import capture_statements
+
+
+def _add_votes(survey_id, count):
+    option_ids = [o.id for o in SurveyOption.query.filter_by(survey_id=survey_id)]
+    insert_votes([
+        {"survey_id": survey_id, "option_id": option_ids[i % len(option_ids)],
+         "response_date": datetime(2026, 3, 1, i % 24)}
+        for i in range(count)
+    ])
+    db.session.add(VoteBatch(survey_id=survey_id, idempotency_key="k", result="{}"))
+    db.session.commit()
+
+
+def _count(model, survey_id):
+    return db.session.scalar(select(func.count()).select_from(model).where(model.survey_id == survey_id))
+
+
+def test_delete_survey_in_chunks(app, test_survey):
+    """Test responses go in bounded chunks and dependents go by cascade."""
+    _add_votes(test_survey, 25)
+    with capture_statements(db.engine, "DELETE FROM survey_responses") as captured:
+        assert delete_survey(test_survey, chunk_size=10) == 25
+
+    assert len(captured) == 3
+    assert db.session.get(Survey, test_survey) is None
+    for model in (SurveyOption, SurveyResponse, SurveyOptionTally, SurveyResponseRollup, VoteBatch):
+        assert _count(model, test_survey) == 0
+
+
+def test_delete_survey_leaves_other_surveys(app, test_user, test_survey):
+    """Test only the requested survey is affected."""
+    other = Survey(user_id=test_user, title="Other", is_active=True)
+    other.options = [SurveyOption(option_text="A", option_order=1)]
+    db.session.add(other)
+    db.session.commit()
+    _add_votes(other.id, 3)
+
+    delete_survey(test_survey, chunk_size=2)
+    assert _count(SurveyResponse, other.id) == 3
+    assert delete_survey(test_survey) is None
+
+
+def test_orm_delete_does_not_load_responses(app, test_survey):
+    """Test deleting through the ORM leaves child rows to ON DELETE CASCADE."""
+    _add_votes(test_survey, 5)
+    survey = db.session.get(Survey, test_survey)
+    with capture_statements(db.engine) as captured:
+        db.session.delete(survey)
+        db.session.commit()
+
+    assert not [s for s, _ in captured if "FROM survey_responses" in s]
+    assert _count(SurveyResponse, test_survey) == 0
+
+
+def test_delete_user_removes_surveys(app, test_user, test_survey):
+    """Test account deletion removes every survey the user owns."""
+    _add_votes(test_survey, 4)
+    summary = delete_user(test_user, chunk_size=3)
+
+    assert (summary.surveys, summary.responses) == (1, 4)
+    assert db.session.get(User, test_user) is None
+    assert db.session.get(Survey, test_survey) is None
+    assert delete_user(test_user) is None
+
+
+def test_delete_survey_route(authenticated_client, test_survey):
+    """Test the owner can delete a survey from the dashboard."""
+    response = authenticated_client.post(f"/survey/{test_survey}/delete")
+    assert response.status_code == 302
+    assert db.session.get(Survey, test_survey) is None
+
+
+def test_delete_survey_route_requires_owner(client, app, test_survey):
+    """Test another user cannot delete the survey."""
+    db.session.add(User(email="other@example.com", password_hash=app.extensions["password_hasher"].hash("pw")))
+    db.session.commit()
+    client.post("/login", data={"email": "other@example.com", "password": "pw"})
+
+    client.post(f"/survey/{test_survey}/delete")
+    assert db.session.get(Survey, test_survey) is not None
+
+
+def test_delete_account_route(authenticated_client, test_user, test_survey):
+    """Test account deletion needs the password and logs the user out."""
+    authenticated_client.post("/account/delete", data={"password": "wrong"})
+    assert db.session.get(User, test_user) is not None
+
+    response = authenticated_client.post("/account/delete", data={"password": "password123"})
+    assert response.status_code == 302
+    assert "/login" in response.headers["Location"]
+    assert db.session.get(User, test_user) is None
+    assert authenticated_client.get("/dashboard").status_code == 302
+
+
+def test_delete_commands(app, test_user, test_survey):
+    """Test the delete-survey and delete-user CLI commands."""
+    _add_votes(test_survey, 3)
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=["delete-survey", str(test_survey), "--chunk-size", "2"])
+    assert "Deleted survey" in result.output and "3 responses" in result.output
+    assert runner.invoke(args=["delete-survey", str(test_survey)]).exit_code != 0
+
+    result = runner.invoke(args=["delete-user", "test@example.com"])
+    assert "Deleted test@example.com, 0 surveys" in result.output
+    assert runner.invoke(args=["delete-user", "test@example.com"]).exit_code != 0
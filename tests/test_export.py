@@ -0,0 +1,107 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for streaming response exports."""
+
+import csv
+import gzip
+import io
+import json
+from datetime import datetime
+import pytest
+from src.extensions import db
+from src.ingest import insert_votes
+from src.models import SurveyOption
+
+
+@pytest.fixture
+def votes(app, test_survey):
+    """Three votes spread over three days."""
+    option = SurveyOption.query.filter_by(survey_id=test_survey, option_order=1).first()
+    insert_votes([
+        {"survey_id": test_survey, "option_id": option.id, "respondent_email": f"r{day}@test.com",
+         "response_date": datetime(2026, 3, day, 12, 0)}
+        for day in (1, 2, 3)
+    ])
+    db.session.commit()
+    return test_survey
+
+
+def test_export_csv(authenticated_client, app, votes):
+    """Test CSV export streams every response with option text."""
+    app.config["EXPORT_BATCH_SIZE"] = 2
+    response = authenticated_client.get(f"/survey/{votes}/export")
+
+    assert response.mimetype == "text/csv"
+    assert response.is_streamed
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row["respondent_email"] for row in rows] == ["r1@test.com", "r2@test.com", "r3@test.com"]
+    assert rows[0]["option_text"] == "Option 1"
+    assert rows[0]["response_date"] == "2026-03-01T12:00:00"
+
+
+def test_export_csv_neutralizes_formulas(authenticated_client, votes):
+    """Test option text that a spreadsheet would run as a formula is quoted."""
+    for order, text in enumerate(("=HYPERLINK(\"http://evil\")", "-2+3", "@SUM(A1)"), 1):
+        SurveyOption.query.filter_by(survey_id=votes, option_order=order).first().option_text = text
+    db.session.commit()
+    response = authenticated_client.get(f"/survey/{votes}/export")
+
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert rows[0]["option_text"] == "'=HYPERLINK(\"http://evil\")"
+    assert rows[0]["respondent_email"] == "r1@test.com"
+
+    ndjson = authenticated_client.get(f"/survey/{votes}/export?format=ndjson").get_data(as_text=True)
+    assert json.loads(ndjson.splitlines()[0])["option_text"] == "=HYPERLINK(\"http://evil\")"
+
+
+def test_export_ndjson(authenticated_client, app, votes):
+    """Test NDJSON export emits one object per line."""
+    app.config["EXPORT_BATCH_SIZE"] = 2
+    response = authenticated_client.get(f"/survey/{votes}/export?format=ndjson")
+
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert response.mimetype == "application/x-ndjson"
+    assert len(records) == 3
+    assert records[2]["respondent_email"] == "r3@test.com"
+
+
+def test_export_date_range(authenticated_client, votes):
+    """Test start/end filters are inclusive of whole days."""
+    response = authenticated_client.get(
+        f"/survey/{votes}/export?format=ndjson&start=2026-03-02&end=2026-03-02"
+    )
+
+    records = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [r["respondent_email"] for r in records] == ["r2@test.com"]
+
+
+def test_export_gzip(authenticated_client, votes):
+    """Test exports are gzip encoded when the client accepts it."""
+    response = authenticated_client.get(
+        f"/survey/{votes}/export", headers={"Accept-Encoding": "gzip"}
+    )
+
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert gzip.decompress(response.data).decode().count("@test.com") == 3
+
+
+@pytest.mark.parametrize("query, message", [
+    ("format=xml", b"Unsupported export format"),
+    ("start=yesterday", b"Invalid date filter"),
+])
+def test_export_bad_arguments(authenticated_client, test_survey, query, message):
+    """Test invalid export arguments are rejected."""
+    response = authenticated_client.get(f"/survey/{test_survey}/export?{query}")
+
+    assert response.status_code == 400
+    assert message in response.data
+
+
+def test_export_requires_owner(authenticated_client):
+    """Test exports of unknown or foreign surveys are refused."""
+    response = authenticated_client.get("/survey/9999/export", follow_redirects=True)
+    assert b"Survey not found" in response.data
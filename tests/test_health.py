@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the liveness and readiness probes."""
+
+from sqlalchemy import create_engine, event
+from src.extensions import db
+from src.health import ReadinessCheck
+from tests.capture import capture_selects
+
+
+def test_health_bypasses_flask(authenticated_client, app):
+    """Test /health answers without sessions, the user loader or the database."""
+    app.extensions["user_cache"].clear()
+    with capture_selects(db.engine) as captured:
+        response = authenticated_client.get("/health")
+
+    assert response.status_code == 200
+    assert response.data == b"ok"
+    assert "Set-Cookie" not in response.headers
+    assert response.headers["Cache-Control"] == "no-store"
+    assert captured == []
+
+
+def test_ready_uses_no_pooled_connection(client, app):
+    """Test /ready checks the database outside the app's pool."""
+    checkouts = []
+
+    def on_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(db.engine, "checkout", on_checkout)
+    try:
+        response = client.get("/ready")
+    finally:
+        event.remove(db.engine, "checkout", on_checkout)
+
+    assert response.status_code == 200
+    assert response.data == b"ready"
+    assert "Set-Cookie" not in response.headers
+    assert checkouts == []
+
+
+def test_readiness_is_cached_and_reports_failures(tmp_path):
+    """Test results are reused within the cache window and failures give 503."""
+    now = [0.0]
+    engine = create_engine(f"sqlite:///{tmp_path / 'missing.db'}")
+    check = ReadinessCheck(engine, capacity=1, timeout=0.1, cache_seconds=5, clock=lambda: now[0])
+
+    ready, reason = check()
+    assert not ready and reason.startswith("database unavailable")
+
+    (tmp_path / "missing.db").touch()
+    assert check() == (ready, reason)
+    now[0] = 10
+    assert check() == (True, "ready")
+
+    with engine.connect():
+        now[0] = 20
+        assert check() == (False, "connection pool exhausted")
+    engine.dispose()
@@ -0,0 +1,101 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for ETag / Last-Modified handling."""
+
+from contextlib import contextmanager
+import pytest
+from flask import template_rendered
+from src.extensions import db
+from src.ingest import insert_votes
+from src.models import SurveyOption
+
+
+@contextmanager
+def rendered_templates(app):
+    recorded = []
+
+    def record(sender, template, context, **extra):
+        recorded.append(template.name)
+
+    template_rendered.connect(record, app)
+    try:
+        yield recorded
+    finally:
+        template_rendered.disconnect(record, app)
+
+
+@pytest.mark.parametrize("app_config", [{"PUBLIC_FORM_PROTECTION": "session"}])
+def test_survey_page_validators(client, test_survey):
+    """Test the public page carries cache validators."""
+    response = client.get(f"/s/{test_survey}")
+
+    assert response.headers["ETag"]
+    assert response.headers["Last-Modified"]
+    assert response.headers["Cache-Control"] == "private, no-cache"
+
+
+def test_signed_survey_page_is_public(client, test_user, test_survey):
+    """Test signed form tokens make the anonymous page shareable, but not the owner's."""
+    assert client.get(f"/s/{test_survey}").headers["Cache-Control"] == "public, max-age=60"
+
+    client.post("/login", data={"email": "test@example.com", "password": "password123"})
+    assert client.get(f"/s/{test_survey}").headers["Cache-Control"] == "private, no-cache"
+
+
+def test_survey_page_if_none_match(client, app, test_survey):
+    """Test a matching ETag short-circuits before rendering."""
+    etag = client.get(f"/s/{test_survey}").headers["ETag"]
+
+    with rendered_templates(app) as templates:
+        response = client.get(f"/s/{test_survey}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.data == b""
+    assert templates == []
+
+
+@pytest.mark.parametrize("app_config", [{"PUBLIC_FORM_PROTECTION": "session"}])
+def test_survey_page_if_modified_since(client, test_survey):
+    """Test Last-Modified revalidation of session-protected pages."""
+    last_modified = client.get(f"/s/{test_survey}").headers["Last-Modified"]
+
+    response = client.get(f"/s/{test_survey}", headers={"If-Modified-Since": last_modified})
+
+    assert response.status_code == 304
+
+
+def test_survey_version_changes_etag(authenticated_client, test_survey):
+    """Test editing a survey invalidates its validator."""
+    etag = authenticated_client.get(f"/s/{test_survey}").headers["ETag"]
+    authenticated_client.get(f"/survey/{test_survey}/toggle")
+    authenticated_client.get(f"/survey/{test_survey}/toggle")
+
+    response = authenticated_client.get(f"/s/{test_survey}", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_results_etag_follows_votes(authenticated_client, app, test_survey):
+    """Test results revalidate until a new vote arrives."""
+    etag = authenticated_client.get(f"/survey/{test_survey}/results").headers["ETag"]
+
+    with rendered_templates(app) as templates:
+        response = authenticated_client.get(
+            f"/survey/{test_survey}/results", headers={"If-None-Match": etag}
+        )
+    assert response.status_code == 304
+    assert templates == []
+
+    option = SurveyOption.query.filter_by(survey_id=test_survey).first()
+    insert_votes([{"survey_id": test_survey, "option_id": option.id}])
+    db.session.commit()
+
+    response = authenticated_client.get(
+        f"/survey/{test_survey}/results", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert b"1 total responses" in response.data
@@ -0,0 +1,154 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for vote ingestion and write-behind buffering."""
+
+import pytest
+from src import create_app
+from src.extensions import db
+from src.models import SurveyOption, SurveyResponse
+from src.write_behind import FlushTicket, WriteBehindBuffer, close_all
+
+ENQUEUE = {"VOTE_INGEST_MODE": "enqueue", "VOTE_FLUSH_INTERVAL_MS": 60000}
+FLUSH = {"VOTE_INGEST_MODE": "flush", "VOTE_FLUSH_INTERVAL_MS": 5}
+
+
+def _option_id(survey_id):
+    return SurveyOption.query.filter_by(survey_id=survey_id).first().id
+
+
+def _insert(rows):
+    db.session.execute(SurveyResponse.__table__.insert(), rows)
+
+
+def _vote_rows(survey_id, option_id, count):
+    return [
+        {"survey_id": survey_id, "option_id": option_id, "respondent_email": f"r{i}@test.com"}
+        for i in range(count)
+    ]
+
+
+def test_invalid_ingest_mode(tmp_path, monkeypatch):
+    """Test unknown ingest modes are rejected at startup."""
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "bad.db"))
+    with pytest.raises(ValueError):
+        create_app({"VOTE_INGEST_MODE": "sometimes"})
+
+
+@pytest.mark.parametrize("threads, warned", [(1, True), (4, False)])
+def test_flush_mode_warns_without_threads(tmp_path, monkeypatch, caplog, threads, warned):
+    """Test flush mode warns when workers have no other threads to batch with."""
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "flush.db"))
+    monkeypatch.setenv("GUNICORN_THREADS", str(threads))
+    create_app({"VOTE_INGEST_MODE": "flush", "RATE_LIMIT_DB": str(tmp_path / "ratelimit.db")})
+    close_all()
+    assert ("GUNICORN_THREADS > 1" in caplog.text) is warned
+
+
+def test_direct_mode_has_no_buffer(app):
+    """Test direct mode writes inline without a buffer."""
+    assert "vote_buffer" not in app.extensions
+
+
+@pytest.mark.parametrize("app_config", [ENQUEUE])
+def test_enqueue_mode_acks_before_write(client, app, test_survey):
+    """Test enqueue mode acknowledges and writes on drain."""
+    option_id = _option_id(test_survey)
+    for _ in range(3):
+        response = client.post(f"/s/{test_survey}", data={"option_id": option_id})
+        assert b"Thank You" in response.data
+
+    assert SurveyResponse.query.filter_by(survey_id=test_survey).count() == 0
+    assert len(app.extensions["vote_buffer"]) == 3
+
+    close_all()
+    assert SurveyResponse.query.filter_by(survey_id=test_survey).count() == 3
+
+
+@pytest.mark.parametrize("app_config", [FLUSH])
+def test_flush_mode_acks_after_commit(client, app, test_survey):
+    """Test flush mode only acknowledges committed votes."""
+    option_id = _option_id(test_survey)
+    response = client.post(f"/s/{test_survey}", data={
+        "option_id": option_id,
+        "email": "flush@test.com"
+    })
+
+    assert b"Thank You" in response.data
+    stored = SurveyResponse.query.filter_by(survey_id=test_survey).all()
+    assert [r.respondent_email for r in stored] == ["flush@test.com"]
+    assert stored[0].response_date is not None
+    app.extensions["vote_buffer"].close()
+
+
+@pytest.mark.parametrize("app_config", [dict(FLUSH, VOTE_FLUSH_INTERVAL_MS=60000, VOTE_ACK_TIMEOUT_MS=10)])
+def test_flush_mode_timeout_returns_503(client, app, test_survey):
+    """Test a vote still buffered at the timeout is withdrawn and reported."""
+    response = client.post(f"/s/{test_survey}", data={"option_id": _option_id(test_survey)})
+
+    assert response.status_code == 503
+    app.extensions["vote_buffer"].close()
+    assert SurveyResponse.query.count() == 0
+
+
+@pytest.mark.parametrize("app_config", [FLUSH])
+def test_flush_mode_timeout_in_flight_is_accepted(client, app, test_survey, monkeypatch):
+    """Test a vote the flusher already took is acknowledged, not retried."""
+    buffer = app.extensions["vote_buffer"]
+    monkeypatch.setattr(FlushTicket, "wait", lambda self, timeout=None: buffer.flush() or False)
+    response = client.post(f"/s/{test_survey}", data={"option_id": _option_id(test_survey)})
+
+    assert b"Thank You" in response.data
+    buffer.close()
+    assert SurveyResponse.query.count() == 1
+
+
+def test_batch_size_triggers_flush(app, test_survey):
+    """Test a full batch is written without waiting for the interval."""
+    buffer = WriteBehindBuffer(app, "test", _insert, max_batch=5, interval=60)
+    tickets = [buffer.submit(row) for row in _vote_rows(test_survey, _option_id(test_survey), 5)]
+
+    assert all(ticket.wait(5) for ticket in tickets)
+    assert SurveyResponse.query.count() == 5
+    buffer.close()
+
+
+def test_failed_batch_retries_rows_individually(app, test_survey, caplog):
+    """Test one bad row does not discard the rest of its batch."""
+    buffer = WriteBehindBuffer(app, "test", _insert, max_batch=10, interval=60)
+    rows = _vote_rows(test_survey, _option_id(test_survey), 3)
+    rows[1]["option_id"] = None
+    tickets = [buffer.submit(row) for row in rows]
+    buffer.flush()
+
+    assert [ticket.wait(0) for ticket in tickets] == [True, False, True]
+    assert tickets[1].error is not None
+    assert SurveyResponse.query.count() == 2
+    assert "dropped item" in caplog.text and "r1@test.com" not in caplog.text
+    buffer.close()
+
+
+def test_full_buffer_rejects_and_closed_buffer_rejects(app, test_survey):
+    """Test submit refuses work beyond max_pending and after close."""
+    buffer = WriteBehindBuffer(app, "test", _insert, max_batch=10, interval=60, max_pending=1)
+    rows = _vote_rows(test_survey, _option_id(test_survey), 2)
+
+    assert buffer.submit(rows[0]) is not None
+    assert buffer.submit(rows[1]) is None
+    buffer.close()
+    assert buffer.submit(rows[1]) is None
+    assert SurveyResponse.query.count() == 1
+
+
+@pytest.mark.parametrize("app_config", [dict(ENQUEUE, VOTE_BUFFER_MAX=1)])
+def test_full_vote_buffer_writes_through(client, app, test_survey):
+    """Test votes fall back to a direct write when the buffer is full."""
+    option_id = _option_id(test_survey)
+    client.post(f"/s/{test_survey}", data={"option_id": option_id})
+    client.post(f"/s/{test_survey}", data={"option_id": option_id})
+
+    assert SurveyResponse.query.count() == 1
+    close_all()
+    assert SurveyResponse.query.count() == 2
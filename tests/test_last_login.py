@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for coalesced last_login tracking."""
+
+from datetime import datetime, timedelta
+import pytest
+from src.extensions import db
+from src.last_login import write_last_logins
+from src.models import User
+from src.write_behind import close_all
+from werkzeug.security import generate_password_hash
+
+SLOW_FLUSH = {"LAST_LOGIN_FLUSH_INTERVAL_MS": 60000}
+
+
+def _login(client):
+    return client.post("/login", data={"email": "test@example.com", "password": "password123"})
+
+
+@pytest.mark.parametrize("app_config", [SLOW_FLUSH])
+def test_login_does_not_write_inline(client, app, test_user):
+    """Test login acknowledges before last_login is written."""
+    assert _login(client).status_code == 302
+    assert db.session.get(User, test_user).last_login is None
+
+    close_all()
+    db.session.expire_all()
+    assert db.session.get(User, test_user).last_login is not None
+
+
+@pytest.mark.parametrize("app_config", [SLOW_FLUSH])
+def test_repeat_logins_coalesce(client, app, test_user):
+    """Test several logins inside the window queue a single update."""
+    for _ in range(3):
+        _login(client)
+
+    assert len(app.extensions["last_login"].buffer) == 1
+
+
+def test_recent_stored_login_is_skipped(app, test_user):
+    """Test a login within the precision of the stored value is not queued."""
+    user = db.session.get(User, test_user)
+    user.last_login = datetime.utcnow() - timedelta(seconds=10)
+    db.session.commit()
+
+    assert app.extensions["last_login"].record(user) is False
+    user.last_login = datetime.utcnow() - timedelta(hours=1)
+    assert app.extensions["last_login"].record(user) is True
+
+
+def test_batch_writes_newest_per_user(app, test_user):
+    """Test a batch keeps the newest time per user and never moves backwards."""
+    other = User(email="other@example.com", password_hash=generate_password_hash("x"))
+    db.session.add(other)
+    db.session.commit()
+    t0 = datetime(2026, 1, 1, 12, 0)
+
+    write_last_logins([
+        {"user_id": test_user, "last_login": t0},
+        {"user_id": test_user, "last_login": t0 + timedelta(minutes=5)},
+        {"user_id": other.id, "last_login": t0},
+    ])
+    write_last_logins([{"user_id": other.id, "last_login": t0 - timedelta(days=1)}])
+    db.session.commit()
+    db.session.expire_all()
+
+    assert db.session.get(User, test_user).last_login == t0 + timedelta(minutes=5)
+    assert db.session.get(User, other.id).last_login == t0
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for live results over Server-Sent Events."""
+
+import json
+import pytest
+from src import create_app
+from src.extensions import db
+from src.ingest import insert_votes
+from src.live_results import SurveyFeed, TallyBroadcaster, event_stream, tally_payloads
+from src.models import SurveyOption
+from tests.capture import capture_selects
+
+# The background poller never ticks during a test; tests call poll() themselves.
+SSE = {"LIVE_RESULTS_MODE": "sse", "SSE_MAX_PUSHES_PER_SECOND": 0.01, "SSE_HEARTBEAT": 30.0}
+
+
+def _vote(app, survey_id):
+    with app.app_context():
+        option = SurveyOption.query.filter_by(survey_id=survey_id, option_order=2).first()
+        insert_votes([{"survey_id": survey_id, "option_id": option.id}])
+        db.session.commit()
+
+
+def test_feed_coalesces_to_latest():
+    """Test a slow viewer only sees the newest snapshot."""
+    feed = SurveyFeed()
+    feed.publish("a")
+    feed.publish("a")
+    feed.publish("b")
+
+    assert feed.wait(0, timeout=0) == (2, "b")
+    assert feed.wait(2, timeout=0) == (2, None)
+
+
+def test_one_read_per_tick_for_many_viewers(app, test_survey):
+    """Test many viewers of a survey share one tally query."""
+    broadcaster = TallyBroadcaster(app, interval=60)
+    feeds = [broadcaster.subscribe(test_survey) for _ in range(50)]
+
+    with capture_selects(db.engine) as captured:
+        broadcaster.poll()
+
+    assert len(captured) == 1
+    assert all(feed is feeds[0] for feed in feeds)
+    assert json.loads(feeds[0].payload) == {"total": 0, "counts": [0, 0, 0]}
+    for _ in feeds:
+        broadcaster.unsubscribe(test_survey)
+    assert broadcaster.feeds == {}
+
+
+def test_event_stream_ends_and_unsubscribes(app, test_survey):
+    """Test streams stop at max_duration and release their feed."""
+    broadcaster = TallyBroadcaster(app, interval=60)
+    initial = tally_payloads([test_survey])[test_survey]
+
+    messages = list(event_stream(broadcaster, test_survey, initial, max_duration=0.05, heartbeat=0.01))
+
+    assert messages[0].startswith("retry:")
+    assert messages[1] == f"event: tallies\ndata: {initial}\n\n"
+    assert ": keepalive\n\n" in messages
+    assert broadcaster.feeds == {}
+
+
+def _data(message):
+    return json.loads(message.split("data: ", 1)[1])
+
+
+@pytest.mark.parametrize("app_config", [SSE])
+def test_stream_pushes_new_votes(authenticated_client, app, test_survey):
+    """Test a vote during the stream is pushed to the viewer."""
+    response = authenticated_client.get(f"/survey/{test_survey}/results/stream", buffered=False)
+    messages = (chunk.decode() for chunk in response.response)
+    broadcaster = app.extensions["tally_broadcaster"]
+
+    assert response.mimetype == "text/event-stream"
+    assert next(messages).startswith("retry:")
+    assert _data(next(messages)) == {"total": 0, "counts": [0, 0, 0]}
+
+    _vote(app, test_survey)
+    broadcaster.poll()
+    assert _data(next(messages)) == {"total": 1, "counts": [0, 1, 0]}
+
+    response.close()
+    assert broadcaster.feeds == {}
+
+
+@pytest.mark.parametrize("app_config", [SSE])
+def test_stream_requires_owner(authenticated_client):
+    """Test streams are only available to the survey owner."""
+    assert authenticated_client.get("/survey/9999/results/stream").status_code == 404
+
+
+def test_stream_disabled_in_poll_mode(authenticated_client, app, test_survey):
+    """Test the default mode serves no streams and starts no poller."""
+    assert authenticated_client.get(f"/survey/{test_survey}/results/stream").status_code == 404
+    assert "tally_broadcaster" not in app.extensions
+
+
+def test_invalid_live_results_mode(tmp_path, monkeypatch):
+    """Test unknown live results modes are rejected at startup."""
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "bad.db"))
+    with pytest.raises(ValueError):
+        create_app({"LIVE_RESULTS_MODE": "websocket", "RATE_LIMIT_DB": str(tmp_path / "ratelimit.db")})
+
+
+def test_results_page_polls_by_default(authenticated_client, test_survey):
+    """Test the results page polls the tallies endpoint instead of streaming."""
+    response = authenticated_client.get(f"/survey/{test_survey}/results")
+    assert f"/api/surveys/{test_survey}/tallies".encode() in response.data
+    assert b"/results/stream" not in response.data
+
+
+@pytest.mark.parametrize("app_config", [SSE])
+def test_results_page_links_stream(authenticated_client, test_survey):
+    """Test the results page subscribes to the live stream in sse mode."""
+    response = authenticated_client.get(f"/survey/{test_survey}/results")
+    assert f"/survey/{test_survey}/results/stream".encode() in response.data
+
+
+def test_tallies_endpoint(authenticated_client, app, test_survey):
+    """Test the polling endpoint returns current counts to the owner only."""
+    _vote(app, test_survey)
+    response = authenticated_client.get(f"/api/surveys/{test_survey}/tallies")
+
+    assert response.get_json() == {"total": 1, "counts": [0, 1, 0]}
+    assert response.headers["Cache-Control"] == "no-store"
+    assert authenticated_client.get("/api/surveys/9999/tallies").status_code == 404
@@ -0,0 +1,69 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the opt-in metrics endpoint."""
+
+import pytest
+from src.metrics import MetricsRegistry, clear_directory, flush_all
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    """Enable metrics with a private collector directory."""
+    return {"METRICS_ENABLED": True, "METRICS_DIR": str(tmp_path / "metrics")}
+
+
+def _value(text, line_prefix):
+    line = next(line for line in text.splitlines() if line.startswith(line_prefix))
+    return float(line.rsplit(" ", 1)[1])
+
+
+@pytest.mark.parametrize("app_config", [{}])
+def test_metrics_disabled_by_default(client):
+    """Test /metrics does not exist unless enabled."""
+    assert client.get("/metrics").status_code == 404
+
+
+def test_request_sql_template_and_vote_metrics(authenticated_client, app, test_survey):
+    """Test per-route latency, SQL, template and vote counters are exposed."""
+    authenticated_client.get("/dashboard")
+    authenticated_client.post(f"/s/{test_survey}", data={"option_id": 1})
+    authenticated_client.get("/help")
+
+    body = authenticated_client.get("/metrics").get_data(as_text=True)
+
+    assert "# TYPE http_request_duration_seconds histogram" in body
+    dashboard = '{blueprint="surveys",endpoint="surveys.dashboard"}'
+    assert _value(body, f"http_request_duration_seconds_count{dashboard}") == 1
+    assert _value(body, f"db_statements_per_request_count{dashboard}") == 1
+    assert _value(body, f"db_statements_per_request_sum{dashboard}") >= 1
+    assert _value(body, 'http_requests_total{blueprint="pages",endpoint="pages.help_page",'
+                        'method="GET",status="200"}') == 1
+    assert _value(body, 'http_requests_total{blueprint="auth",endpoint="auth.login",'
+                        'method="POST",status="302"}') == 1
+    assert _value(body, "votes_ingested_total ") == 1
+    assert _value(body, 'template_render_seconds_count{template="dashboard.html"}') == 1
+    assert 'le="+Inf"' in body
+
+
+def test_metrics_aggregate_across_workers(app, client, tmp_path):
+    """Test values written by another process are summed into the output."""
+    other = MetricsRegistry(tmp_path / "metrics")
+    other.inc("votes_ingested_total", 5)
+    other.observe("http_request_duration_seconds", 0.02, blueprint="pages", endpoint="pages.help_page")
+    other.flush()
+    client.get("/help")
+
+    body = client.get("/metrics").get_data(as_text=True)
+
+    assert _value(body, "votes_ingested_total ") == 5
+    help_page = '{blueprint="pages",endpoint="pages.help_page"}'
+    assert _value(body, f"http_request_duration_seconds_count{help_page}") == 2
+    assert _value(body, f'http_request_duration_seconds_bucket{{blueprint="pages",'
+                        f'endpoint="pages.help_page",le="0.025"}}') >= 1
+
+    flush_all()
+    clear_directory(tmp_path / "metrics")
+    assert not (tmp_path / "metrics").exists()
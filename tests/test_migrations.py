@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for schema migrations."""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+import pytest
+from sqlalchemy import create_engine
+from src import create_app, migrations
+from src.extensions import db
+
+LEGACY_SCHEMA = (
+    "CREATE TABLE users (user_id INTEGER PRIMARY KEY, email VARCHAR(255) NOT NULL UNIQUE, "
+    "password_hash VARCHAR(255) NOT NULL, created_at DATETIME, last_login DATETIME)",
+    "CREATE TABLE surveys (survey_id INTEGER PRIMARY KEY, user_id INTEGER NOT NULL, "
+    "title VARCHAR(255) NOT NULL, description TEXT, is_active BOOLEAN, "
+    "created_at DATETIME, updated_at DATETIME)",
+    "CREATE TABLE survey_options (option_id INTEGER PRIMARY KEY, survey_id INTEGER NOT NULL, "
+    "option_text VARCHAR(255) NOT NULL, option_order INTEGER NOT NULL)",
+    "CREATE TABLE survey_responses (response_id INTEGER PRIMARY KEY, survey_id INTEGER NOT NULL, "
+    "option_id INTEGER NOT NULL, respondent_email VARCHAR(255), response_date DATETIME)",
+    "INSERT INTO users VALUES (1, 'legacy@test.com', 'x', NULL, NULL)",
+    "INSERT INTO surveys VALUES (1, 1, 'Legacy', NULL, 1, '2026-01-01 00:00:00', NULL)",
+    "INSERT INTO survey_options VALUES (1, 1, 'Yes', 1), (2, 1, 'No', 2)",
+    "INSERT INTO survey_responses VALUES (1, 1, 1, NULL, '2026-01-02 10:00:00'), "
+    "(2, 1, 1, NULL, '2026-01-03 10:00:00'), (3, 1, 2, NULL, '2026-01-02 11:00:00')",
+)
+
+
+def _index_names(connection):
+    rows = connection.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'index'")
+    return {row[0] for row in rows}
+
+
+def test_new_database_is_at_head(app):
+    """Test a freshly created database is fully migrated."""
+    with db.engine.connect() as connection:
+        assert migrations.schema_version(connection) == migrations.HEAD
+
+
+def test_upgrade_legacy_database(tmp_path):
+    """Test migrations bring a pre-migration database to head."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'legacy.db'}")
+    with engine.begin() as connection:
+        for statement in LEGACY_SCHEMA:
+            connection.exec_driver_sql(statement)
+    # Mirrors create_app: create_all only adds tables that are missing.
+    db.metadata.create_all(engine)
+
+    assert migrations.upgrade(engine) == [m.version for m in migrations.MIGRATIONS]
+    assert migrations.upgrade(engine) == []
+
+    with engine.connect() as connection:
+        assert migrations.schema_version(connection) == migrations.HEAD
+        assert {
+            "ix_survey_responses_survey_option",
+            "ix_surveys_user_created",
+            "ix_survey_options_survey_order",
+        } <= _index_names(connection)
+        tallies = connection.exec_driver_sql(
+            "SELECT option_id, vote_count, last_response_at FROM survey_option_tallies ORDER BY option_id"
+        ).all()
+        assert [tuple(row) for row in tallies] == [
+            (1, 2, "2026-01-03 10:00:00"), (2, 1, "2026-01-02 11:00:00")
+        ]
+        daily = connection.exec_driver_sql(
+            "SELECT bucket, option_id, vote_count FROM survey_response_rollups "
+            "WHERE granularity = 'day' ORDER BY bucket, option_id"
+        ).all()
+        assert [tuple(row) for row in daily] == [
+            ("2026-01-02 00:00:00.000000", 1, 1),
+            ("2026-01-02 00:00:00.000000", 2, 1),
+            ("2026-01-03 00:00:00.000000", 1, 1),
+        ]
+        cascades = {
+            (table, row[3]): row[6]
+            for table in ("surveys", "survey_options", "survey_responses")
+            for row in connection.exec_driver_sql(f"PRAGMA foreign_key_list({table})")
+        }
+        assert set(cascades.values()) == {"CASCADE"}
+        assert len(cascades) == 4
+        assert {"ix_survey_responses_option", "uq_survey_responses_respondent"} <= _index_names(connection)
+        # Triggers dropped with the rebuilt table are back.
+        connection.exec_driver_sql(
+            "INSERT INTO survey_responses (survey_id, option_id, response_date) "
+            "VALUES (1, 2, '2026-01-04 09:00:00')"
+        )
+        assert connection.exec_driver_sql(
+            "SELECT vote_count FROM survey_option_tallies WHERE option_id = 2"
+        ).scalar() == 2
+        connection.rollback()
+    engine.dispose()
+
+
+def test_upgrade_removes_orphan_rows(tmp_path, caplog):
+    """Test responses to missing options or surveys are removed, not a failed migration."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'orphans.db'}")
+    with engine.begin() as connection:
+        for statement in LEGACY_SCHEMA:
+            connection.exec_driver_sql(statement)
+        connection.exec_driver_sql(
+            "INSERT INTO survey_responses VALUES (4, 1, 99, NULL, '2026-01-02 12:00:00'), "
+            "(5, 42, 98, NULL, '2026-01-02 12:00:00')"
+        )
+    db.metadata.create_all(engine)
+
+    assert migrations.upgrade(engine) == [m.version for m in migrations.MIGRATIONS]
+
+    with engine.connect() as connection:
+        assert connection.exec_driver_sql("PRAGMA foreign_key_check").all() == []
+        responses = connection.exec_driver_sql("SELECT response_id FROM survey_responses ORDER BY 1")
+        assert [row[0] for row in responses] == [1, 2, 3]
+        tallies = connection.exec_driver_sql(
+            "SELECT option_id, vote_count FROM survey_option_tallies ORDER BY option_id"
+        ).all()
+        assert [tuple(row) for row in tallies] == [(1, 2), (2, 1)]
+        daily = connection.exec_driver_sql(
+            "SELECT SUM(vote_count) FROM survey_response_rollups WHERE granularity = 'day'"
+        ).scalar()
+        assert daily == 3
+    assert "Removed 2 rows from survey_responses" in caplog.text
+    engine.dispose()
+
+
+def test_migrate_command(app):
+    """Test the migrate CLI command."""
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=["migrate"])
+    assert "Applied migrations: none" in result.output
+
+    result = runner.invoke(args=["migrate", "--status"])
+    assert f"Schema version {migrations.HEAD}" in result.output
+
+
+def test_migrate_command_without_auto_migrate(tmp_path, monkeypatch):
+    """Test 'flask migrate' upgrades a version 0 database the app refuses to start on."""
+    database = tmp_path / "legacy.db"
+    engine = create_engine(f"sqlite:///{database}")
+    with engine.begin() as connection:
+        for statement in LEGACY_SCHEMA:
+            connection.exec_driver_sql(statement)
+    engine.dispose()
+    monkeypatch.setenv("DATABASE_PATH", str(database))
+    monkeypatch.setenv("SCHEMA_AUTO_MIGRATE", "false")
+    monkeypatch.setenv("RATE_LIMIT_DB", str(tmp_path / "ratelimit.db"))
+    with pytest.raises(migrations.SchemaVersionError):
+        create_app()
+
+    result = subprocess.run(
+        [sys.executable, "-m", "flask", "--app", "run", "migrate"],
+        cwd=Path(__file__).parent.parent, env=os.environ.copy(), capture_output=True, text=True, timeout=60,
+    )
+
+    assert result.returncode == 0, result.stderr
+    versions = ", ".join(str(m.version) for m in migrations.MIGRATIONS)
+    assert f"Applied migrations: {versions}" in result.stdout
+    assert f"Schema version {migrations.HEAD}" in result.stdout
+    create_app()
@@ -0,0 +1,121 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for password hashing and rehash-on-login."""
+
+import runpy
+import threading
+from pathlib import Path
+import pytest
+from src import passwords
+from src.models import User
+from src.passwords import PasswordHasher, PasswordHasherBusy
+
+FAST_PBKDF2 = "pbkdf2:sha256:1000"
+GUNICORN_CONF = runpy.run_path(str(Path(__file__).parent.parent / "gunicorn.conf.py"))
+
+
+def test_hash_and_verify_inline():
+    """Test inline hashing round-trips."""
+    hasher = PasswordHasher(FAST_PBKDF2, 8)
+    pwhash = hasher.hash("secret")
+
+    assert pwhash.startswith("pbkdf2:sha256:1000$")
+    assert hasher.verify(pwhash, "secret")
+    assert not hasher.verify(pwhash, "wrong")
+    assert not hasher.needs_rehash(pwhash)
+
+
+def test_needs_rehash_on_parameter_change():
+    """Test hashes with other methods, costs or salt lengths are flagged."""
+    hasher = PasswordHasher(FAST_PBKDF2, 8)
+
+    assert hasher.needs_rehash(PasswordHasher("pbkdf2:sha256:2000", 8).hash("x"))
+    assert hasher.needs_rehash(PasswordHasher(FAST_PBKDF2, 16).hash("x"))
+    assert hasher.method_prefix == FAST_PBKDF2
+
+
+def test_process_pool_hashing():
+    """Test hashing through the process pool."""
+    hasher = PasswordHasher(FAST_PBKDF2, 8, workers=1)
+    try:
+        assert hasher.verify(hasher.hash("secret"), "secret")
+    finally:
+        hasher.shutdown()
+
+
+def test_saturated_pool_raises_busy():
+    """Test callers are refused rather than queued when the pool is full."""
+    hasher = PasswordHasher(FAST_PBKDF2, 8, workers=1, max_pending=1)
+    hasher._slots.acquire()
+
+    with pytest.raises(PasswordHasherBusy):
+        hasher.hash("secret")
+    hasher.shutdown()
+
+
+@pytest.mark.parametrize("app_config", [{"PASSWORD_HASH_METHOD": FAST_PBKDF2}])
+def test_login_upgrades_hash(client, app, test_user):
+    """Test a successful login rehashes with the configured parameters."""
+    client.post("/login", data={"email": "test@example.com", "password": "password123"})
+
+    stored = User.query.filter_by(email="test@example.com").first().password_hash
+    assert stored.startswith(FAST_PBKDF2 + "$")
+    assert app.extensions["password_hasher"].verify(stored, "password123")
+
+
+def test_login_keeps_current_hash(client, app, test_user):
+    """Test hashes already using the configured parameters are left alone."""
+    before = User.query.filter_by(email="test@example.com").first().password_hash
+    client.post("/login", data={"email": "test@example.com", "password": "password123"})
+
+    assert User.query.filter_by(email="test@example.com").first().password_hash == before
+
+
+def test_login_sheds_load_when_busy(client, app, test_user, monkeypatch):
+    """Test a saturated hasher yields 503 with Retry-After."""
+    def busy(*args):
+        raise PasswordHasherBusy("busy")
+
+    monkeypatch.setattr(app.extensions["password_hasher"], "verify", busy)
+    response = client.post("/login", data={"email": "test@example.com", "password": "password123"})
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+
+def test_shipped_workers_shed_login_storm(app, test_user, monkeypatch):
+    """Test a login on every thread of a shipped worker sheds the excess with 503."""
+    threads = GUNICORN_CONF["threads"]
+    max_pending = app.config["PASSWORD_HASH_MAX_PENDING"]
+    assert GUNICORN_CONF["worker_class"] == "gthread"
+    assert app.config["WORKER_THREADS"] == threads
+    assert 0 < max_pending < threads
+
+    release = threading.Event()
+    monkeypatch.setattr(passwords, "check_password_hash", lambda *args: release.wait(10))
+    statuses = []
+    shed = threading.Semaphore(0)
+
+    def login():
+        response = app.test_client().post(
+            "/login", data={"email": "test@example.com", "password": "password123"}
+        )
+        statuses.append(response.status_code)
+        if response.status_code == 503:
+            shed.release()
+
+    storm = [threading.Thread(target=login) for _ in range(threads)]
+    for thread in storm:
+        thread.start()
+    try:
+        for _ in range(threads - max_pending):
+            assert shed.acquire(timeout=10)
+    finally:
+        release.set()
+        for thread in storm:
+            thread.join()
+
+    assert sorted(statuses) == [302] * max_pending + [503] * (threads - max_pending)
@@ -0,0 +1,66 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the development request profiler."""
+
+import logging
+import pytest
+from src.extensions import db
+from src.models import Survey, SurveyOption
+from src.profiler import statement_shape
+
+
+@pytest.fixture
+def app_config(tmp_path):
+    """Enable the profiler, sampling every request with no slow threshold."""
+    return {
+        "PROFILER_ENABLED": True,
+        "PROFILER_SAMPLE_RATE": 1.0,
+        "PROFILER_SLOW_MS": 0,
+        "PROFILER_DIR": str(tmp_path / "profiles"),
+    }
+
+
+def test_statement_shape_collapses_in_lists():
+    """Test IN lists of different lengths share one shape."""
+    assert statement_shape("SELECT a FROM t WHERE id IN (?, ?)") == \
+        statement_shape("SELECT  a FROM t\n WHERE id IN (?, ?, ?, ?)")
+
+
+def test_lazy_loads_flagged_as_n_plus_one(app, client, test_user, caplog, tmp_path):
+    """Test one lazy load per row is reported with its caller."""
+    for i in range(3):
+        survey = Survey(user_id=test_user, title=f"S{i}")
+        survey.options.append(SurveyOption(option_text="A", option_order=1))
+        db.session.add(survey)
+    db.session.commit()
+    db.session.remove()
+
+    @app.route("/n-plus-one")
+    def n_plus_one():
+        return str(sum(len(survey.options) for survey in Survey.query.all()))
+
+    with caplog.at_level(logging.INFO, logger="src.profiler"):
+        response = client.get("/n-plus-one")
+
+    assert response.headers["X-Query-Count"] == "4"
+    assert response.headers["X-Query-Repeats"] == "1"
+    assert 'db;dur=' in response.headers["Server-Timing"]
+    warning = next(r.getMessage() for r in caplog.records if "Possible N+1" in r.getMessage())
+    assert "3 x SELECT" in warning
+    assert "tests/test_profiler.py" in warning
+    assert list((tmp_path / "profiles").glob("*-n_plus_one-*ms.prof"))
+
+
+def test_dashboard_has_no_repeated_queries(authenticated_client, app, test_survey):
+    """Test the dashboard loads its surveys without per-row queries."""
+    for i in range(4):
+        db.session.add(Survey(user_id=db.session.get(Survey, test_survey).user_id, title=f"Extra {i}"))
+    db.session.commit()
+
+    response = authenticated_client.get("/dashboard")
+
+    assert response.status_code == 200
+    assert response.headers["X-Query-Repeats"] == "0"
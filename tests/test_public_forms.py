@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for stateless public form tokens and the shared survey page."""
+
+import re
+import pytest
+from flask import template_rendered
+from src.models import SurveyOption, SurveyResponse
+from src.public_forms import SignedFormTokens
+
+TOKEN = re.compile(r'name="form_token" value="([^"]+)"')
+
+
+@pytest.fixture
+def csrf_app(app):
+    app.config["WTF_CSRF_ENABLED"] = True
+    return app
+
+
+def _option_id(survey_id):
+    return SurveyOption.query.filter_by(survey_id=survey_id).first().id
+
+
+def test_tokens_expire_after_two_windows():
+    """Test a token is accepted for its window and the next one only."""
+    now = [1000.0]
+    tokens = SignedFormTokens("secret", window=100, clock=lambda: now[0])
+    token = tokens.issue(7)
+
+    assert tokens.issue(7) == token
+    assert tokens.verify(7, token)
+    assert not tokens.verify(8, token)
+    assert not SignedFormTokens("other", window=100, clock=lambda: now[0]).verify(7, token)
+    now[0] = 1199.0
+    assert tokens.verify(7, token)
+    now[0] = 1200.0
+    assert not tokens.verify(7, token)
+    assert not tokens.verify(7, "garbage")
+
+
+def test_page_identical_for_visitors(csrf_app, test_survey):
+    """Test anonymous visitors get the same page without a session cookie."""
+    first = csrf_app.test_client().get(f"/s/{test_survey}")
+    second = csrf_app.test_client().get(f"/s/{test_survey}")
+
+    assert first.data == second.data
+    assert "Set-Cookie" not in first.headers
+    assert b'name="csrf_token"' not in first.data
+
+
+def test_page_rendered_once(csrf_app, test_survey):
+    """Test the shared page is served from the in-process cache."""
+    csrf_app.test_client().get(f"/s/{test_survey}")
+    rendered = []
+
+    def record(sender, template, context, **extra):
+        rendered.append(template.name)
+
+    template_rendered.connect(record, csrf_app)
+    try:
+        response = csrf_app.test_client().get(f"/s/{test_survey}")
+    finally:
+        template_rendered.disconnect(record, csrf_app)
+    assert response.status_code == 200
+    assert rendered == []
+
+
+def test_if_modified_since_does_not_outlive_token(csrf_app, test_survey):
+    """Test a signed page is revalidated by ETag only, so a new window re-renders it."""
+    client = csrf_app.test_client()
+    page = client.get(f"/s/{test_survey}")
+    assert "Last-Modified" not in page.headers
+    token = TOKEN.search(page.get_data(as_text=True)).group(1)
+
+    tokens = csrf_app.extensions["form_tokens"]
+    later = tokens.clock() + 3 * tokens.window
+    tokens.clock = lambda: later
+    response = client.get(f"/s/{test_survey}", headers={"If-Modified-Since": "Fri, 01 Jan 2100 00:00:00 GMT"})
+
+    assert response.status_code == 200
+    fresh = TOKEN.search(response.get_data(as_text=True)).group(1)
+    assert fresh != token
+    response = client.post(f"/s/{test_survey}", data={"option_id": _option_id(test_survey), "form_token": fresh})
+    assert response.status_code == 200
+
+
+def test_vote_requires_valid_token(csrf_app, test_survey):
+    """Test votes need the signed token for this survey."""
+    client = csrf_app.test_client()
+    token = TOKEN.search(client.get(f"/s/{test_survey}").get_data(as_text=True)).group(1)
+    option_id = _option_id(test_survey)
+
+    assert client.post(f"/s/{test_survey}", data={"option_id": option_id}).status_code == 400
+    forged = csrf_app.extensions["form_tokens"].issue(test_survey + 1)
+    response = client.post(f"/s/{test_survey}", data={"option_id": option_id, "form_token": forged})
+    assert response.status_code == 400
+    assert SurveyResponse.query.count() == 0
+
+    fresh = csrf_app.test_client()
+    response = fresh.post(f"/s/{test_survey}", data={"option_id": option_id, "form_token": token})
+    assert response.status_code == 200
+    assert SurveyResponse.query.count() == 1
+
+
+def test_owner_pages_keep_session_csrf(csrf_app, authenticated_client, test_survey):
+    """Test authenticated forms still require Flask-WTF's token."""
+    assert authenticated_client.post(f"/survey/{test_survey}/delete").status_code == 400
+
+
+@pytest.mark.parametrize("app_config", [{"PUBLIC_FORM_PROTECTION": "session"}])
+def test_session_mode(csrf_app, test_survey):
+    """Test session mode keeps per-visitor CSRF tokens."""
+    client = csrf_app.test_client()
+    page = client.get(f"/s/{test_survey}")
+
+    assert b'name="csrf_token"' in page.data
+    assert b'name="form_token"' not in page.data
+    assert client.post(f"/s/{test_survey}", data={"option_id": _option_id(test_survey)}).status_code == 400
+
+
+def test_unknown_mode_rejected():
+    """Test a misspelled protection mode fails at startup."""
+    from src import create_app
+    with pytest.raises(ValueError, match="PUBLIC_FORM_PROTECTION"):
+        create_app({"PUBLIC_FORM_PROTECTION": "cookie"})
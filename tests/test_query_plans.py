@@ -0,0 +1,49 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Check that route queries are served by indexes."""
+
+from src.extensions import db
+from src.models import SurveyOption
+from src.query_plans import explain, full_scans
+from tests.capture import capture_selects
+
+
+def test_full_scans_detection():
+    """Test plan lines are classified correctly."""
+    plan = [
+        "SCAN surveys",
+        "SCAN surveys USING INDEX ix_surveys_user_created",
+        "SEARCH survey_options USING INDEX ix_survey_options_survey_order (survey_id=?)",
+        "SCAN CONSTANT ROW",
+    ]
+    assert full_scans(plan) == ["SCAN surveys"]
+
+
+def test_routes_avoid_full_table_scans(authenticated_client, app, test_survey):
+    """Test every SELECT issued by the routes uses an index."""
+    option_id = SurveyOption.query.filter_by(survey_id=test_survey).first().id
+    db.session.remove()
+
+    with capture_selects(db.engine) as captured:
+        authenticated_client.get("/dashboard")
+        authenticated_client.get("/dashboard?after=2026-01-01T00:00:00_1")
+        authenticated_client.get(f"/s/{test_survey}")
+        authenticated_client.post(f"/s/{test_survey}", data={"option_id": option_id})
+        authenticated_client.get(f"/survey/{test_survey}/results")
+        authenticated_client.get(f"/survey/{test_survey}/export?start=2026-01-01").get_data()
+        authenticated_client.get(f"/survey/{test_survey}/toggle")
+        authenticated_client.post("/login", data={
+            "email": "test@example.com",
+            "password": "password123"
+        })
+
+    assert captured
+    with db.engine.connect() as connection:
+        offenders = {
+            statement: full_scans(explain(connection, statement, parameters))
+            for statement, parameters in captured
+        }
+    assert {s: scans for s, scans in offenders.items() if scans} == {}
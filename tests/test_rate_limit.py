@@ -0,0 +1,128 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the host-wide vote rate limiter."""
+
+import pytest
+from src import create_app
+from src.extensions import db
+from src.models import SurveyOption, SurveyResponse
+from src.rate_limit import TokenBucketStore
+from tests.capture import capture_statements
+
+LIMITED = {
+    "RATE_LIMIT_ENABLED": True,
+    "RATE_LIMIT_CLIENT_RATE": 0.01,
+    "RATE_LIMIT_CLIENT_BURST": 2,
+    "RATE_LIMIT_SURVEY_RATE": 0.01,
+    "RATE_LIMIT_SURVEY_BURST": 3,
+}
+
+
+def _vote(client, survey_id, address="10.0.0.1", option_id=None):
+    option_id = option_id or SurveyOption.query.filter_by(survey_id=survey_id).first().id
+    return client.post(f"/s/{survey_id}", data={"option_id": option_id},
+                       environ_base={"REMOTE_ADDR": address})
+
+
+@pytest.mark.parametrize("config, warned", [
+    ({}, False),
+    ({"RATE_LIMIT_ENABLED": True}, True),
+    ({"RATE_LIMIT_ENABLED": True, "PROXY_FIX_X_FOR": 1}, False),
+])
+def test_enabling_without_proxy_hops_warns(tmp_path, monkeypatch, caplog, config, warned):
+    """Test limits are off by default and warn when enabled without trusted proxies."""
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "limits.db"))
+    monkeypatch.delenv("RATE_LIMIT_ENABLED", raising=False)
+    app = create_app({"RATE_LIMIT_DB": str(tmp_path / "ratelimit.db"), **config})
+
+    assert app.config["RATE_LIMIT_ENABLED"] is bool(config)
+    assert ("every voter shares one bucket" in caplog.text) is warned
+
+
+def test_bucket_refills_over_time(tmp_path):
+    """Test a bucket allows a burst, then one token per 1/rate seconds."""
+    now = [100.0]
+    store = TokenBucketStore(str(tmp_path / "buckets.db"), clock=lambda: now[0])
+
+    assert [store.take("k", rate=0.5, burst=2) for _ in range(3)] == [True, True, False]
+    now[0] += 1.0
+    assert not store.take("k", rate=0.5, burst=2)
+    now[0] += 1.0
+    assert store.take("k", rate=0.5, burst=2)
+    assert store.take("other", rate=0.5, burst=2)
+
+
+def test_buckets_shared_between_processes(tmp_path):
+    """Test separate stores on one file (as separate workers) share limits."""
+    path = str(tmp_path / "buckets.db")
+    first, second = TokenBucketStore(path), TokenBucketStore(path)
+
+    assert first.take("k", rate=0.001, burst=2)
+    assert second.take("k", rate=0.001, burst=2)
+    assert not first.take("k", rate=0.001, burst=2)
+
+
+def test_prune_removes_refilled_buckets(tmp_path):
+    """Test idle buckets are dropped once they would be full again."""
+    now = [100.0]
+    store = TokenBucketStore(str(tmp_path / "buckets.db"), clock=lambda: now[0])
+    store.take("k", rate=1.0, burst=5)
+    now[0] += 10
+    assert store.prune(max_idle=5) == 1
+
+
+@pytest.mark.parametrize("app_config", [LIMITED])
+def test_client_limit_rejects_before_flask(client, test_survey):
+    """Test an over-limit vote gets 429 without touching the app database or session."""
+    assert _vote(client, test_survey).status_code == 200
+    assert _vote(client, test_survey).status_code == 200
+    option_id = SurveyOption.query.filter_by(survey_id=test_survey).first().id
+    with capture_statements(db.engine) as captured:
+        response = _vote(client, test_survey, option_id=option_id)
+    assert response.status_code == 429
+    assert response.headers["Retry-After"] == "100"
+    assert "Set-Cookie" not in response.headers
+    assert captured == []
+    assert SurveyResponse.query.count() == 2
+
+
+@pytest.mark.parametrize("app_config", [LIMITED])
+def test_survey_limit_applies_across_clients(client, test_survey):
+    """Test the per-survey bucket caps all clients together."""
+    statuses = [_vote(client, test_survey, f"10.0.0.{i}").status_code for i in range(4)]
+    assert statuses == [200, 200, 200, 429]
+    assert client.get(f"/s/{test_survey}").status_code == 200
+
+
+@pytest.mark.parametrize("app_config", [{**LIMITED, "RATE_LIMIT_DB": "/proc/no-such-dir/rl.db"}])
+def test_fails_open(client, test_survey):
+    """Test an unusable sidecar lets votes through."""
+    assert [_vote(client, test_survey).status_code for _ in range(3)] == [200, 200, 200]
+
+
+@pytest.mark.parametrize("app_config", [LIMITED])
+def test_survey_rejection_keeps_client_tokens(app, client, test_survey):
+    """Test a vote refused by the survey bucket does not spend the client's token."""
+    assert _vote(client, test_survey, "10.0.0.1").status_code == 200
+    assert _vote(client, test_survey, "10.0.0.2").status_code == 200
+    assert _vote(client, test_survey, "10.0.0.3").status_code == 200
+    assert _vote(client, test_survey, "10.0.0.1").status_code == 429
+
+    store = app.extensions["rate_limit"]
+    assert store.take(f"client:10.0.0.1:{test_survey}", rate=0.01, burst=2)
+
+
+@pytest.mark.parametrize("app_config", [{**LIMITED, "PROXY_FIX_X_FOR": 1}])
+def test_clients_keyed_by_forwarded_address(client, test_survey):
+    """Test voters behind one trusted proxy get their own client buckets."""
+    def vote(forwarded_for):
+        option_id = SurveyOption.query.filter_by(survey_id=test_survey).first().id
+        return client.post(f"/s/{test_survey}", data={"option_id": option_id},
+                           headers={"X-Forwarded-For": forwarded_for},
+                           environ_base={"REMOTE_ADDR": "10.0.0.1"}).status_code
+
+    assert [vote("203.0.113.7") for _ in range(3)] == [200, 200, 429]
+    assert vote("203.0.113.8") == 200
@@ -0,0 +1,136 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for one-vote-per-respondent surveys and the duplicate vote filter."""
+
+import logging
+import pytest
+from src.extensions import db
+from src.models import Survey, SurveyOption, SurveyResponse
+from src.respondents import BloomFilter, RespondentIndex
+from tests.capture import capture_statements
+
+
+@pytest.fixture
+def one_vote_survey(app, test_survey):
+    db.session.get(Survey, test_survey).one_vote_per_respondent = True
+    db.session.commit()
+    return test_survey
+
+
+def _option_id(survey_id):
+    return SurveyOption.query.filter_by(survey_id=survey_id).first().id
+
+
+def _vote(client, survey_id, email=""):
+    return client.post(f"/s/{survey_id}", data={"option_id": _option_id(survey_id), "email": email})
+
+
+def test_bloom_filter_has_no_false_negatives():
+    """Test added keys are always found and the false positive rate holds."""
+    bloom = BloomFilter(capacity=2000, error_rate=0.01)
+    for i in range(2000):
+        bloom.add(f"in-{i}")
+
+    assert all(f"in-{i}" in bloom for i in range(2000))
+    false_positives = sum(f"out-{i}" in bloom for i in range(10000))
+    assert false_positives < 300
+    assert len(bloom._bits) * 8 >= bloom.size and not bloom.saturated
+
+
+def test_one_vote_per_email(client, one_vote_survey):
+    """Test a respondent's second vote is refused, by email or client address."""
+    assert _vote(client, one_vote_survey, "a@test.com").status_code == 200
+    assert _vote(client, one_vote_survey, "A@Test.com ").status_code == 409
+    assert _vote(client, one_vote_survey, "b@test.com").status_code == 200
+    assert _vote(client, one_vote_survey).status_code == 200
+    assert _vote(client, one_vote_survey).status_code == 409
+    assert SurveyResponse.query.count() == 3
+
+
+@pytest.mark.parametrize("app_config", [{"PROXY_FIX_X_FOR": 1}])
+def test_anonymous_voters_behind_proxy(client, one_vote_survey):
+    """Test anonymous respondents are keyed by the forwarded address behind a proxy."""
+    def vote(forwarded_for):
+        return client.post(f"/s/{one_vote_survey}", data={"option_id": _option_id(one_vote_survey)},
+                           headers={"X-Forwarded-For": forwarded_for},
+                           environ_base={"REMOTE_ADDR": "10.0.0.1"}).status_code
+
+    assert [vote("203.0.113.7"), vote("203.0.113.8"), vote("203.0.113.7")] == [200, 200, 409]
+
+
+def test_repeat_rejected_without_database(client, one_vote_survey):
+    """Test a known repeat is refused from the in-process filter."""
+    _vote(client, one_vote_survey, "a@test.com")
+    with capture_statements(db.engine) as captured:
+        assert _vote(client, one_vote_survey, "a@test.com").status_code == 409
+    assert not [s for s, _ in captured if "survey_responses" in s]
+
+
+@pytest.mark.parametrize("app_config", [{"VOTE_INGEST_MODE": "direct"}, {"VOTE_INGEST_MODE": "flush"}])
+def test_unique_index_backs_a_cold_filter(app, client, one_vote_survey):
+    """Test a worker whose filter missed the vote is stopped by the index."""
+    _vote(client, one_vote_survey, "a@test.com")
+    app.extensions["respondents"] = RespondentIndex(1000, 0.01, 10)
+
+    assert _vote(client, one_vote_survey, "a@test.com").status_code == 409
+    assert SurveyResponse.query.count() == 1
+
+
+@pytest.mark.parametrize("app_config", [{"VOTE_INGEST_MODE": "flush"}])
+def test_buffered_duplicates_not_logged_as_errors(app, client, one_vote_survey, caplog):
+    """Test expected repeats are logged at debug, without the respondent's email."""
+    _vote(client, one_vote_survey, "a@test.com")
+    app.extensions["respondents"] = RespondentIndex(1000, 0.01, 10)
+
+    with caplog.at_level(logging.DEBUG, logger="src.write_behind"):
+        assert _vote(client, one_vote_survey, "a@test.com").status_code == 409
+
+    assert [r.levelno for r in caplog.records if r.name == "src.write_behind"] == [logging.DEBUG]
+    assert "a@test.com" not in caplog.text
+
+
+def test_filter_rebuilt_from_index(app, client, one_vote_survey):
+    """Test startup loading makes earlier votes known to a new worker."""
+    _vote(client, one_vote_survey, "a@test.com")
+    respondent = SurveyResponse.query.one().respondent_hash
+    index = RespondentIndex(1000, 0.01, 10)
+
+    assert index.load() == 1
+    assert index.has_voted(one_vote_survey, respondent)
+    assert not index.has_voted(one_vote_survey + 1, respondent)
+
+
+def test_other_surveys_allow_repeats(client, test_survey):
+    """Test surveys without the setting store no respondent hash."""
+    assert _vote(client, test_survey, "a@test.com").status_code == 200
+    assert _vote(client, test_survey, "a@test.com").status_code == 200
+    assert {r.respondent_hash for r in SurveyResponse.query} == {None}
+
+
+def test_batch_rejects_repeat_respondents(authenticated_client, one_vote_survey):
+    """Test the bulk API drops repeats within a batch and against earlier votes."""
+    option_id = _option_id(one_vote_survey)
+    url = f"/api/surveys/{one_vote_survey}/responses/batch"
+    authenticated_client.post(url, json={"responses": [{"option_id": option_id, "email": "a@test.com"}]})
+
+    body = authenticated_client.post(url, json={"responses": [
+        {"option_id": option_id, "email": "b@test.com"},
+        {"option_id": option_id, "email": "a@test.com"},
+        {"option_id": option_id, "email": "b@test.com"},
+        {"option_id": option_id},
+    ]}).get_json()
+
+    assert (body["accepted"], body["rejected"]) == (2, 2)
+    assert [r["status"] for r in body["results"]] == ["accepted", "rejected", "rejected", "accepted"]
+    assert SurveyResponse.query.count() == 3
+
+
+def test_create_survey_with_setting(authenticated_client):
+    """Test the create form stores the one-vote setting."""
+    authenticated_client.post("/survey/create", data={
+        "title": "Once", "option_1": "A", "option_2": "B", "one_vote_per_respondent": "1"
+    })
+    assert Survey.query.filter_by(title="Once").one().one_vote_per_respondent
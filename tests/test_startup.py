@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for startup: schema version check, timing report and preloading."""
+
+import pytest
+from sqlalchemy import create_engine
+from src import create_app, migrations
+from src.startup import warm_templates
+
+
+def _version(engine):
+    with engine.connect() as connection:
+        return migrations.schema_version(connection)
+
+
+def test_fresh_database_is_stamped_without_migrating(tmp_path, caplog):
+    """Test a new database is created at head without replaying migrations."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'fresh.db'}")
+
+    with caplog.at_level("INFO", logger="src.migrations"):
+        assert migrations.ensure_schema(True, engine) == []
+
+    assert _version(engine) == migrations.HEAD
+    assert not any("Applying migration" in r.getMessage() for r in caplog.records)
+    assert migrations.ensure_schema(False, engine) == []
+    engine.dispose()
+
+
+def test_outdated_schema_requires_migrate(tmp_path):
+    """Test a behind or ahead schema is refused when auto-migrate is off."""
+    engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+    migrations.ensure_schema(True, engine)
+
+    migrations.stamp(engine, migrations.HEAD - 1)
+    with pytest.raises(migrations.SchemaVersionError, match="flask migrate"):
+        migrations.ensure_schema(False, engine)
+    assert migrations.ensure_schema(True, engine) == [migrations.HEAD]
+
+    migrations.stamp(engine, migrations.HEAD + 1)
+    with pytest.raises(migrations.SchemaVersionError, match="newer"):
+        migrations.ensure_schema(True, engine)
+    engine.dispose()
+
+
+def test_app_refuses_outdated_schema(tmp_path, monkeypatch):
+    """Test workers started without auto-migrate fail fast on an old schema."""
+    monkeypatch.setenv("DATABASE_PATH", str(tmp_path / "app.db"))
+    app = create_app()
+    with app.app_context():
+        from src.extensions import db
+        migrations.stamp(db.engine, 1)
+        db.engine.dispose()
+
+    with pytest.raises(migrations.SchemaVersionError):
+        create_app({"SCHEMA_AUTO_MIGRATE": False})
+
+
+def test_startup_report_and_first_request(app, client):
+    """Test the factory phases and first request are timed."""
+    report = app.extensions["startup"]
+    assert {"import_ms", "app_factory_ms", "config_ms", "extensions_ms", "schema_ms"} <= set(report)
+    assert report["first_request_ms"] == {}
+
+    client.get("/login")
+    client.get("/login")
+
+    assert len(report["first_request_ms"]) == 1
+
+
+def test_warm_templates(app):
+    """Test every HTML template is compiled up front."""
+    assert warm_templates(app) == len(app.jinja_env.list_templates(extensions=["html"])) > 0
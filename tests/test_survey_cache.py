@@ -0,0 +1,71 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for cached survey definitions on the public page."""
+
+import pytest
+from src.cache import bump_generation
+from src.extensions import db
+from src.models import Survey, SurveyOption, SurveyResponse
+from src.survey_cache import get_definition
+from tests.capture import capture_selects
+
+NO_RECHECK = {"SURVEY_CACHE_CHECK_INTERVAL_MS": 60000}
+
+
+def test_definition_contents(app, test_survey):
+    """Test a definition holds ordered options and their ids."""
+    definition = get_definition(test_survey)
+    options = SurveyOption.query.filter_by(survey_id=test_survey).order_by(SurveyOption.option_order).all()
+
+    assert definition.title == "Test Survey"
+    assert [o.option_text for o in definition.options] == ["Option 1", "Option 2", "Option 3"]
+    assert definition.option_ids == {o.id for o in options}
+    assert get_definition(9999) is None
+
+
+@pytest.mark.parametrize("app_config", [NO_RECHECK])
+def test_warm_survey_page_skips_database(client, app, test_survey):
+    """Test a cached survey page runs no queries."""
+    client.get(f"/s/{test_survey}")
+
+    with capture_selects(db.engine) as captured:
+        response = client.get(f"/s/{test_survey}")
+
+    assert response.status_code == 200
+    assert captured == []
+
+
+@pytest.mark.parametrize("app_config", [NO_RECHECK])
+def test_toggle_invalidates_cache(authenticated_client, app, test_survey):
+    """Test deactivating a survey is visible immediately."""
+    assert authenticated_client.get(f"/s/{test_survey}").status_code == 200
+
+    authenticated_client.get(f"/survey/{test_survey}/toggle")
+
+    assert authenticated_client.get(f"/s/{test_survey}").status_code == 404
+
+
+def test_other_worker_change_invalidates_cache(client, app, test_survey):
+    """Test a generation bump from another worker clears this worker's cache."""
+    app.config["SURVEY_CACHE_CHECK_INTERVAL_MS"] = 0
+    app.extensions["survey_cache"].check_interval = 0
+    client.get(f"/s/{test_survey}")
+
+    db.session.get(Survey, test_survey).title = "Renamed Survey"
+    bump_generation("surveys")
+    db.session.commit()
+
+    assert b"Renamed Survey" in client.get(f"/s/{test_survey}").data
+
+
+@pytest.mark.parametrize("option_id", ["abc", "-1", "9999"])
+def test_invalid_option_rejected(client, app, test_survey, option_id):
+    """Test votes for options outside the survey are rejected."""
+    response = client.post(f"/s/{test_survey}", data={"option_id": option_id})
+
+    assert response.status_code == 400
+    assert b"Please select a valid option" in response.data
+    assert SurveyResponse.query.count() == 0
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for per-option vote tallies."""
+
+from src.extensions import db
+from src.ingest import insert_votes
+from src.models import Survey, SurveyOption, SurveyOptionTally, SurveyResponse
+from src.tallies import reconcile_tallies, survey_tallies
+
+
+def _options(survey_id):
+    return SurveyOption.query.filter_by(survey_id=survey_id).order_by(SurveyOption.option_order).all()
+
+
+def _counts(survey_id):
+    return [row.vote_count for row in survey_tallies(survey_id)]
+
+
+def test_tallies_start_at_zero(app, test_survey):
+    """Test options without votes report zero."""
+    assert _counts(test_survey) == [0, 0, 0]
+
+
+def test_tallies_follow_inserts(app, test_survey):
+    """Test tallies update in the insert transaction."""
+    first, second, _ = _options(test_survey)
+    db.session.add(SurveyResponse(survey_id=test_survey, option_id=first.id))
+    insert_votes([
+        {"survey_id": test_survey, "option_id": second.id},
+        {"survey_id": test_survey, "option_id": second.id},
+    ])
+    db.session.commit()
+
+    assert _counts(test_survey) == [1, 2, 0]
+
+
+def test_reconcile_rebuilds_counts(app, test_survey):
+    """Test reconcile repairs drifted tallies."""
+    first = _options(test_survey)[0]
+    insert_votes([{"survey_id": test_survey, "option_id": first.id}] * 3)
+    db.session.commit()
+    SurveyOptionTally.query.update({"vote_count": 99})
+    db.session.commit()
+
+    assert reconcile_tallies(test_survey) == 1
+    assert _counts(test_survey) == [3, 0, 0]
+
+
+def test_reconcile_command(app, test_survey):
+    """Test the reconcile-tallies CLI command."""
+    first = _options(test_survey)[0]
+    insert_votes([{"survey_id": test_survey, "option_id": first.id}])
+    db.session.commit()
+    SurveyOptionTally.query.delete()
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["reconcile-tallies"])
+
+    assert "Rebuilt 1 tally rows" in result.output
+    assert _counts(test_survey) == [1, 0, 0]
+
+
+def test_deleting_survey_removes_tallies(app, test_survey):
+    """Test tallies are removed with their options."""
+    first = _options(test_survey)[0]
+    insert_votes([{"survey_id": test_survey, "option_id": first.id}])
+    db.session.commit()
+
+    db.session.delete(db.session.get(Survey, test_survey))
+    db.session.commit()
+
+    assert SurveyOptionTally.query.count() == 0
+
+
+def test_results_page_reads_tallies(authenticated_client, app, test_survey):
+    """Test the results page is served from tallies."""
+    first = _options(test_survey)[0]
+    insert_votes([{"survey_id": test_survey, "option_id": first.id}] * 2)
+    db.session.commit()
+
+    response = authenticated_client.get(f"/survey/{test_survey}/results")
+
+    assert b"2 total responses" in response.data
+    assert b"2 votes" in response.data
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for response rollups and trend series."""
+
+from datetime import datetime, timedelta
+from src.extensions import db
+from src.ingest import insert_votes
+from src.models import SurveyOption, SurveyResponseRollup
+from src.query_plans import explain, full_scans
+from src.trends import rebuild_rollups, trend_series
+from tests.capture import capture_selects
+
+T0 = datetime(2026, 3, 1, 9, 15)
+
+
+def _options(survey_id):
+    return [o.id for o in SurveyOption.query.filter_by(survey_id=survey_id).order_by(SurveyOption.option_order)]
+
+
+def _vote(survey_id, option_id, when):
+    insert_votes([{"survey_id": survey_id, "option_id": option_id, "response_date": when}])
+
+
+def _rollups():
+    rows = SurveyResponseRollup.query.order_by(
+        SurveyResponseRollup.granularity, SurveyResponseRollup.bucket, SurveyResponseRollup.option_id
+    )
+    return [(r.granularity, r.bucket, r.option_id, r.vote_count) for r in rows]
+
+
+def test_trigger_maintains_hourly_and_daily_rollups(app, test_survey):
+    """Test each insert lands in its hour and day bucket."""
+    first, second, _ = _options(test_survey)
+    _vote(test_survey, first, T0)
+    _vote(test_survey, first, T0 + timedelta(minutes=30))
+    _vote(test_survey, second, T0 + timedelta(hours=2))
+    db.session.commit()
+
+    assert _rollups() == [
+        ("day", datetime(2026, 3, 1), first, 2),
+        ("day", datetime(2026, 3, 1), second, 1),
+        ("hour", datetime(2026, 3, 1, 9), first, 2),
+        ("hour", datetime(2026, 3, 1, 11), second, 1),
+    ]
+
+
+def test_rebuild_matches_trigger(app, test_survey):
+    """Test the backfill reproduces what the trigger maintained."""
+    first, second, _ = _options(test_survey)
+    for i in range(5):
+        _vote(test_survey, (first, second)[i % 2], T0 + timedelta(hours=7 * i))
+    db.session.commit()
+    maintained = _rollups()
+
+    db.session.query(SurveyResponseRollup).delete()
+    db.session.commit()
+    assert rebuild_rollups() == len(maintained)
+    assert _rollups() == maintained
+
+
+def test_trend_series_fills_gaps(app, test_survey):
+    """Test a series has one slot per bucket, zero where nothing was recorded."""
+    first, second, third = _options(test_survey)
+    _vote(test_survey, first, T0)
+    _vote(test_survey, second, T0 + timedelta(days=2))
+    db.session.commit()
+
+    series = trend_series(test_survey, "day", datetime(2026, 3, 1), datetime(2026, 3, 4))
+
+    assert series.buckets == [datetime(2026, 3, d) for d in (1, 2, 3)]
+    assert [o["counts"] for o in series.options] == [[1, 0, 0], [0, 0, 1], [0, 0, 0]]
+    assert series.totals == [1, 0, 1]
+    assert len(trend_series(test_survey, "hour", datetime(2026, 1, 1), datetime(2026, 3, 4),
+                            max_buckets=24).buckets) == 24
+
+
+def test_trend_query_uses_rollup_key(app, test_survey):
+    """Test trend reads are a range seek on the rollup primary key."""
+    with capture_selects(db.engine) as captured:
+        trend_series(test_survey, "hour")
+
+    statement, parameters = next(c for c in captured if "survey_response_rollups" in c[0])
+    with db.engine.connect() as connection:
+        assert full_scans(explain(connection, statement, parameters)) == []
+
+
+def test_trend_endpoint_and_results_page(authenticated_client, app, test_survey):
+    """Test the JSON trend endpoint and the results page trend section."""
+    _vote(test_survey, _options(test_survey)[0], datetime.utcnow())
+    db.session.commit()
+
+    body = authenticated_client.get(f"/api/surveys/{test_survey}/trend?granularity=hour").get_json()
+    assert len(body["buckets"]) == 48
+    assert body["totals"][-1] == 1
+    assert authenticated_client.get(f"/api/surveys/{test_survey}/trend?granularity=week").status_code == 400
+    assert authenticated_client.get(f"/api/surveys/{test_survey}/trend?start=soon").status_code == 400
+    assert authenticated_client.get("/api/surveys/9999/trend").status_code == 404
+
+    page = authenticated_client.get(f"/survey/{test_survey}/results")
+    assert b"Responses by day" in page.data
+    assert page.data.count(b'class="trend-row"') == app.config["RESULTS_TREND_DAYS"]
+
+
+def test_backfill_command(app, test_survey):
+    """Test the backfill-rollups CLI command."""
+    _vote(test_survey, _options(test_survey)[0], T0)
+    db.session.commit()
+
+    result = app.test_cli_runner().invoke(args=["backfill-rollups", "--survey-id", str(test_survey)])
+    assert "Rebuilt 2 rollup rows" in result.output
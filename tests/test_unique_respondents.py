@@ -0,0 +1,105 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for HyperLogLog unique respondent estimates."""
+
+from datetime import datetime
+from src.extensions import db
+from src.ingest import insert_votes
+from src.models import SurveyOption, SurveyRespondentSketch
+from src.unique_respondents import (
+    PRECISION, HyperLogLog, exact_respondents, rebuild_sketches, unique_respondents
+)
+from tests.capture import capture_statements
+
+
+def _add_votes(survey_id, emails):
+    option_id = SurveyOption.query.filter_by(survey_id=survey_id).first().id
+    insert_votes([
+        {"survey_id": survey_id, "option_id": option_id, "respondent_email": email,
+         "response_date": datetime(2026, 3, 1)}
+        for email in emails
+    ])
+    db.session.commit()
+
+
+def test_estimate_within_error_bound():
+    """Test the estimate stays within three standard errors and ignores repeats."""
+    sketch = HyperLogLog()
+    for _ in range(2):
+        sketch.update(f"user{i}@example.com" for i in range(20000))
+
+    assert abs(sketch.count() - 20000) / 20000 < 3 * sketch.standard_error
+    assert sketch.standard_error < 0.017
+
+
+def test_small_counts_are_near_exact():
+    """Test linear counting keeps small surveys accurate."""
+    sketch = HyperLogLog()
+    assert sketch.count() == 0
+    sketch.update(f"user{i}@example.com" for i in range(50))
+    assert abs(sketch.count() - 50) <= 1
+
+
+def test_sketch_round_trips_compactly():
+    """Test the stored sketch is smaller than its registers and decodes unchanged."""
+    sketch = HyperLogLog()
+    sketch.update(f"user{i}@example.com" for i in range(1000))
+    data = sketch.to_bytes()
+
+    assert len(data) < 1 << PRECISION
+    assert HyperLogLog.from_bytes(data).registers == sketch.registers
+
+
+def test_insert_votes_updates_sketch(app, test_survey):
+    """Test inserts merge emails into the sketch; anonymous votes are not counted."""
+    _add_votes(test_survey, ["a@example.com", "b@example.com", "a@example.com", None])
+
+    estimate = unique_respondents(test_survey)
+    assert estimate.estimate == exact_respondents(test_survey) == 2
+    assert db.session.get(SurveyRespondentSketch, test_survey) is not None
+
+
+def test_results_read_one_row(app, test_survey):
+    """Test the estimate is a single primary-key read, not a scan of responses."""
+    _add_votes(test_survey, [f"user{i}@example.com" for i in range(30)])
+    with capture_statements(db.engine) as captured:
+        assert abs(unique_respondents(test_survey).estimate - 30) <= 1
+
+    assert len(captured) == 1 and "survey_responses " not in captured[0][0]
+
+
+def test_rebuild_matches_maintained_sketch(app, test_survey):
+    """Test rebuilding from survey_responses gives the incrementally built sketch."""
+    _add_votes(test_survey, [f"user{i}@example.com" for i in range(200)])
+    maintained = db.session.get(SurveyRespondentSketch, test_survey).registers
+    db.session.expire_all()
+
+    assert rebuild_sketches(survey_id=test_survey) == 1
+    assert db.session.get(SurveyRespondentSketch, test_survey).registers == maintained
+
+
+def test_results_page_shows_unique_respondents(authenticated_client, test_survey):
+    """Test the results page shows the estimate next to the total."""
+    _add_votes(test_survey, ["a@example.com", "b@example.com", "b@example.com"])
+    response = authenticated_client.get(f"/survey/{test_survey}/results")
+
+    assert b"About 2 unique respondents" in response.data
+    assert b"&plusmn;1.6%" in response.data
+
+
+def test_recount_command(app, test_survey):
+    """Test recount-respondents reports estimate, exact count and error."""
+    _add_votes(test_survey, ["a@example.com", "b@example.com"])
+    db.session.query(SurveyRespondentSketch).delete()
+    db.session.commit()
+    runner = app.test_cli_runner()
+
+    result = runner.invoke(args=["recount-respondents"])
+    assert f"Survey {test_survey}: estimate 0, exact 2" in result.output
+
+    result = runner.invoke(args=["recount-respondents", "--survey-id", str(test_survey), "--rebuild"])
+    assert "Rebuilt 1 sketches" in result.output
+    assert f"Survey {test_survey}: estimate 2, exact 2, error +0.00%" in result.output
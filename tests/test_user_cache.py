@@ -0,0 +1,73 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the cached Flask-Login user loader."""
+
+import pytest
+from src.cache import current_generation
+from src.extensions import db
+from src.models import User
+from src.user_cache import GENERATION, CachedUser, load_user
+from tests.capture import capture_selects
+
+NO_RECHECK = {"USER_CACHE_CHECK_INTERVAL_MS": 60000, "SURVEY_CACHE_CHECK_INTERVAL_MS": 60000}
+
+
+def _user_selects(captured):
+    return [statement for statement, _ in captured if "FROM users" in statement]
+
+
+def test_loader_returns_lightweight_user(app, test_user):
+    """Test the loader returns id and email without the password hash."""
+    user = load_user(str(test_user))
+
+    assert isinstance(user, CachedUser)
+    assert user.get_id() == str(test_user)
+    assert user.email == "test@example.com"
+    assert not hasattr(user, "password_hash")
+    assert load_user("9999") is None
+
+
+@pytest.mark.parametrize("app_config", [NO_RECHECK])
+def test_warm_requests_skip_users_table(authenticated_client, app, test_survey):
+    """Test authenticated requests do not query users once the cache is warm."""
+    authenticated_client.get("/dashboard")
+
+    with capture_selects(db.engine) as captured:
+        assert authenticated_client.get("/dashboard").status_code == 200
+        assert authenticated_client.get(f"/survey/{test_survey}/results").status_code == 200
+
+    assert _user_selects(captured) == []
+
+
+def test_email_change_invalidates(app, test_user):
+    """Test changing the email bumps the generation and evicts the entry."""
+    load_user(str(test_user))
+    before = current_generation(GENERATION)
+
+    db.session.get(User, test_user).email = "new@example.com"
+    db.session.commit()
+
+    assert current_generation(GENERATION) == before + 1
+    assert load_user(str(test_user)).email == "new@example.com"
+
+
+def test_unrelated_update_keeps_cache(app, test_user):
+    """Test last_login style updates do not invalidate cached users."""
+    before = current_generation(GENERATION)
+    db.session.get(User, test_user).password_hash = "changed"
+    db.session.commit()
+
+    assert current_generation(GENERATION) == before
+
+
+def test_deleted_user_is_evicted(app, test_user):
+    """Test deleting a user stops the cached entry from authenticating."""
+    load_user(str(test_user))
+
+    db.session.delete(db.session.get(User, test_user))
+    db.session.commit()
+
+    assert load_user(str(test_user)) is None
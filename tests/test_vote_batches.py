@@ -0,0 +1,118 @@
+# SPDX-License-Identifier: Apache-2.0
+# Copyright (2026) Beachgeek.co.uk
+# Author: Ricardo Sueiras
+# Apache 2.0 license
+
+"""Tests for the bulk vote submission API."""
+
+from datetime import datetime
+import pytest
+from src import respondents
+from src.extensions import db
+from src.models import Survey, SurveyOption, SurveyResponse
+from src.tallies import survey_tallies
+from tests.capture import capture_statements
+
+
+def _url(survey_id):
+    return f"/api/surveys/{survey_id}/responses/batch"
+
+
+def _option_ids(survey_id):
+    return [o.id for o in SurveyOption.query.filter_by(survey_id=survey_id).order_by(SurveyOption.option_order)]
+
+
+def test_batch_inserts_and_reports_per_record(authenticated_client, app, test_survey):
+    """Test valid records are stored and invalid ones rejected individually."""
+    first, second, _ = _option_ids(test_survey)
+    response = authenticated_client.post(_url(test_survey), json={"responses": [
+        {"option_id": first, "email": "a@test.com", "response_date": "2026-03-01T10:00:00Z"},
+        {"option_id": 9999},
+        {"option_id": "2"},
+        {"option_id": second, "response_date": "2999-01-01T00:00:00"},
+        {"option_id": second, "colour": "blue"},
+        {"option_id": second},
+    ]})
+
+    body = response.get_json()
+    assert response.status_code == 200
+    assert (body["accepted"], body["rejected"]) == (2, 4)
+    assert [r["status"] for r in body["results"]] == [
+        "accepted", "rejected", "rejected", "rejected", "rejected", "accepted"
+    ]
+    assert body["results"][1]["error"].startswith("option_id")
+    stored = SurveyResponse.query.filter_by(survey_id=test_survey).order_by(SurveyResponse.id).all()
+    assert stored[0].response_date == datetime(2026, 3, 1, 10, 0)
+    assert stored[0].respondent_email == "a@test.com"
+    assert [t.vote_count for t in survey_tallies(test_survey)] == [1, 1, 0]
+
+
+@pytest.mark.parametrize("app_config", [{"VOTE_BATCH_CHUNK_SIZE": 100}])
+def test_large_batch_is_chunked(authenticated_client, app, test_survey):
+    """Test thousands of records insert in one executemany per chunk."""
+    option_id = _option_ids(test_survey)[0]
+    with capture_statements(db.engine, "INSERT INTO survey_responses") as captured:
+        response = authenticated_client.post(_url(test_survey), json={
+            "responses": [{"option_id": option_id}] * 1050
+        })
+
+    assert response.get_json()["accepted"] == 1050
+    assert [len(parameters) for _, parameters in captured] == [100] * 10 + [50]
+
+
+def test_idempotency_key_prevents_double_insert(authenticated_client, app, test_survey):
+    """Test a retried batch returns the original summary without inserting."""
+    payload = {"responses": [{"option_id": _option_ids(test_survey)[0]}] * 3}
+    headers = {"Idempotency-Key": "kiosk-7-batch-42"}
+
+    first = authenticated_client.post(_url(test_survey), json=payload, headers=headers)
+    retry = authenticated_client.post(_url(test_survey), json=payload, headers=headers)
+
+    assert retry.get_json() == first.get_json()
+    assert retry.headers["Idempotent-Replayed"] == "true"
+    assert "Idempotent-Replayed" not in first.headers
+    assert SurveyResponse.query.filter_by(survey_id=test_survey).count() == 3
+
+
+def test_batch_requires_owner_and_json(client, authenticated_client, app, test_survey):
+    """Test the endpoint rejects anonymous, non-JSON, oversized and foreign requests."""
+    assert authenticated_client.post(_url(test_survey), data={"option_id": 1}).status_code == 415
+    assert authenticated_client.post(_url(test_survey), json=[]).status_code == 400
+    assert authenticated_client.post(_url(9999), json={"responses": []}).status_code == 404
+    app.config["VOTE_BATCH_MAX_RECORDS"] = 2
+    assert authenticated_client.post(_url(test_survey), json={"responses": [{}] * 3}).status_code == 413
+
+    authenticated_client.get("/logout")
+    assert client.post(_url(test_survey), json={"responses": []}).status_code == 401
+
+
+@pytest.mark.parametrize("stale_checks, status", [(1, 200), (2, 409)])
+def test_concurrent_duplicate_respondent(authenticated_client, app, test_survey, monkeypatch,
+                                         stale_checks, status):
+    """Test a respondent whose vote lands between the check and the insert is rejected, not a 500."""
+    db.session.get(Survey, test_survey).one_vote_per_respondent = True
+    db.session.commit()
+    option_id = _option_ids(test_survey)[0]
+    authenticated_client.post(_url(test_survey), json={"responses": [{"option_id": option_id, "email": "a@test.com"}]})
+
+    lookup = respondents.existing_respondents
+    misses = iter(range(stale_checks))
+
+    def stale_lookup(*args):
+        # The first stale_checks lookups miss the vote, as if it had not committed yet.
+        return set() if next(misses, None) is not None else lookup(*args)
+
+    monkeypatch.setattr(respondents, "existing_respondents", stale_lookup)
+    response = authenticated_client.post(_url(test_survey), json={"responses": [
+        {"option_id": option_id, "email": "b@test.com"},
+        {"option_id": option_id, "email": "a@test.com"},
+    ]})
+
+    assert response.status_code == status
+    if status == 200:
+        body = response.get_json()
+        assert (body["accepted"], body["rejected"]) == (1, 1)
+        assert body["results"][1]["error"] == "email: already responded to this survey"
+        assert SurveyResponse.query.count() == 2
+    else:
+        assert SurveyResponse.query.count() == 1